@@ -11,9 +11,12 @@ import shutil
 import socket
 import subprocess
 import sys
-from typing import Any, List, Mapping, Tuple, Union
+import time
+import traceback
+from typing import Any, Iterator, List, Mapping, Tuple, Union
 import uuid
 from citylearn.agents.base import Agent as CityLearnAgent
+from citylearn.benchmark import run_benchmark
 from citylearn.citylearn import CityLearnEnv
 from citylearn.data import DataSet, get_settings
 from citylearn.__init__ import __version__
@@ -65,6 +68,102 @@ def run_work_order(work_order_filepath, max_workers=None, start_index=None, end_
             except Exception as e:
                 print(e)
 
+_SWEEP_DATA_CACHE = None
+_SWEEP_DATA_CACHE_SIZE = 2
+
+def run_sweep(work_order_filepath, max_workers=None, start_index=None, end_index=None, results_filepath=None):
+    work_order_filepath = Path(work_order_filepath)
+
+    with open(work_order_filepath, mode='r') as f:
+        configs = json.load(f)
+
+    start_index = 0 if start_index is None else start_index
+    end_index = len(configs) - 1 if end_index is None else end_index
+    assert start_index <= end_index, 'start_index must be <= end_index'
+    assert start_index < len(configs), 'start_index must be < number of jobs'
+    configs = configs[start_index:end_index + 1]
+    results = []
+    print(f'Pooling {len(configs)} jobs to run in parallel...')
+
+    for result in Simulator.sweep(configs, max_workers=max_workers):
+        print(json.dumps(result, default=str))
+        results.append(result)
+
+    if results_filepath is not None:
+        write_json(results_filepath, sorted(results, key=lambda x: x['index']))
+    
+    else:
+        pass
+
+def _initialize_sweep_worker(modules: List[str]):
+    """Import `modules` once per worker process and set the worker's data caches that are shared by its jobs."""
+
+    global _SWEEP_DATA_CACHE
+    _SWEEP_DATA_CACHE = {}
+
+    for module in modules:
+        try:
+            importlib.import_module(module)
+
+        except (ImportError, ModuleNotFoundError):
+            pass
+
+def _get_sweep_data_cache(schema: Union[str, Path, Mapping[str, Any]]) -> Mapping[Any, Any]:
+    """Returns the worker's data cache for `schema` and evicts the least recently used schema's data cache once more 
+    than `_SWEEP_DATA_CACHE_SIZE` schemas are cached so that memory does not grow with the number of schemas in a sweep."""
+
+    key = str(schema) if isinstance(schema, (str, Path)) else json.dumps(schema, sort_keys=True, default=str)
+    data_cache = _SWEEP_DATA_CACHE.pop(key, {})
+    _SWEEP_DATA_CACHE[key] = data_cache
+
+    while len(_SWEEP_DATA_CACHE) > _SWEEP_DATA_CACHE_SIZE:
+        del _SWEEP_DATA_CACHE[next(iter(_SWEEP_DATA_CACHE))]
+
+    return data_cache
+
+def _run_sweep_job(index: int, config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Run a `train` or `evaluate` :py:class:`Simulator` job in a sweep worker and return its status."""
+
+    config = {**config}
+    command = config.pop('command', 'train')
+    assert command in ['train', 'evaluate'], f'Unknown sweep command: {command}. Valid commands are train and evaluate.'
+    config['simulation_id'] = f'citylearn-simulation-{uuid.uuid4().hex}' if config.get('simulation_id') is None else config['simulation_id']
+    config['env_kwargs'] = {} if config.get('env_kwargs') is None else {**config['env_kwargs']}
+
+    if _SWEEP_DATA_CACHE is not None:
+        config['env_kwargs']['data_cache'] = _get_sweep_data_cache(config.get('schema'))
+    
+    else:
+        pass
+
+    result = {
+        'index': index,
+        'command': command,
+        'simulation_id': config['simulation_id'],
+        'pid': os.getpid(),
+        'error': None,
+        'output_directory': None,
+        'filepaths': [],
+    }
+    start_time = time.perf_counter()
+
+    try:
+        getattr(Simulator, command)(**config)
+    
+    except Exception:
+        result['error'] = traceback.format_exc()
+
+    result['duration'] = time.perf_counter() - start_time
+    output_directory = os.path.join('citylearn_simulations', config['simulation_id'])\
+        if config.get('output_directory') is None else str(config['output_directory'])
+    result['output_directory'] = output_directory
+    result['filepaths'] = [
+        f for f in [os.path.join(output_directory, f'{config["simulation_id"]}-{s}.json') for s in ['train', 'evaluation']] 
+        if os.path.isfile(f)
+    ]
+
+    return result
+
 class Simulator:
     def __init__(self, schema: str, agent_name: str = None, env_kwargs: Mapping[str, Any] = None, agent_kwargs: Mapping[str, Any] = None, wrappers: List[str] = None,
      time_series_variables: List[str] = None, simulation_id: str = None, output_directory: Union[Path, str] = None, agent_filepath: Union[Path, str] = None,
@@ -296,7 +395,7 @@ class Simulator:
             filepath = os.path.join(self.output_directory, f'{self.simulation_id}-agent')
             self.agent.save(filepath)
 
-    def __set_agent(self) -> Union[CityLearnAgent, StableBaselines3Agent]:
+    def __set_agent(self) -> Union[CityLearnAgent, 'StableBaselines3Agent']:
         if self.agent_filepath is None:
             agent = self.env.unwrapped.load_agent(
                 agent=self.agent_name, 
@@ -379,6 +478,50 @@ class Simulator:
         else:
             pass
 
+    @classmethod
+    def sweep(cls, configs: List[Mapping[str, Any]], max_workers: int = None, preload_modules: List[str] = None) -> Iterator[Mapping[str, Any]]:
+        r"""Run many :meth:`train` and :meth:`evaluate` jobs in a persistent worker pool and yield their status as they finish.
+
+        Each worker process imports the agent and wrapper modules used by the jobs once when it starts and shares
+        a data cache among the jobs it runs on the same schema so that data files of a schema are read once per worker. 
+        Data caches of the least recently used schemas are evicted so a worker keeps at most two.
+
+        Parameters
+        ----------
+        configs: List[Mapping[str, Any]]
+            Job configurations. Each configuration is a mapping of :meth:`train` or :meth:`evaluate` keyword arguments
+            with an extra `command` key that is either 'train' (default) or 'evaluate'.
+        max_workers: int, optional
+            Maximum number of jobs to run at a time. Defaults to the number of CPUs.
+        preload_modules: List[str], optional
+            Modules to import in each worker. Defaults to the modules of the agents and wrappers in `configs`.
+
+        Yields
+        ------
+        result: Mapping[str, Any]
+            Job `index` in `configs`, `command`, `simulation_id`, worker `pid`, `duration` in seconds, formatted
+            traceback `error` if the job failed, `output_directory` and `filepaths` of the `-train.json` and 
+            `-evaluation.json` summaries the job wrote.
+        """
+
+        max_workers = cpu_count() if max_workers is None else max_workers
+
+        if preload_modules is None:
+            names = [c.get('agent_name', 'citylearn.agents.base.BaselineAgent') for c in configs]
+            names += [w for c in configs for w in (c.get('wrappers') or [])]
+            preload_modules = sorted(set(['citylearn.agents.base'] + ['.'.join(n.split('.')[0:-1]) for n in names if n is not None]))
+        
+        else:
+            pass
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_initialize_sweep_worker, initargs=(preload_modules,)
+        ) as executor:
+            futures = [executor.submit(_run_sweep_job, i, c) for i, c in enumerate(configs)]
+
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+
     @staticmethod
     def get_default_time_series_variables():
         return get_settings()['default_time_series_variables']
@@ -413,6 +556,43 @@ def main():
         'The default is to execute till the last line.'))
     subparser_run_work_order.set_defaults(func=run_work_order)
 
+    # run many simulations in parallel in persistent worker processes
+    subparser_run_sweep = subparsers.add_parser(
+        'run_sweep', 
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter, 
+        help=(
+            'Run many `citylearn simulate` train and evaluate jobs in parallel in persistent worker processes that '
+            'import modules and read data files once instead of starting a new process per job.')
+    )
+    subparser_run_sweep.add_argument('work_order_filepath', type=Path, help=(
+        'Filepath to JSON list of job configurations. Each configuration is an object of `Simulator.train` or '
+        '`Simulator.evaluate` keyword arguments with a `command` key that is either train or evaluate.'))
+    subparser_run_sweep.add_argument('-w', '--max_workers', dest='max_workers', type=int, help=(
+        'Maximum number of jobs to run at a time. Default is the number of CPUs.'))
+    subparser_run_sweep.add_argument('-is', '--start_index', default=0, dest='start_index', type=int, help=(
+        'Index of first job to run. The default is to run from the first job.'))
+    subparser_run_sweep.add_argument('-ie', '--end_index', dest='end_index', type=int, help=(
+        'Index of last job to run. The default is to run till the last job.'))
+    subparser_run_sweep.add_argument('-o', '--results_filepath', dest='results_filepath', type=Path, help=(
+        'Filepath to save JSON list of job statuses to.'))
+    subparser_run_sweep.set_defaults(func=run_sweep)
+
+    # benchmark environment performance
+    subparser_benchmark = subparsers.add_parser(
+        'benchmark', 
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter, 
+        help=(
+            'Measure environment construction and reset time, steps per second for random, rule-based and baseline policies, '
+            'evaluation time and peak memory on data sets and save the results to a JSON file.')
+    )
+    subparser_benchmark.add_argument('-s', '--schemas', dest='schemas', type=str, nargs='+', help=(
+        'Names of CityLearn datasets or filepaths to schemas to benchmark. The default is to benchmark all datasets.'))
+    subparser_benchmark.add_argument('-t', '--time_steps', dest='time_steps', type=int, help=(
+        'Number of time steps in each benchmark episode. The default is the schema simulation period.'))
+    subparser_benchmark.add_argument('-o', '--output_filepath', dest='output_filepath', default='citylearn_benchmark.json', type=str, help=(
+        'Filepath to save JSON benchmark results to.'))
+    subparser_benchmark.set_defaults(func=run_benchmark)
+
     # get names of datasets
     subparser_datasets = subparsers.add_parser(
         'list_datasets', 
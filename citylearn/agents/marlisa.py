@@ -6,7 +6,7 @@ from citylearn.agents.sac import SACRBC
 from citylearn.citylearn import CityLearnEnv
 
 try:
-    from sklearn.decomposition import PCA
+    from sklearn.decomposition import IncrementalPCA, PCA
     from sklearn.linear_model import LinearRegression
 except (ModuleNotFoundError, ImportError) as e:
     raise Exception("This functionality requires you to install scikit-learn. You can install scikit-learn by : pip scikit-learn, or for more detailed instructions please visit https://scikit-learn.org/stable/install.html.")
@@ -18,17 +18,19 @@ except (ModuleNotFoundError, ImportError) as e:
 
 from citylearn.agents.sac import SAC
 from citylearn.preprocessing import Encoder, NoNormalization, PeriodicNormalization, RemoveFeature
-from citylearn.rl import RegressionBuffer
+from citylearn.rl import IncrementalLinearRegression, RegressionBuffer
 
 class MARLISA(SAC):
     __COORDINATION_VARIABLE_COUNT = 2
 
     def __init__(
         self, *args, regression_buffer_capacity: int = None, start_regression_time_step: int = None, 
-        regression_frequency: int = None, information_sharing: bool = None, pca_compression: float = None, iterations: int = None, **kwargs
+        regression_frequency: int = None, information_sharing: bool = None, pca_compression: float = None, iterations: int = None, 
+        incremental: bool = None, **kwargs
     ):
         self.__coordination_variables_history = None
         self.information_sharing = information_sharing
+        self.incremental = incremental
 
         super().__init__(*args, **kwargs)
 
@@ -40,7 +42,7 @@ class MARLISA(SAC):
 
         # internally defined
         self.regression_buffer = [RegressionBuffer(int(self.regression_buffer_capacity)) for _ in self.action_space]
-        self.state_estimator = [LinearRegression() for _ in self.action_space]
+        self.state_estimator = [IncrementalLinearRegression() if self.incremental else LinearRegression() for _ in self.action_space]
         self.pca = [None for _ in self.action_space]
         self.pca_flag = [False for _ in self.action_dimension]
         self.regression_flag = [0 for _ in self.action_dimension]
@@ -66,6 +68,17 @@ class MARLISA(SAC):
     def information_sharing(self) -> bool:
         return self.__information_sharing
 
+    @property
+    def incremental(self) -> bool:
+        """Whether `state_estimator` is updated with every regression sample over the `regression_buffer` window 
+        instead of refitted on the whole buffer every `regression_frequency` time steps, and `pca` is an `IncrementalPCA`.
+
+        `pca` is still fitted once, when exploration ends, because the observation normalization it is fitted on is only 
+        known then and the replay buffer is transformed with that fit. `IncrementalPCA` fits the buffer in batches 
+        to bound memory use."""
+
+        return self.__incremental
+
     @property
     def pca_compression(self) -> float:
         return self.__pca_compression
@@ -83,6 +96,11 @@ class MARLISA(SAC):
         hidden_dimension = [400, 300] if hidden_dimension is None else hidden_dimension
         SAC.hidden_dimension.fset(self, hidden_dimension)
 
+    @SAC.grouped.setter
+    def grouped(self, grouped: bool):
+        assert not grouped, 'MARLISA does not support grouped networks.'
+        SAC.grouped.fset(self, grouped)
+
     @SAC.batch_size.setter
     def batch_size(self, batch_size: int):
         batch_size = 100 if batch_size is None else batch_size
@@ -107,6 +125,10 @@ class MARLISA(SAC):
     def information_sharing(self, information_sharing: bool):
         self.__information_sharing = True if information_sharing is None else information_sharing
 
+    @incremental.setter
+    def incremental(self, incremental: bool):
+        self.__incremental = False if incremental is None else incremental
+
     @pca_compression.setter
     def pca_compression(self, pca_compression: float):
         self.__pca_compression = 1.0 if pca_compression is None else pca_compression
@@ -143,6 +165,21 @@ class MARLISA(SAC):
                 variables = np.hstack(np.concatenate((self.get_encoded_regression_variables(i, o), a)))
                 # The targets are the net electricity consumption.
                 target = self.get_encoded_regression_targets(i, n)
+
+                if self.incremental:
+                    buffer = self.regression_buffer[i]
+
+                    if len(buffer) == buffer.capacity:
+                        self.state_estimator[i].forget(buffer.x[buffer.position:buffer.position + 1], buffer.y[buffer.position:buffer.position + 1])
+                    
+                    else:
+                        pass
+
+                    self.state_estimator[i].partial_fit(variables.reshape(1, -1), [target])
+
+                else:
+                    pass
+
                 self.regression_buffer[i].push(variables, target)
             
             else:
@@ -177,7 +214,7 @@ class MARLISA(SAC):
 
             if self.time_step >= self.start_regression_time_step\
                 and (self.regression_flag[i] < 2 or self.time_step%self.regression_frequency == 0):
-                if self.information_sharing:
+                if self.information_sharing and not self.incremental:
                     self.state_estimator[i].fit(self.regression_buffer[i].x, self.regression_buffer[i].y)
                 
                 else:
@@ -196,24 +233,21 @@ class MARLISA(SAC):
                 # This code only runs once. Once the random exploration phase is over, we normalize all the states and rewards to make them have mean=0 and std=1, and apply PCA. We push the normalized compressed values back into the buffer, replacing the old buffer.
                 if not self.pca_flag[i]:
                     # calculate normalized observations and rewards
-                    X = np.array([j[0] for j in self.replay_buffer[i].buffer], dtype=float)
+                    X = np.array(self.replay_buffer[i].state, dtype=float)
                     self.norm_mean[i] = np.nanmean(X, axis=0)
                     self.norm_std[i] = np.nanstd(X, axis=0) + 1e-5
                     X = self.get_normalized_observations(i, X)
                     self.pca[i].fit(X)
 
-                    R = np.array([j[2] for j in self.replay_buffer[i].buffer], dtype=float)
+                    R = np.array(self.replay_buffer[i].reward, dtype=float)
                     self.r_norm_mean[i] = np.nanmean(R, dtype=float)
                     self.r_norm_std[i] = np.nanstd(R, dtype=float)/self.reward_scaling + 1e-5
 
                     # update buffer with normalization
-                    self.replay_buffer[i].buffer = [(
-                        np.hstack(self.pca[i].transform(self.get_normalized_observations(i, o).reshape(1,-1))[0]),
-                        a,
-                        self.get_normalized_reward(i, r),
-                        np.hstack(self.pca[i].transform(self.get_normalized_observations(i, n).reshape(1,-1))[0]),
-                        d
-                    ) for o, a, r, n, d in self.replay_buffer[i].buffer]
+                    self.replay_buffer[i].transform(
+                        state_function=lambda x: self.pca[i].transform(self.get_normalized_observations(i, x)),
+                        reward_function=lambda x: self.get_normalized_reward(i, x),
+                    )
                     self.pca_flag[i] = True
                     self.normalized[i] = True
                 
@@ -221,13 +255,7 @@ class MARLISA(SAC):
                     pass
 
                 for _ in range(self.update_per_time_step):
-                    o, a, r, n, d = self.replay_buffer[i].sample(self.batch_size)
-                    tensor = torch.cuda.FloatTensor if self.device.type == 'cuda' else torch.FloatTensor
-                    o = tensor(o).to(self.device)
-                    n = tensor(n).to(self.device)
-                    a = tensor(a).to(self.device)
-                    r = tensor(r).unsqueeze(1).to(self.device)
-                    d = tensor(d).unsqueeze(1).to(self.device)
+                    o, a, r, n, d = self.replay_buffer[i].sample_tensors(self.batch_size, self.device)
 
                     with torch.no_grad():
                         # Update Q-values. First, sample an action from the Gaussian policy/distribution for the current (next) observation and its associated log probability of occurrence.
@@ -399,7 +427,7 @@ class MARLISA(SAC):
         
         for i, s in enumerate(self.observation_space):
             n_components = int((self.pca_compression)*(addition + len(self.get_encoded_observations(i, s.low))))
-            self.pca[i] = PCA(n_components=n_components)
+            self.pca[i] = IncrementalPCA(n_components=n_components) if self.incremental else PCA(n_components=n_components)
 
     def set_energy_coefficients(self):
         self.energy_size_coefficient = []
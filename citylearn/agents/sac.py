@@ -13,16 +13,21 @@ from citylearn.agents.rbc import RBC
 from citylearn.agents.rlc import RLC
 from citylearn.citylearn import CityLearnEnv
 from citylearn.preprocessing import Encoder, RemoveFeature
-from citylearn.rl import PolicyNetwork, ReplayBuffer, SoftQNetwork
+from citylearn.rl import GroupedPolicyNetwork, GroupedSoftQNetwork, PolicyNetwork, ReplayBuffer, SoftQNetwork
 
 class SAC(RLC):
-    def __init__(self, env: CityLearnEnv, **kwargs: Any):
+    def __init__(self, env: CityLearnEnv, grouped: bool = None, **kwargs: Any):
         r"""Custom soft actor-critic algorithm.
 
         Parameters
         ----------
         env: CityLearnEnv
             CityLearn environment.
+        grouped: bool, default: False
+            Whether to fuse the networks of all buildings into modules with stacked parameters so that predictions, 
+            backward passes and optimizer steps run for all buildings at once. The networks of all buildings must have 
+            the same observation and action dimensions. In grouped mode, `policy_net`, `soft_q_net1`, `soft_q_net2`, 
+            `target_soft_q_net1`, `target_soft_q_net2` and their optimizers are single objects instead of lists.
         
         Other Parameters
         ----------------
@@ -30,13 +35,17 @@ class SAC(RLC):
             Other keyword arguments used to initialize super class.
         """
 
+        self.grouped = grouped
         super().__init__(env, **kwargs)
 
         # internally defined
         self.normalized = [False for _ in self.action_space]
         self.soft_q_criterion = nn.SmoothL1Loss()
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        self.replay_buffer = [ReplayBuffer(int(self.replay_buffer_capacity)) for _ in self.action_space]
+        self.replay_buffer = [
+            ReplayBuffer(int(self.replay_buffer_capacity), random_seed=self.random_seed + i, pin_memory=self.device.type == 'cuda') 
+            for i, _ in enumerate(self.action_space)
+        ]
         self.soft_q_net1 = [None for _ in self.action_space]
         self.soft_q_net2 = [None for _ in self.action_space]
         self.target_soft_q_net1 = [None for _ in self.action_space]
@@ -52,6 +61,16 @@ class SAC(RLC):
         self.r_norm_std = [None for _ in self.action_space]
         self.set_networks()
 
+    @property
+    def grouped(self) -> bool:
+        """Whether the networks of all buildings are fused into modules with stacked parameters."""
+
+        return self.__grouped
+    
+    @grouped.setter
+    def grouped(self, grouped: bool):
+        self.__grouped = False if grouped is None else grouped
+
     def update(self, observations: List[List[float]], actions: List[List[float]], reward: List[float], next_observations: List[List[float]], terminated: bool, truncated: bool):
         r"""Update replay buffer.
 
@@ -90,79 +109,103 @@ class SAC(RLC):
             if self.time_step >= self.standardize_start_time_step and self.batch_size <= len(self.replay_buffer[i]):
                 if not self.normalized[i]:
                     # calculate normalized observations and rewards
-                    X = np.array([j[0] for j in self.replay_buffer[i].buffer], dtype = float)
+                    X = np.array(self.replay_buffer[i].state, dtype = float)
                     self.norm_mean[i] = np.nanmean(X, axis=0)
                     self.norm_std[i] = np.nanstd(X, axis=0) + 1e-5
-                    R = np.array([j[2] for j in self.replay_buffer[i].buffer], dtype = float)
+                    R = np.array(self.replay_buffer[i].reward, dtype = float)
                     self.r_norm_mean[i] = np.nanmean(R, dtype = float)
                     self.r_norm_std[i] = np.nanstd(R, dtype = float)/self.reward_scaling + 1e-5
                     
                     # update buffer with normalization
-                    self.replay_buffer[i].buffer = [(
-                        np.hstack(self.get_normalized_observations(i, o).reshape(1,-1)[0]),
-                        a,
-                        self.get_normalized_reward(i, r),
-                        np.hstack(self.get_normalized_observations(i, n).reshape(1,-1)[0]),
-                        d
-                    ) for o, a, r, n, d in self.replay_buffer[i].buffer]
+                    self.replay_buffer[i].transform(
+                        state_function=lambda x: self.get_normalized_observations(i, x),
+                        reward_function=lambda x: self.get_normalized_reward(i, x),
+                    )
                     self.normalized[i] = True
                 
                 else:
                     pass
 
-                for _ in range(self.update_per_time_step):
-                    o, a, r, n, d = self.replay_buffer[i].sample(self.batch_size)
-                    tensor = torch.cuda.FloatTensor if self.device.type == 'cuda' else torch.FloatTensor
-                    o = tensor(o).to(self.device)
-                    n = tensor(n).to(self.device)
-                    a = tensor(a).to(self.device)
-                    r = tensor(r).unsqueeze(1).to(self.device)
-                    d = tensor(d).unsqueeze(1).to(self.device)
-
-                    with torch.no_grad():
-                        # Update Q-values. First, sample an action from the Gaussian policy/distribution for the current (next) observation and its associated log probability of occurrence.
-                        new_next_actions, new_log_pi, _ = self.policy_net[i].sample(n)
-
-                        # The updated Q-value is found by subtracting the logprob of the sampled action (proportional to the entropy) to the Q-values estimated by the target networks.
-                        target_q_values = torch.min(
-                            self.target_soft_q_net1[i](n, new_next_actions),
-                            self.target_soft_q_net2[i](n, new_next_actions),
-                        ) - self.alpha*new_log_pi
-                        q_target = r + (1 - d)*self.discount*target_q_values
-
-                    # Update Soft Q-Networks
-                    q1_pred = self.soft_q_net1[i](o, a)
-                    q2_pred = self.soft_q_net2[i](o, a)
-                    q1_loss = self.soft_q_criterion(q1_pred, q_target)
-                    q2_loss = self.soft_q_criterion(q2_pred, q_target)
-                    self.soft_q_optimizer1[i].zero_grad()
-                    q1_loss.backward()
-                    self.soft_q_optimizer1[i].step()
-                    self.soft_q_optimizer2[i].zero_grad()
-                    q2_loss.backward()
-                    self.soft_q_optimizer2[i].step()
-
-                    # Update Policy
-                    new_actions, log_pi, _ = self.policy_net[i].sample(o)
-                    q_new_actions = torch.min(
-                        self.soft_q_net1[i](o, new_actions),
-                        self.soft_q_net2[i](o, new_actions)
-                    )
-                    policy_loss = (self.alpha*log_pi - q_new_actions).mean()
-                    self.policy_optimizer[i].zero_grad()
-                    policy_loss.backward()
-                    self.policy_optimizer[i].step()
-
-                    # Soft Updates
-                    for target_param, param in zip(self.target_soft_q_net1[i].parameters(), self.soft_q_net1[i].parameters()):
-                        target_param.data.copy_(target_param.data*(1.0 - self.tau) + param.data*self.tau)
-
-                    for target_param, param in zip(self.target_soft_q_net2[i].parameters(), self.soft_q_net2[i].parameters()):
-                        target_param.data.copy_(target_param.data*(1.0 - self.tau) + param.data*self.tau)
+                if not self.grouped:
+                    for _ in range(self.update_per_time_step):
+                        self.update_networks(i, self.replay_buffer[i].sample_tensors(self.batch_size, self.device))
+                
+                else:
+                    pass
 
             else:
                 pass
 
+        if self.grouped and self.time_step >= self.standardize_start_time_step \
+            and all(self.batch_size <= len(b) for b in self.replay_buffer):
+            for _ in range(self.update_per_time_step):
+                batch = [b.sample_tensors(self.batch_size, self.device) for b in self.replay_buffer]
+                self.update_networks(None, [torch.stack(v) for v in zip(*batch)])
+        
+        else:
+            pass
+
+    def update_networks(self, index: int, batch: List[torch.Tensor]):
+        r"""Run one soft actor-critic update step.
+
+        Parameters
+        ----------
+        index: int
+            Building index of the networks to update or `None` to update the fused networks of all buildings 
+            in :py:attr:`grouped` mode.
+        batch: List[torch.Tensor]
+            Observations, actions, rewards, next observations and done flags sampled from the replay buffer. In :py:attr:`grouped`
+            mode, they have a leading building axis.
+        """
+
+        o, a, r, n, d = batch
+        get = (lambda x: x) if index is None else (lambda x: x[index])
+
+        # losses are means over the batch of each building so the fused losses are scaled by the number of buildings
+        # to sum the per-building means and keep per-building gradients unchanged
+        loss_scale = o.shape[0] if index is None else 1
+
+        with torch.no_grad():
+            # Update Q-values. First, sample an action from the Gaussian policy/distribution for the current (next) observation and its associated log probability of occurrence.
+            new_next_actions, new_log_pi, _ = get(self.policy_net).sample(n)
+
+            # The updated Q-value is found by subtracting the logprob of the sampled action (proportional to the entropy) to the Q-values estimated by the target networks.
+            target_q_values = torch.min(
+                get(self.target_soft_q_net1)(n, new_next_actions),
+                get(self.target_soft_q_net2)(n, new_next_actions),
+            ) - self.alpha*new_log_pi
+            q_target = r + (1 - d)*self.discount*target_q_values
+
+        # Update Soft Q-Networks
+        q1_pred = get(self.soft_q_net1)(o, a)
+        q2_pred = get(self.soft_q_net2)(o, a)
+        q1_loss = self.soft_q_criterion(q1_pred, q_target)*loss_scale
+        q2_loss = self.soft_q_criterion(q2_pred, q_target)*loss_scale
+        get(self.soft_q_optimizer1).zero_grad()
+        q1_loss.backward()
+        get(self.soft_q_optimizer1).step()
+        get(self.soft_q_optimizer2).zero_grad()
+        q2_loss.backward()
+        get(self.soft_q_optimizer2).step()
+
+        # Update Policy
+        new_actions, log_pi, _ = get(self.policy_net).sample(o)
+        q_new_actions = torch.min(
+            get(self.soft_q_net1)(o, new_actions),
+            get(self.soft_q_net2)(o, new_actions)
+        )
+        policy_loss = (self.alpha*log_pi - q_new_actions).mean()*loss_scale
+        get(self.policy_optimizer).zero_grad()
+        policy_loss.backward()
+        get(self.policy_optimizer).step()
+
+        # Soft Updates
+        for target_param, param in zip(get(self.target_soft_q_net1).parameters(), get(self.soft_q_net1).parameters()):
+            target_param.data.copy_(target_param.data*(1.0 - self.tau) + param.data*self.tau)
+
+        for target_param, param in zip(get(self.target_soft_q_net2).parameters(), get(self.soft_q_net2).parameters()):
+            target_param.data.copy_(target_param.data*(1.0 - self.tau) + param.data*self.tau)
+
     def predict(self, observations: List[List[float]], deterministic: bool = None):
         r"""Provide actions for current time step.
 
@@ -199,13 +242,21 @@ class SAC(RLC):
 
         actions = []
 
-        for i, o in enumerate(observations):
-            o = self.get_encoded_observations(i, o)
-            o = self.get_normalized_observations(i, o)
-            o = torch.FloatTensor(o).unsqueeze(0).to(self.device)
-            result = self.policy_net[i].sample(o)
+        if self.grouped:
+            o = np.stack([self.get_normalized_observations(i, self.get_encoded_observations(i, o)) for i, o in enumerate(observations)])
+            o = torch.FloatTensor(o).unsqueeze(1).to(self.device)
+            result = self.policy_net.sample(o)
             a = result[2] if deterministic else result[0]
-            actions.append(a.detach().cpu().numpy()[0])
+            actions = list(a.detach().cpu().numpy()[:, 0])
+
+        else:
+            for i, o in enumerate(observations):
+                o = self.get_encoded_observations(i, o)
+                o = self.get_normalized_observations(i, o)
+                o = torch.FloatTensor(o).unsqueeze(0).to(self.device)
+                result = self.policy_net[i].sample(o)
+                a = result[2] if deterministic else result[0]
+                actions.append(a.detach().cpu().numpy()[0])
 
         return actions
             
@@ -235,6 +286,19 @@ class SAC(RLC):
     def set_networks(self, internal_observation_count: int = None):
         internal_observation_count = 0 if internal_observation_count is None else internal_observation_count
 
+        if self.grouped:
+            self.soft_q_net1 = [None for _ in self.action_space]
+            self.soft_q_net2 = [None for _ in self.action_space]
+            self.target_soft_q_net1 = [None for _ in self.action_space]
+            self.target_soft_q_net2 = [None for _ in self.action_space]
+            self.policy_net = [None for _ in self.action_space]
+            self.soft_q_optimizer1 = [None for _ in self.action_space]
+            self.soft_q_optimizer2 = [None for _ in self.action_space]
+            self.policy_optimizer = [None for _ in self.action_space]
+        
+        else:
+            pass
+
         for i in range(len(self.action_dimension)):
             observation_dimension = self.observation_dimension[i] + internal_observation_count
             # init networks
@@ -256,6 +320,22 @@ class SAC(RLC):
             self.policy_optimizer[i] = optim.Adam(self.policy_net[i].parameters(), lr=self.lr)
             self.target_entropy[i] = -np.prod(self.action_space[i].shape).item()
 
+        if self.grouped:
+            observation_dimensions = [d + internal_observation_count for d in self.observation_dimension]
+            assert len(set(observation_dimensions)) == 1 and len(set(self.action_dimension)) == 1,\
+                'grouped networks require all buildings to have the same observation and action dimensions.'
+            self.soft_q_net1 = GroupedSoftQNetwork(self.soft_q_net1).to(self.device)
+            self.soft_q_net2 = GroupedSoftQNetwork(self.soft_q_net2).to(self.device)
+            self.target_soft_q_net1 = GroupedSoftQNetwork(self.target_soft_q_net1).to(self.device)
+            self.target_soft_q_net2 = GroupedSoftQNetwork(self.target_soft_q_net2).to(self.device)
+            self.policy_net = GroupedPolicyNetwork(self.policy_net).to(self.device)
+            self.soft_q_optimizer1 = optim.Adam(self.soft_q_net1.parameters(), lr=self.lr)
+            self.soft_q_optimizer2 = optim.Adam(self.soft_q_net2.parameters(), lr=self.lr)
+            self.policy_optimizer = optim.Adam(self.policy_net.parameters(), lr=self.lr)
+        
+        else:
+            pass
+
     def set_encoders(self) -> List[List[Encoder]]:
         encoders = super().set_encoders()
 
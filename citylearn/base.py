@@ -224,6 +224,37 @@ class Environment:
             'seconds_per_time_step': self.seconds_per_time_step
         }
 
+    def get_time_series(self) -> Mapping[str, np.ndarray]:
+        r"""Returns per-episode state time series owned by the object.
+
+        Returns
+        -------
+        time_series: Mapping[str, np.ndarray]
+            Mapping of time series name to its array of length `episode_time_steps`.
+
+        Notes
+        -----
+        Override in subclass to expose its per-episode state arrays to :py:class:`citylearn.state.DistrictState`.
+        """
+
+        return {}
+
+    def set_time_series(self, time_series: Mapping[str, np.ndarray]):
+        r"""Rebinds per-episode state time series owned by the object.
+
+        Parameters
+        ----------
+        time_series: Mapping[str, np.ndarray]
+            Mapping of time series name to array with the same keys as returned by :py:meth:`get_time_series`.
+            The arrays are used as-is and not copied so that they may be views into shared memory.
+
+        Notes
+        -----
+        Override in subclass alongside :py:meth:`get_time_series`.
+        """
+
+        pass
+
     def next_time_step(self):
         r"""Advance to next `time_step` value.
 
@@ -0,0 +1,274 @@
+from concurrent.futures import ProcessPoolExecutor
+import datetime
+import gc
+import importlib
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, List, Mapping, Union
+from citylearn.__init__ import __version__
+from citylearn.citylearn import CityLearnEnv
+from citylearn.data import DataSet
+from citylearn.utilities import write_json
+
+try:
+    import resource
+
+except (ImportError, ModuleNotFoundError):
+    resource = None
+
+class Benchmark:
+    r"""Performance benchmark of :py:class:`citylearn.citylearn.CityLearnEnv` on CityLearn data sets.
+
+    For each data set, the time to construct and reset the environment, the number of steps per second when stepping
+    through an episode with each policy in :py:attr:`policies`, the time to call :py:meth:`citylearn.citylearn.CityLearnEnv.evaluate`
+    at the end of each episode and the peak resident set size of the process are measured.
+
+    Parameters
+    ----------
+    schemas: List[str], optional
+        Data set names or schema filepaths. Defaults to all data sets in :py:meth:`citylearn.data.DataSet.get_names`.
+    time_steps: int, optional
+        Number of time steps in the benchmark episode starting from the schema's `simulation_start_time_step`.
+        Defaults to the schema's simulation period.
+    policies: Mapping[str, str], optional
+        Policy name to agent class name path mapping. Defaults to :py:attr:`DEFAULT_POLICIES`.
+    env_kwargs: Mapping[str, Any], optional
+        Other initialization parameters for :py:class:`citylearn.citylearn.CityLearnEnv`.
+    isolate: bool, default: True
+        Whether to run each data set's benchmark in a fresh subprocess so that its peak resident set size is not
+        inflated by previously benchmarked data sets.
+
+    Notes
+    -----
+    The policies are run in order in the same environment, so policies that deactivate actions e.g.
+    :py:class:`citylearn.agents.base.BaselineAgent` should come last. The peak resident set size is that of the process
+    that ran the data set's benchmark hence, when :py:attr:`isolate` is `False`, it is non-decreasing across data sets.
+    """
+
+    DEFAULT_POLICIES = {
+        'random': 'citylearn.agents.base.Agent',
+        'rbc': 'citylearn.agents.rbc.BasicRBC',
+        'baseline': 'citylearn.agents.base.BaselineAgent',
+    }
+
+    def __init__(self, schemas: List[str] = None, time_steps: int = None, policies: Mapping[str, str] = None, env_kwargs: Mapping[str, Any] = None, isolate: bool = None):
+        self.schemas = schemas
+        self.time_steps = time_steps
+        self.policies = policies
+        self.env_kwargs = env_kwargs
+        self.isolate = isolate
+
+    @property
+    def schemas(self) -> List[str]:
+        """Data set names or schema filepaths."""
+
+        return self.__schemas
+
+    @property
+    def time_steps(self) -> int:
+        """Number of time steps in the benchmark episode."""
+
+        return self.__time_steps
+
+    @property
+    def policies(self) -> Mapping[str, str]:
+        """Policy name to agent class name path mapping."""
+
+        return self.__policies
+
+    @property
+    def env_kwargs(self) -> Mapping[str, Any]:
+        """Other initialization parameters for :py:class:`citylearn.citylearn.CityLearnEnv`."""
+
+        return self.__env_kwargs
+
+    @property
+    def isolate(self) -> bool:
+        """Whether to run each data set's benchmark in a fresh subprocess."""
+
+        return self.__isolate
+
+    @schemas.setter
+    def schemas(self, value: List[str]):
+        self.__schemas = DataSet.get_names() if value is None else value
+
+    @time_steps.setter
+    def time_steps(self, value: int):
+        assert value is None or value > 0, 'time_steps must be > 0.'
+        self.__time_steps = value
+
+    @policies.setter
+    def policies(self, value: Mapping[str, str]):
+        self.__policies = {**self.DEFAULT_POLICIES} if value is None else value
+
+    @env_kwargs.setter
+    def env_kwargs(self, value: Mapping[str, Any]):
+        self.__env_kwargs = {} if value is None else value
+
+    @isolate.setter
+    def isolate(self, value: bool):
+        self.__isolate = True if value is None else value
+
+    def run(self, filepath: str = None) -> Mapping[str, Any]:
+        r"""Run benchmark on all :py:attr:`schemas`.
+
+        Parameters
+        ----------
+        filepath: str, optional
+            JSON filepath to write results to.
+
+        Returns
+        -------
+        results: Mapping[str, Any]
+            Benchmark `metadata` e.g. CityLearn version and git commit and per-schema `results`.
+            Times are in seconds and peak resident set size is in bytes.
+        """
+
+        results = {
+            'metadata': self.get_metadata(),
+            'results': [self.__run_isolated_schema(s) if self.isolate else self.run_schema(s) for s in self.schemas],
+        }
+
+        if filepath is not None:
+            write_json(filepath, results)
+
+        else:
+            pass
+
+        return results
+
+    def run_schema(self, schema: str) -> Mapping[str, Any]:
+        r"""Run benchmark on a data set.
+
+        Parameters
+        ----------
+        schema: str
+            Data set name or schema filepath.
+
+        Returns
+        -------
+        result: Mapping[str, Any]
+            Construction time, reset time, per-policy steps per second and evaluation time and peak resident set size.
+        """
+
+        gc.collect()
+        env_kwargs = {**self.env_kwargs}
+        schema_dict = CityLearnEnv._parse_schema(schema)
+
+        if self.time_steps is not None:
+            start_time_step = schema_dict['simulation_start_time_step']
+            env_kwargs['simulation_start_time_step'] = start_time_step
+            env_kwargs['simulation_end_time_step'] = start_time_step + self.time_steps - 1
+
+        else:
+            pass
+
+        start_time = time.perf_counter()
+        env = CityLearnEnv(schema_dict, **env_kwargs)
+        construction_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        env.reset()
+        reset_time = time.perf_counter() - start_time
+        policies = {}
+
+        for name, agent in self.policies.items():
+            policies[name] = self.run_policy(env, agent)
+
+        return {
+            'schema': schema,
+            'buildings': len(env.buildings),
+            'time_steps': env.time_steps,
+            'construction_time': construction_time,
+            'reset_time': reset_time,
+            'policies': policies,
+            'peak_rss': self.get_peak_rss(),
+        }
+
+    def __run_isolated_schema(self, schema: str) -> Mapping[str, Any]:
+        # spawn rather than fork so that the subprocess does not inherit the resident set of this process
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            return executor.submit(self.run_schema, schema).result()
+
+    def run_policy(self, env: CityLearnEnv, agent: str) -> Mapping[str, float]:
+        r"""Step through an episode with an agent's predictions.
+
+        Parameters
+        ----------
+        env: CityLearnEnv
+            CityLearn environment.
+        agent: str
+            Agent class name path.
+
+        Returns
+        -------
+        result: Mapping[str, float]
+            Number of steps, steps per second and evaluation time.
+        """
+
+        agent_module = '.'.join(agent.split('.')[0:-1])
+        agent_name = agent.split('.')[-1]
+        agent = getattr(importlib.import_module(agent_module), agent_name)(env)
+        observations, _ = env.reset()
+        steps = 0
+        start_time = time.perf_counter()
+
+        while not env.terminated:
+            actions = agent.predict(observations, deterministic=True)
+            observations, _, _, _, _ = env.step(actions)
+            steps += 1
+
+        step_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        env.evaluate()
+        evaluate_time = time.perf_counter() - start_time
+
+        return {
+            'steps': steps,
+            'steps_per_second': steps/step_time if step_time > 0.0 else None,
+            'evaluate_time': evaluate_time,
+        }
+
+    @staticmethod
+    def get_peak_rss() -> Union[int, None]:
+        """Returns peak resident set size of the process in bytes or `None` if it cannot be determined on this platform."""
+
+        if resource is None:
+            return None
+
+        else:
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+            # ru_maxrss is in bytes on macOS and kilobytes on Linux
+            return peak_rss if sys.platform == 'darwin' else peak_rss*1024
+
+    @staticmethod
+    def get_metadata() -> Mapping[str, Any]:
+        """Returns CityLearn version, git commit if available, Python version, platform and timestamp of the benchmark."""
+
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            ).stdout.strip()
+
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            'citylearn_version': __version__,
+            'commit': commit,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+
+def run_benchmark(schemas: List[str] = None, time_steps: int = None, output_filepath: str = None):
+    """Run :py:class:`Benchmark` and write its results to `output_filepath`."""
+
+    output_filepath = 'citylearn_benchmark.json' if output_filepath is None else output_filepath
+    Benchmark(schemas=schemas, time_steps=time_steps).run(output_filepath)
@@ -1,17 +1,19 @@
 import logging
-from typing import Any, List, Mapping, Tuple, Union
+from typing import Any, Callable, List, Mapping, Tuple, TYPE_CHECKING, Union
 from gymnasium import spaces
 import numpy as np
 import pandas as pd
-import torch
 from citylearn.base import Environment, EpisodeTracker
-from citylearn.data import EnergySimulation, CarbonIntensity, Pricing, TOLERANCE, Weather, ZERO_DIVISION_PLACEHOLDER
-from citylearn.dynamics import Dynamics, LSTMDynamics
+from citylearn.data import EnergySimulation, CarbonIntensity, Pricing, TimeSeriesData, TOLERANCE, Weather, ZERO_DIVISION_PLACEHOLDER
+from citylearn.dynamics import Dynamics
 from citylearn.energy_model import Battery, ElectricDevice, ElectricHeater, HeatPump, PV, StorageTank
 from citylearn.occupant import LogisticRegressionOccupant, Occupant
 from citylearn.power_outage import PowerOutage
 from citylearn.preprocessing import Normalize, PeriodicNormalization
 
+if TYPE_CHECKING:
+    from citylearn.lstm_dynamics import LSTMDynamics
+
 LOGGER = logging.getLogger()
 
 class Building(Environment):
@@ -72,6 +74,12 @@ class Building(Environment):
     **kwargs : Any
         Other keyword arguments used to initialize super class.
     """
+
+    DEVICE_NAMES = [
+        'cooling_device', 'heating_device', 'dhw_device', 'non_shiftable_load_device', 
+        'cooling_storage', 'heating_storage', 'dhw_storage', 'electrical_storage', 'pv'
+    ]
+    EXOGENOUS_ENERGY_SIMULATION_OBSERVATIONS = ['month', 'hour', 'day_type', 'daylight_savings_status', 'occupant_count']
     
     def __init__(
         self, energy_simulation: EnergySimulation, weather: Weather, observation_metadata: Mapping[str, bool], action_metadata: Mapping[str, bool], episode_tracker: EpisodeTracker, carbon_intensity: CarbonIntensity = None, 
@@ -79,6 +87,9 @@ class Building(Environment):
         dhw_device: Union[HeatPump, ElectricHeater] = None, cooling_device: HeatPump = None, heating_device: Union[HeatPump, ElectricHeater] = None, pv: PV = None, name: str = None,
         maximum_temperature_delta: float = None, observation_space_limit_delta: float = None, demand_observation_limit_factor: float = None, simulate_power_outage: bool = None, stochastic_power_outage: bool = None, stochastic_power_outage_model: PowerOutage = None, **kwargs: Any
     ):  
+        self.__observations_data_cache = None
+        self.__observation_getters = None
+        self.__exogenous_observations = None
         self.name = name
         self.dhw_storage = dhw_storage
         self.cooling_storage = cooling_storage
@@ -688,6 +699,7 @@ class Building(Environment):
         self.__observation_space = observation_space
         self.non_periodic_normalized_observation_space_limits = self.estimate_observation_space_limits(include_all=True, periodic_normalization=False)
         self.periodic_normalized_observation_space_limits = self.estimate_observation_space_limits(include_all=True, periodic_normalization=True)
+        self.__exogenous_observations = None
 
     @action_space.setter
     def action_space(self, action_space: spaces.Box):
@@ -819,7 +831,7 @@ class Building(Environment):
         check_limits = False if check_limits is None else check_limits
 
         observations = {}
-        data = self._get_observations_data()
+        data = self.__get_cached_observations_data()
 
         if include_all:
             valid_observations = list(data.keys())
@@ -858,87 +870,286 @@ class Building(Environment):
             else:
                 pass
 
-        if periodic_normalization:
+        if periodic_normalization or normalize:
+            # exogenous observations are read from columns transformed once per episode
+            exogenous_observations = self.__get_exogenous_observations(periodic_normalization, normalize)
+            time_step = self.time_step
             observations_copy = {k: v for k, v in observations.items()}
             observations = {}
             pn = PeriodicNormalization(x_max=0)
+            nm = Normalize(0.0, 1.0)
 
             for k, v in observations_copy.items():
-                if k in periodic_observations:
+                if k in exogenous_observations:
+                    for k_, v_ in exogenous_observations[k]:
+                        observations[k_] = v_[time_step]
+
+                    continue
+
+                elif periodic_normalization and k in periodic_observations:
                     pn.x_max = max(periodic_observations[k])
                     sin_x, cos_x = v*pn
-                    observations[f'{k}_cos'] = cos_x
-                    observations[f'{k}_sin'] = sin_x
+                    transformed_observations = [(f'{k}_cos', cos_x), (f'{k}_sin', sin_x)]
 
                 else:
-                    observations[k] = v
+                    transformed_observations = [(k, v)]
+
+                for k_, v_ in transformed_observations:
+                    if normalize:
+                        nm.x_min = periodic_low_limit[k_]
+                        nm.x_max = periodic_high_limit[k_]
+                        observations[k_] = v_*nm
+
+                    else:
+                        observations[k_] = v_
+
         else:
             pass
+
+        return observations
+    
+    def __get_cached_observations_data(self) -> Mapping[str, Union[float, int]]:
+        """Returns :py:meth:`_get_observations_data` output that is materialized once per `time_step` and shared by all
+        :py:meth:`observations` calls until the cache is cleared."""
+
+        if self.__observations_data_cache is None or self.__observations_data_cache[0] != self.time_step:
+            self.__observations_data_cache = (self.time_step, self._get_observations_data())
         
-        if normalize:
-            nm = Normalize(0.0, 1.0)
+        else:
+            pass
+
+        return self.__observations_data_cache[1]
+
+    def __get_exogenous_observations(self, periodic_normalization: bool, normalize: bool) -> Mapping[str, List[Tuple[str, np.ndarray]]]:
+        """Returns mapping of exogenous observation name to the names and episode time series of its transformed observations.
+
+        The transformations are applied to whole columns of :py:meth:`_get_exogenous_observations_data` once per episode and
+        combination of `periodic_normalization` and `normalize`. Observations that can not be transformed e.g. because they
+        have no normalization limits are left out and transformed at each time step by :py:meth:`observations`.
+        """
+
+        key = (periodic_normalization, normalize)
+        self.__exogenous_observations = {} if self.__exogenous_observations is None else self.__exogenous_observations
 
-            for k, v in observations.items():
-                nm.x_min = periodic_low_limit[k]
-                nm.x_max = periodic_high_limit[k]
-                observations[k] = v*nm
+        if key not in self.__exogenous_observations:
+            periodic_observations = self.get_periodic_observation_metadata()
+            low_limit, high_limit = self.periodic_normalized_observation_space_limits
+            exogenous_observations = {}
+
+            for k, v in self._get_exogenous_observations_data().items():
+                if periodic_normalization and k in periodic_observations:
+                    sin_x, cos_x = PeriodicNormalization(x_max=max(periodic_observations[k]))*v
+                    columns = [(f'{k}_cos', cos_x), (f'{k}_sin', sin_x)]
+
+                else:
+                    columns = [(k, v)]
+
+                if normalize and all(k_ in low_limit for k_, _ in columns):
+                    columns = [(k_, Normalize(low_limit[k_], high_limit[k_])*v_.astype('float64')) for k_, v_ in columns]
+                    columns = [(k_, np.zeros(len(v), dtype='float64') if np.isscalar(v_) else v_) for k_, v_ in columns]
+
+                elif normalize:
+                    continue
+
+                else:
+                    pass
+
+                exogenous_observations[k] = columns
+
+            self.__exogenous_observations[key] = exogenous_observations
 
         else:
             pass
 
-        return observations
-    
+        return self.__exogenous_observations[key]
+
+    def clear_observations_cache(self):
+        r"""Clears the per-`time_step` observations data cache.
+        
+        Is called when advancing `time_step`, applying actions and resetting. Call after modifying any time series 
+        that is read by :py:meth:`observations` outside these methods within the same `time_step`.
+        """
+
+        self.__observations_data_cache = None
+
+    def clear_observation_getters(self):
+        r"""Clears the observation getters compiled by :py:meth:`_get_observation_getters` so that they are compiled again on next use.
+
+        Getters are bound to the building they were compiled for. Call on a copy of the building e.g. in 
+        :py:meth:`citylearn.citylearn.CityLearnEnv.fork` so that the copy does not read the original building's time series.
+        """
+
+        self.__observation_getters = None
+
+    def get_observations_array(self, include_all: bool = None, out: np.ndarray = None) -> np.ndarray:
+        r"""Unnormalized observations at current time step as a float32 array.
+
+        Values are written directly into `out` in the order of `active_observations` (or all observations if `include_all`) 
+        using the compiled observation getters thus, no intermediate observations dictionary is built unless one is already
+        cached for the current time step.
+
+        Parameters
+        ----------
+        include_all: bool, default: False,
+            Whether to return all observations as listed in `observation_metadata` or only those that are active.
+        out: np.ndarray, optional
+            Preallocated 1-D array to write observations into e.g. a row or slice of a district-level buffer.
+
+        Returns
+        -------
+        observations: np.ndarray
+            `out` if provided otherwise, a new float32 array.
+        """
+
+        include_all = False if include_all is None else include_all
+        getters = self.__get_observation_getters()
+        names = list(getters.keys()) if include_all else self.active_observations
+
+        try:
+            if (self.__observations_data_cache is not None and self.__observations_data_cache[0] == self.time_step)\
+                or type(self)._get_observations_data is not Building._get_observations_data:
+                data = self.__get_cached_observations_data()
+                values = [data[k] for k in names]
+
+            else:
+                time_step = self.time_step
+                values = [getters[k](time_step) for k in names]
+
+        except KeyError:
+            unknown_observations = [k for k in names if k not in getters]
+            raise AssertionError(f'Unknown observations: {unknown_observations}')
+
+        out = np.zeros(len(names), dtype='float32') if out is None else out
+        out[:] = values
+
+        return out
+
+    def __get_observation_getters(self) -> Mapping[str, Callable[[int], Union[float, int]]]:
+        """Returns :py:meth:`_get_observation_getters` output that is compiled once per episode."""
+
+        if self.__observation_getters is None:
+            self.__observation_getters = self._get_observation_getters()
+        
+        else:
+            pass
+
+        return self.__observation_getters
+
     def _get_observations_data(self) -> Mapping[str, Union[float, int]]:
+        time_step = self.time_step
+
+        return {k: v(time_step) for k, v in self.__get_observation_getters().items()}
+
+    def _get_observation_getters(self) -> Mapping[str, Callable[[int], Union[float, int]]]:
+        """Returns mapping of observation name to function that returns the observation value at a time step.
+
+        The mapping is the index map used to build observations and it is compiled once per episode. Getters read the 
+        building's current arrays when called so they remain valid when arrays are rebound or updated in place.
+        """
+
+        energy_simulation = self._get_time_series_observation_getters(self.energy_simulation)
+        weather = self._get_time_series_observation_getters(self.weather)
+        pricing = self._get_time_series_observation_getters(self.pricing)
+        carbon_intensity = self._get_time_series_observation_getters(self.carbon_intensity)
+        temperature = weather['outdoor_dry_bulb_temperature']
+        weather_data = self.weather
+
+        def get_storage_electricity_consumption(device: str, storage: str, heating: bool) -> Callable[[int], float]:
+            def get(t: int) -> float:
+                device_object = getattr(self, device)
+                energy_balance = getattr(self, storage).energy_balance[t:t + 1]
+
+                if isinstance(device_object, HeatPump):
+                    temperature_data, start_index = weather_data.get_array('outdoor_dry_bulb_temperature')
+                    outdoor_dry_bulb_temperature = temperature_data[start_index + t:start_index + t + 1]
+                    consumption = device_object.get_input_power(energy_balance, outdoor_dry_bulb_temperature, heating)
+                else:
+                    consumption = device_object.get_input_power(energy_balance)
+
+                return consumption[0]
+            
+            return get
+        
+        def get_device_efficiency(device: str, heating: bool) -> Callable[[int], float]:
+            def get(t: int) -> float:
+                device_object = getattr(self, device)
+
+                return device_object.get_cop(temperature(t), heating=heating) \
+                    if isinstance(device_object, HeatPump) else device_object.efficiency
+            
+            return get
+
         return {
+            **energy_simulation,
+            **weather,
+            **pricing,
+            **carbon_intensity,
+            'solar_generation': lambda t: abs(self.__solar_generation[t]),
             **{
-                k.lstrip('_'): self.energy_simulation.__getattr__(k.lstrip('_'))[self.time_step] 
-                for k, v in vars(self.energy_simulation).items() if isinstance(v, np.ndarray)
+                'cooling_storage_soc': lambda t: self.cooling_storage.soc[t],
+                'heating_storage_soc': lambda t: self.heating_storage.soc[t],
+                'dhw_storage_soc': lambda t: self.dhw_storage.soc[t],
+                'electrical_storage_soc': lambda t: self.electrical_storage.soc[t],
             },
-            **{
-                k.lstrip('_'): self.weather.__getattr__(k.lstrip('_'))[self.time_step] 
-                for k, v in vars(self.weather).items() if isinstance(v, np.ndarray)
-            },
-            **{
-                k.lstrip('_'): self.pricing.__getattr__(k.lstrip('_'))[self.time_step] 
-                for k, v in vars(self.pricing).items() if isinstance(v, np.ndarray)
-            },
-            **{
-                k.lstrip('_'): self.carbon_intensity.__getattr__(k.lstrip('_'))[self.time_step] 
-                for k, v in vars(self.carbon_intensity).items() if isinstance(v, np.ndarray)
-            },
-            'solar_generation':abs(self.solar_generation[self.time_step]),
-            **{
-                'cooling_storage_soc':self.cooling_storage.soc[self.time_step],
-                'heating_storage_soc':self.heating_storage.soc[self.time_step],
-                'dhw_storage_soc':self.dhw_storage.soc[self.time_step],
-                'electrical_storage_soc':self.electrical_storage.soc[self.time_step],
-            },
-            'cooling_demand': self.__energy_from_cooling_device[self.time_step] + abs(min(self.cooling_storage.energy_balance[self.time_step], 0.0)),
-            'heating_demand': self.__energy_from_heating_device[self.time_step] + abs(min(self.heating_storage.energy_balance[self.time_step], 0.0)),
-            'dhw_demand': self.__energy_from_dhw_device[self.time_step] + abs(min(self.dhw_storage.energy_balance[self.time_step], 0.0)),
-            'net_electricity_consumption': self.net_electricity_consumption[self.time_step],
-            'cooling_electricity_consumption': self.cooling_electricity_consumption[self.time_step],
-            'heating_electricity_consumption': self.heating_electricity_consumption[self.time_step],
-            'dhw_electricity_consumption': self.dhw_electricity_consumption[self.time_step],
-            'cooling_storage_electricity_consumption': self.cooling_storage_electricity_consumption[self.time_step],
-            'heating_storage_electricity_consumption': self.heating_storage_electricity_consumption[self.time_step],
-            'dhw_storage_electricity_consumption': self.dhw_storage_electricity_consumption[self.time_step],
-            'electrical_storage_electricity_consumption': self.electrical_storage_electricity_consumption[self.time_step],
-            'cooling_device_efficiency': self.cooling_device.get_cop(self.weather.outdoor_dry_bulb_temperature[self.time_step], heating=False),
-            'heating_device_efficiency': self.heating_device.get_cop(
-                self.weather.outdoor_dry_bulb_temperature[self.time_step], heating=True
-                    ) if isinstance(self.heating_device, HeatPump) else self.heating_device.efficiency,
-            'dhw_device_efficiency': self.dhw_device.get_cop(
-                self.weather.outdoor_dry_bulb_temperature[self.time_step], heating=True
-                    ) if isinstance(self.dhw_device, HeatPump) else self.dhw_device.efficiency,
-            'indoor_dry_bulb_temperature_cooling_set_point': self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step],
-            'indoor_dry_bulb_temperature_heating_set_point': self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step],
-            'indoor_dry_bulb_temperature_cooling_delta': self.energy_simulation.indoor_dry_bulb_temperature[self.time_step] - self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step],
-            'indoor_dry_bulb_temperature_heating_delta': self.energy_simulation.indoor_dry_bulb_temperature[self.time_step] - self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step],
-            'comfort_band': self.energy_simulation.comfort_band[self.time_step],
-            'occupant_count': self.energy_simulation.occupant_count[self.time_step],
-            'power_outage': self.__power_outage_signal[self.time_step],
+            'cooling_demand': lambda t: self.__energy_from_cooling_device[t] + abs(min(self.cooling_storage.energy_balance[t], 0.0)),
+            'heating_demand': lambda t: self.__energy_from_heating_device[t] + abs(min(self.heating_storage.energy_balance[t], 0.0)),
+            'dhw_demand': lambda t: self.__energy_from_dhw_device[t] + abs(min(self.dhw_storage.energy_balance[t], 0.0)),
+            'net_electricity_consumption': lambda t: self.__net_electricity_consumption[t],
+            'cooling_electricity_consumption': lambda t: self.cooling_device.electricity_consumption[t],
+            'heating_electricity_consumption': lambda t: self.heating_device.electricity_consumption[t],
+            'dhw_electricity_consumption': lambda t: self.dhw_device.electricity_consumption[t],
+            'cooling_storage_electricity_consumption': get_storage_electricity_consumption('cooling_device', 'cooling_storage', False),
+            'heating_storage_electricity_consumption': get_storage_electricity_consumption('heating_device', 'heating_storage', True),
+            'dhw_storage_electricity_consumption': get_storage_electricity_consumption('dhw_device', 'dhw_storage', True),
+            'electrical_storage_electricity_consumption': lambda t: self.electrical_storage.electricity_consumption[t],
+            'cooling_device_efficiency': get_device_efficiency('cooling_device', False),
+            'heating_device_efficiency': get_device_efficiency('heating_device', True),
+            'dhw_device_efficiency': get_device_efficiency('dhw_device', True),
+            'indoor_dry_bulb_temperature_cooling_set_point': energy_simulation['indoor_dry_bulb_temperature_cooling_set_point'],
+            'indoor_dry_bulb_temperature_heating_set_point': energy_simulation['indoor_dry_bulb_temperature_heating_set_point'],
+            'indoor_dry_bulb_temperature_cooling_delta': lambda t: energy_simulation['indoor_dry_bulb_temperature'](t) 
+                - energy_simulation['indoor_dry_bulb_temperature_cooling_set_point'](t),
+            'indoor_dry_bulb_temperature_heating_delta': lambda t: energy_simulation['indoor_dry_bulb_temperature'](t) 
+                - energy_simulation['indoor_dry_bulb_temperature_heating_set_point'](t),
+            'comfort_band': energy_simulation['comfort_band'],
+            'occupant_count': energy_simulation['occupant_count'],
+            'power_outage': lambda t: self.__power_outage_signal[t],
+        }
+    
+    def _get_exogenous_observations_data(self) -> Mapping[str, np.ndarray]:
+        """Returns mapping of observation name to its unnormalized episode time series for observations that do not depend 
+        on control i.e. weather, pricing, carbon intensity, calendar and occupant count observations."""
+
+        episode_time_steps = self.episode_tracker.episode_time_steps
+
+        def get_data(data: TimeSeriesData) -> Mapping[str, np.ndarray]:
+            variables = {k: data.get_array(k) for k in data.get_array_names()}
+
+            return {k: v[s:s + episode_time_steps] for k, (v, s) in variables.items()}
+        
+        energy_simulation = get_data(self.energy_simulation)
+
+        return {
+            **{k: energy_simulation[k] for k in self.EXOGENOUS_ENERGY_SIMULATION_OBSERVATIONS if k in energy_simulation},
+            **get_data(self.weather),
+            **get_data(self.pricing),
+            **get_data(self.carbon_intensity),
         }
+
+    @staticmethod
+    def _get_time_series_observation_getters(data: TimeSeriesData) -> Mapping[str, Callable[[int], Union[float, int]]]:
+        """Returns observation getters for the array variables in `data` that index the underlying arrays directly 
+        with respect to `data` `start_time_step` instead of slicing through :py:meth:`citylearn.data.TimeSeriesData.__getattr__`."""
+
+        def get_getter(name: str) -> Callable[[int], Union[float, int]]:
+            def get(t: int) -> Union[float, int]:
+                array, start_index = data.get_array(name)
+
+                return array[start_index + t]
+
+            return get
+
+        return {k: get_getter(k) for k in data.get_array_names()}
     
     @staticmethod
     def get_periodic_observation_metadata() -> Mapping[str, int]:
@@ -991,6 +1202,8 @@ class Building(Environment):
             Fraction of `electrical_storage` `capacity` to charge/discharge by.
         """
 
+        self.clear_observations_cache()
+
         # hvac devices
         if 'cooling_or_heating_device_action' in self.active_actions:
             assert 'cooling_device' not in self.active_actions and 'heating_device' not in self.active_actions, \
@@ -1775,12 +1988,16 @@ class Building(Environment):
         self.electrical_storage.next_time_step()
         self.pv.next_time_step()
         super().next_time_step()
+        self.clear_observations_cache()
 
     def reset(self):
         r"""Reset `Building` to initial state."""
 
         # object reset
         super().reset()
+        self.clear_observations_cache()
+        self.__observation_getters = None
+        self.__exogenous_observations = None
         self.cooling_storage.reset()
         self.heating_storage.reset()
         self.dhw_storage.reset()
@@ -1805,6 +2022,54 @@ class Building(Environment):
         self.__power_outage_signal = self.reset_power_outage_signal()
         self.update_variables()
 
+    def get_time_series(self) -> Mapping[str, np.ndarray]:
+        r"""Returns per-episode state time series owned by the building and its devices.
+
+        Device time series are prefixed with the device attribute name e.g. `electrical_storage.soc`.
+        """
+
+        time_series = {
+            **super().get_time_series(),
+            'solar_generation': self.__solar_generation,
+            'energy_from_cooling_device': self.__energy_from_cooling_device,
+            'energy_from_heating_device': self.__energy_from_heating_device,
+            'energy_from_dhw_device': self.__energy_from_dhw_device,
+            'energy_to_non_shiftable_load': self.__energy_to_non_shiftable_load,
+            'net_electricity_consumption': self.__net_electricity_consumption,
+            'net_electricity_consumption_emission': self.__net_electricity_consumption_emission,
+            'net_electricity_consumption_cost': self.__net_electricity_consumption_cost,
+            'power_outage_signal': self.__power_outage_signal,
+        }
+
+        for device_name in self.DEVICE_NAMES:
+            for k, v in getattr(self, device_name).get_time_series().items():
+                time_series[f'{device_name}.{k}'] = v
+
+        return time_series
+
+    def set_time_series(self, time_series: Mapping[str, np.ndarray]):
+        r"""Rebinds per-episode state time series owned by the building and its devices.
+
+        Keys follow the same naming as :py:meth:`get_time_series`.
+        """
+
+        super().set_time_series(time_series)
+        self.__solar_generation = time_series['solar_generation']
+        self.__energy_from_cooling_device = time_series['energy_from_cooling_device']
+        self.__energy_from_heating_device = time_series['energy_from_heating_device']
+        self.__energy_from_dhw_device = time_series['energy_from_dhw_device']
+        self.__energy_to_non_shiftable_load = time_series['energy_to_non_shiftable_load']
+        self.__net_electricity_consumption = time_series['net_electricity_consumption']
+        self.__net_electricity_consumption_emission = time_series['net_electricity_consumption_emission']
+        self.__net_electricity_consumption_cost = time_series['net_electricity_consumption_cost']
+        self.__power_outage_signal = time_series['power_outage_signal']
+
+        for device_name in self.DEVICE_NAMES:
+            prefix = f'{device_name}.'
+            getattr(self, device_name).set_time_series({
+                k[len(prefix):]: v for k, v in time_series.items() if k.startswith(prefix)
+            })
+
     def reset_power_outage_signal(self) -> np.ndarray:
         """Resets power outage signal time series.
         
@@ -1825,7 +2090,7 @@ class Building(Environment):
                     self.episode_tracker.episode_time_steps,
                     seconds_per_time_step=self.seconds_per_time_step,
                     weather=self.weather
-                )
+                ).astype('float32')
             
             else:
                 power_outage_signal = self.energy_simulation.power_outage.copy()
@@ -1916,6 +2181,7 @@ class Building(Environment):
 
         # net electriciy consumption emission
         self.__net_electricity_consumption_emission[self.time_step] = max(0.0, net_electricity_consumption*self.carbon_intensity.carbon_intensity[self.time_step])
+        self.clear_observations_cache()
 
 class DynamicsBuilding(Building):
     r"""Base class for temperature dynamic building.
@@ -2047,15 +2313,42 @@ class DynamicsBuilding(Building):
         return self.energy_simulation.indoor_dry_bulb_temperature_without_control[0:self.time_step + 1]
     
     def apply_actions(self, **kwargs):
+        self.apply_control_actions(**kwargs)
+        self.update_dynamics()
+
+    def apply_control_actions(self, **kwargs):
+        """Apply actions and update the dynamics model input for current `time_step` without predicting indoor dry-bulb temperature.
+
+        Together with :py:meth:`update_dynamics`, this splits :py:meth:`apply_actions` so that the dynamics of several buildings
+        can be predicted in one batch between both calls.
+
+        Other Parameters
+        ----------------
+        **kwargs : Any
+            Keyword arguments to :py:meth:`citylearn.building.Building.apply_actions`.
+        """
+
         super().apply_actions(**kwargs)
         self._update_dynamics_input()
 
+    def update_dynamics(self, prediction: float = None):
+        """Update indoor dry-bulb temperature for current `time_step` if :py:attr:`simulate_dynamics`.
+
+        Parameters
+        ----------
+        prediction: float, optional
+            Normalized indoor dry-bulb temperature already predicted with `dynamics` for current `time_step`
+            e.g. by :py:class:`citylearn.lstm_dynamics.LSTMDynamicsExecutor`.
+        """
+
         if self.simulate_dynamics:
-            self.update_indoor_dry_bulb_temperature()
+            self.update_indoor_dry_bulb_temperature(prediction=prediction)
         else:
             pass
+
+        self.clear_observations_cache()
     
-    def update_indoor_dry_bulb_temperature(self):
+    def update_indoor_dry_bulb_temperature(self, prediction: float = None):
         raise NotImplementedError
     
     def get_dynamics_input(self):
@@ -2099,27 +2392,36 @@ class LSTMDynamicsBuilding(DynamicsBuilding):
         Other keyword arguments used to initialize :py:class:`citylearn.building.Building` super class.
     """
 
-    def __init__(self, *args, dynamics: LSTMDynamics, **kwargs):
+    def __init__(self, *args, dynamics: 'LSTMDynamics', **kwargs):
         super().__init__(*args, dynamics=dynamics, **kwargs)
-        self.dynamics: LSTMDynamics
+        self.dynamics: 'LSTMDynamics'
+        self.__dynamics_input_data = None
+        self.__dynamics_input_getters = None
+        self.__dynamics_input = None
 
     @DynamicsBuilding.simulate_dynamics.getter
     def simulate_dynamics(self) -> bool:
-        return super().simulate_dynamics and self.dynamics._model_input[0][0] is not None
+        return super().simulate_dynamics and self.dynamics.model_input_ready
 
-    def update_indoor_dry_bulb_temperature(self):
+    def update_indoor_dry_bulb_temperature(self, prediction: float = None):
         """Predict and update indoor dry-bulb temperature for current `time_step`.
 
         This method will first apply min-max normalization to the model input data where the input data
         is made up of building and district level observations including the predicted 
         :py:attr:`citylearn.building.Building.energy_simulation.indoor_dry_bulb_temperature` 
-        with all input variables having a length of :py:attr:`citylearn.dynamics.LSTMDynamics.lookback`.
+        with all input variables having a length of :py:attr:`citylearn.lstm_dynamics.LSTMDynamics.lookback`.
         asides the `indoor_dry_bulb_temperature` whose input includes all values from
         `time_step` - (`lookback` + 1) to `time_step` - 1, other input variables have values from
         `time_step` - `lookback` to `time_step`. The `indoor_dry_bulb_temperature` for the current `time_step`
         is then predicted using the input data and current `hidden_state` and the predicted values replaces the
         current `time_step` value in :py:attr:`citylearn.building.Building.energy_simulation.indoor_dry_bulb_temperature`.
 
+        Parameters
+        ----------
+        prediction: float, optional
+            Normalized indoor dry-bulb temperature already predicted for current `time_step` in which case,
+            the model is not called and its `hidden_state` is expected to have been advanced by the caller.
+
         Notes
         -----
         LSTM model only uses either cooling/heating demand not both as input variable. 
@@ -2128,64 +2430,99 @@ class LSTMDynamicsBuilding(DynamicsBuilding):
         """
         
         # predict
-        model_input_tensor = torch.tensor(self.get_dynamics_input().T)
-        model_input_tensor = model_input_tensor[np.newaxis, :, :]
-        hidden_state = tuple([h.data for h in self.dynamics._hidden_state])
-        indoor_dry_bulb_temperature_norm, self.dynamics._hidden_state = self.dynamics(model_input_tensor.float(), hidden_state)
+        if prediction is None:
+            indoor_dry_bulb_temperature_norm = self.dynamics.predict(self.get_dynamics_input())
+        
+        else:
+            indoor_dry_bulb_temperature_norm = float(prediction)
         
         # update dry bulb temperature for current time step in model input
         ix = self.dynamics.input_observation_names.index('indoor_dry_bulb_temperature')
-        self.dynamics._model_input[ix][-1] = indoor_dry_bulb_temperature_norm.item()
+        self.dynamics.set_current_model_input(ix, indoor_dry_bulb_temperature_norm)
 
         # unnormalize temperature
         low_limit, high_limit = self.dynamics.input_normalization_minimum[ix], self.dynamics.input_normalization_maximum[ix]
-        indoor_dry_bulb_temperature = indoor_dry_bulb_temperature_norm*(high_limit - low_limit) + low_limit
+        indoor_dry_bulb_temperature = np.float32(indoor_dry_bulb_temperature_norm)*np.float32(high_limit - low_limit) + np.float32(low_limit)
         
         # update temperature
         # this function is called after advancing to next timestep 
         # so the cooling demand update and this temperature update are set at the same time step
-        self.energy_simulation.indoor_dry_bulb_temperature[self.time_step] = indoor_dry_bulb_temperature.item()
+        self.energy_simulation.indoor_dry_bulb_temperature[self.time_step] = indoor_dry_bulb_temperature
 
     def get_dynamics_input(self) -> np.ndarray:
-        model_input = []
+        """Returns model input of shape (`input_size`, `lookback`) for current time step.
 
-        for i, k in enumerate(self.dynamics.input_observation_names):
-            if k == 'indoor_dry_bulb_temperature':
-                # indoor temperature values are t = (t - lookback - 1) : t = (t - 1)
-                #  i.e. use samples from previous time step to current time step
-                model_input.append(self.dynamics._model_input[i][:-1])
+        Indoor dry-bulb temperature values are from `time_step` - (`lookback` + 1) to `time_step` - 1
+        while other input variables have values from `time_step` - `lookback` to `time_step`. The returned array is a view of a 
+        buffer that is overwritten at the next call.
+        """
 
-            else:
-                # other values are t = (t - lookback) : t = (t)
-                #  i.e. use samples from previous time step to current time step
-                model_input.append(self.dynamics._model_input[i][1:])
-        
-        model_input = np.array(model_input, dtype='float32')
+        model_input = self.dynamics.model_input
+        ix = self.dynamics.input_observation_names.index('indoor_dry_bulb_temperature')
+        self.__dynamics_input[:] = model_input[1:]
+        self.__dynamics_input[:, ix] = model_input[:-1, ix]
 
-        return model_input
+        return self.__dynamics_input.T
 
     def _update_dynamics_input(self):
-        """Updates and returns the input time series for the dynmaics prediction model.
+        """Updates the input time series for the dynamics prediction model with the input variables for the current time step.
 
-        Updates the model input with the input variables for the current time step. 
-        The variables in the input will have length of lookback + 1.
+        Exogenous input variables are read from the normalized columns precomputed in :py:meth:`reset` while other input 
+        variables are read with the observation getters.
         """
 
-        # get relevant observations for the current time step
-        observations = self.observations(include_all=True, normalize=False, periodic_normalization=True)
-
-        # append current time step observations to model input
-        # leave out the oldest set of observations and keep only the previous n
-        # where n is the lookback + 1 (to include current time step observations)
-        self.dynamics._model_input = [
-            l[-self.dynamics.lookback:] + [(observations[k] - min_)/(max_ - min_)] 
-            for l, k, min_, max_ in zip(
-                self.dynamics._model_input, 
-                self.dynamics.input_observation_names, 
-                self.dynamics.input_normalization_minimum, 
-                self.dynamics.input_normalization_maximum
-            )
-        ]
+        time_step = self.time_step
+        self.dynamics.update_model_input(self.__dynamics_input_data[time_step])
+
+        for ix, getter, minimum, maximum in self.__dynamics_input_getters:
+            self.dynamics.set_current_model_input(ix, (getter(time_step) - minimum)/(maximum - minimum))
+
+    def reset(self):
+        """Reset Building to initial state, resets `dynamics` and precomputes normalized exogenous dynamics input variables."""
+
+        super().reset()
+        self.__set_dynamics_input_data()
+
+    def clear_observation_getters(self):
+        super().clear_observation_getters()
+
+        if self.__dynamics_input_getters is not None:
+            getters = self._get_observation_getters()
+            names = self.dynamics.input_observation_names
+            self.__dynamics_input_getters = [(i, getters[names[i]], minimum, maximum) for i, _, minimum, maximum in self.__dynamics_input_getters]
+
+        else:
+            pass
+
+    def __set_dynamics_input_data(self):
+        """Precompute min-max normalized episode time series of exogenous dynamics input variables and
+        compile getters for the other input variables."""
+
+        names = self.dynamics.input_observation_names
+        minimum = self.dynamics.input_normalization_minimum
+        maximum = self.dynamics.input_normalization_maximum
+        exogenous_data = self._get_exogenous_observations_data()
+        periodic_observations = self.get_periodic_observation_metadata()
+        getters = self._get_observation_getters()
+        self.__dynamics_input_data = np.zeros((self.episode_tracker.episode_time_steps, len(names)), dtype='float32')
+        self.__dynamics_input_getters = []
+        self.__dynamics_input = np.zeros((self.dynamics.lookback, len(names)), dtype='float32')
+
+        for i, k in enumerate(names):
+            key, suffix = k.rsplit('_', 1) if k.endswith(('_sin', '_cos')) else (k, None)
+
+            if suffix is not None and key in periodic_observations and key in exogenous_data:
+                sin_x, cos_x = PeriodicNormalization(x_max=max(periodic_observations[key]))*exogenous_data[key]
+                values = sin_x if suffix == 'sin' else cos_x
+
+            elif k in exogenous_data:
+                values = exogenous_data[k].astype('float64')
+
+            else:
+                self.__dynamics_input_getters.append((i, getters[k], minimum[i], maximum[i]))
+                continue
+
+            self.__dynamics_input_data[:, i] = (values - minimum[i])/(maximum[i] - minimum[i])
         
     def update_cooling_demand(self, action: float):
         """Update space cooling demand for current time step.
@@ -2302,17 +2639,38 @@ class OccupantInteractionBuilding(DynamicsBuilding):
         DynamicsBuilding.random_seed.fset(self, seed)
         self.occupant.random_seed = self.random_seed
     
-    def apply_actions(self, **kwargs):
-        super().apply_actions(**kwargs)
+    def update_dynamics(self, prediction: float = None, occupant_interaction: bool = None):
+        """Update dynamics then update set points with the occupant interaction model.
 
-        if self.simulate_dynamics:
+        Parameters
+        ----------
+        prediction: float, optional
+            Indoor dry-bulb temperature prediction parsed to :py:meth:`citylearn.building.DynamicsBuilding.update_dynamics`.
+        occupant_interaction: bool, default: True
+            Whether to call :py:meth:`update_set_points`. Set to `False` when the set points are updated afterwards
+            with a batched occupant prediction e.g. by :py:class:`citylearn.state.DistrictState`.
+        """
+
+        super().update_dynamics(prediction=prediction)
+        occupant_interaction = True if occupant_interaction is None else occupant_interaction
+
+        if self.simulate_dynamics and occupant_interaction:
             self.update_set_points()
         
         else:
             pass
 
-    def update_set_points(self):
-        """Update building indoor temperature dry-bulb temperature, humidity, etc setpoint using occupant interaction model."""
+        self.clear_observations_cache()
+
+    def update_set_points(self, set_point_delta: float = None):
+        """Update building indoor temperature dry-bulb temperature, humidity, etc setpoint using occupant interaction model.
+
+        Parameters
+        ----------
+        set_point_delta: float, optional
+            Occupant set point delta that has already been predicted for the current time step. Predicted with
+            `occupant` if not provided.
+        """
 
         raise NotImplementedError
     
@@ -2355,36 +2713,15 @@ class LogisticRegressionOccupantInteractionBuilding(OccupantInteractionBuilding,
         assert value is None or value >= 0, 'set_point_hold_time_steps must be >= 0'
         self.__set_point_hold_time_steps = np.inf if value is None else int(value)
 
-    def update_set_points(self):
-        current_cooling_set_point = self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step]
-        previous_cooling_set_point = self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step - 1]
-        current_heating_set_point = self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step]
-        previous_heating_set_point = self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step - 1]
-        hvac_mode = self.energy_simulation.hvac_mode[self.time_step]
-
-        if hvac_mode == 1:
-            current_set_point = current_cooling_set_point
-            previous_set_point = previous_cooling_set_point
+    def update_set_points(self, set_point_delta: float = None):
+        hvac_mode, current_set_point, _ = self.__get_set_points()
 
-        elif hvac_mode == 2:
-            current_set_point = current_heating_set_point
-            previous_set_point = previous_heating_set_point
+        if set_point_delta is None:
+            setpoint_delta = self.occupant.predict(x=self.get_occupant_interaction_input())
 
-        elif hvac_mode == 3:
-            raise NotImplementedError(
-                'Setpoint update not implemented for auto hvac mode.' 
-                ' Set hvac_mode in citylearn.Building.energy_simulation to 0 (off), 1 (cooling mode) or 2 (heating mode).'
-            )
-        
         else:
-            pass
+            setpoint_delta = set_point_delta
 
-        current_temperature = self.energy_simulation.indoor_dry_bulb_temperature[self.time_step]
-        previous_temperature = self.energy_simulation.indoor_dry_bulb_temperature[self.time_step - 1]
-        interaction_input = current_temperature
-        delta_input = [[current_set_point, previous_set_point, previous_temperature - previous_set_point]]
-        model_input = (interaction_input, delta_input) 
-        setpoint_delta = self.occupant.predict(x=model_input)
         self.occupant.parameters.occupant_interaction_indoor_dry_bulb_temperature_set_point_delta[self.time_step] = setpoint_delta
 
         if abs(setpoint_delta) > 0.0 and not self.ignore_occupant:
@@ -2416,13 +2753,53 @@ class LogisticRegressionOccupantInteractionBuilding(OccupantInteractionBuilding,
         else:
             pass
 
-    def _get_observations_data(self) -> Mapping[str, Union[float, int]]:
+    def get_occupant_interaction_input(self) -> Tuple[float, List[List[float]]]:
+        """Returns the current indoor dry-bulb temperature that the occupant interaction probability is predicted from
+        and the set point model input sample i.e. current set point, previous set point and previous temperature difference
+        to the previous set point."""
+
+        _, current_set_point, previous_set_point = self.__get_set_points()
+        current_temperature = self.energy_simulation.indoor_dry_bulb_temperature[self.time_step]
+        previous_temperature = self.energy_simulation.indoor_dry_bulb_temperature[self.time_step - 1]
+        interaction_input = current_temperature
+        delta_input = [[current_set_point, previous_set_point, previous_temperature - previous_set_point]]
+
+        return interaction_input, delta_input
+
+    def __get_set_points(self) -> Tuple[int, float, float]:
+        """Returns current HVAC mode and its current and previous set points."""
+
+        current_cooling_set_point = self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step]
+        previous_cooling_set_point = self.energy_simulation.indoor_dry_bulb_temperature_cooling_set_point[self.time_step - 1]
+        current_heating_set_point = self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step]
+        previous_heating_set_point = self.energy_simulation.indoor_dry_bulb_temperature_heating_set_point[self.time_step - 1]
+        hvac_mode = self.energy_simulation.hvac_mode[self.time_step]
+        current_set_point = None
+        previous_set_point = None
+
+        if hvac_mode == 1:
+            current_set_point = current_cooling_set_point
+            previous_set_point = previous_cooling_set_point
+
+        elif hvac_mode == 2:
+            current_set_point = current_heating_set_point
+            previous_set_point = previous_heating_set_point
+
+        elif hvac_mode == 3:
+            raise NotImplementedError(
+                'Setpoint update not implemented for auto hvac mode.' 
+                ' Set hvac_mode in citylearn.Building.energy_simulation to 0 (off), 1 (cooling mode) or 2 (heating mode).'
+            )
+        
+        else:
+            pass
+
+        return hvac_mode, current_set_point, previous_set_point
+
+    def _get_observation_getters(self) -> Mapping[str, Callable[[int], Union[float, int]]]:
         return {
-            **super()._get_observations_data(),
-            **{
-                k.lstrip('_'): self.occupant.parameters.__getattr__(k.lstrip('_'))[self.time_step] 
-                for k, v in vars(self.occupant.parameters).items() if isinstance(v, np.ndarray)
-            }
+            **super()._get_observation_getters(),
+            **self._get_time_series_observation_getters(self.occupant.parameters),
         }
 
     def _get_observation_space_limits_data(self) -> Mapping[str, List[Union[float, int]]]:
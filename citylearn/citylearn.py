@@ -5,16 +5,20 @@ import importlib
 import logging
 import os
 from pathlib import Path
-from typing import Any, List, Mapping, Tuple, Union
+from typing import Any, Callable, List, Mapping, Tuple, Union
 from gymnasium import Env, spaces
 import numpy as np
 import pandas as pd
 from citylearn.base import Environment, EpisodeTracker
 from citylearn.building import Building, DynamicsBuilding
 from citylearn.cost_function import CostFunction
-from citylearn.data import DataSet, EnergySimulation, CarbonIntensity, LogisticRegressionOccupantParameters, Pricing, TOLERANCE, Weather
+from citylearn.data import DataFileCache, DataSet, EnergySimulation, CarbonIntensity, LogisticRegressionOccupantParameters, Pricing, TOLERANCE, Weather
 from citylearn.energy_model import Battery, PV
+from citylearn.kpi import KPITracker
+from citylearn.profiler import StageProfiler
 from citylearn.reward_function import RewardFunction
+from citylearn.snapshot import StateSnapshot
+from citylearn.state import DistrictState
 from citylearn.utilities import read_json
 
 LOGGER = logging.getLogger()
@@ -101,6 +105,22 @@ class CityLearnEnv(Environment, Env):
         each building independently in a :code:`List[bool]`. Will override :code:`pv` defined in the :code:`schema`.
     random_seed: int, optional
         Pseudorandom number generator seed for repeatable results.
+    data_cache: Mapping[str, Any], optional
+        Mutable mapping used to store and reuse parsed data files and sizing data across environments that are 
+        initialized from the same `schema` e.g. the copies in :py:class:`citylearn.vector_env.CityLearnVectorEnv`. 
+        Each environment still constructs its own time series arrays from the cached values.
+    data_file_cache: Union[bool, str, Path, DataFileCache], optional
+        Whether to read building, weather, carbon intensity, pricing and occupant parameter CSV files through an on-disk
+        :py:class:`citylearn.data.DataFileCache` of typed binary columns. If a directory is provided, the cached files are stored in it
+        otherwise, they are stored in :py:data:`citylearn.data.CACHE_DIRECTORY`. Will override :code:`data_file_cache` defined in the :code:`schema`.
+    binary_pv_sizing_data: bool, optional
+        Whether to autosize PV systems from the typed binary copy of the PV sizing data columns read by
+        :py:meth:`citylearn.data.EnergySimulation.get_pv_sizing_data` with `binary` set to `True`. The sampled
+        :py:attr:`citylearn.energy_model.PV.autosize_config` then only includes the
+        :py:attr:`citylearn.data.EnergySimulation.PV_SIZING_COLUMNS`. Will override :code:`binary_pv_sizing_data` defined in the :code:`schema`.
+    profiler: Union[bool, StageProfiler], optional
+        Whether to record the wall time and call count of the stages of :meth:`step`, :meth:`reset` and :meth:`evaluate` in
+        :py:attr:`profiler`. Profiling is disabled by default.
 
     Other Parameters
     ----------------
@@ -111,6 +131,8 @@ class CityLearnEnv(Environment, Env):
     -----
     Parameters passed to `citylearn.citylearn.CityLearnEnv.__init__` that are also defined in `schema` will override their `schema` definition.
     """
+
+    CITYLEARN_CHALLENGE_COMFORT_BAND = 1.0
     
     def __init__(self, 
         schema: Union[str, Path, Mapping[str, Any]], root_directory: Union[str, Path] = None, buildings: Union[List[Building], List[str], List[int]] = None, 
@@ -118,10 +140,15 @@ class CityLearnEnv(Environment, Env):
         random_episode_split: bool = None, seconds_per_time_step: float = None, reward_function: Union[RewardFunction, str] = None, reward_function_kwargs: Mapping[str, Any] = None, 
         central_agent: bool = None, shared_observations: List[str] = None, active_observations: Union[List[str], List[List[str]]] = None, 
         inactive_observations: Union[List[str], List[List[str]]] = None, active_actions: Union[List[str], List[List[str]]] = None, 
-        inactive_actions: Union[List[str], List[List[str]]] = None, simulate_power_outage: bool = None, solar_generation: bool = None, random_seed: int = None, **kwargs: Any
+        inactive_actions: Union[List[str], List[List[str]]] = None, simulate_power_outage: bool = None, solar_generation: bool = None, random_seed: int = None, 
+        data_cache: Mapping[str, Any] = None, data_file_cache: Union[bool, str, Path, DataFileCache] = None, binary_pv_sizing_data: bool = None, 
+        profiler: Union[bool, StageProfiler] = None, **kwargs: Any
     ):
+        self.profiler = profiler
         self.schema = schema
         self.__rewards = None
+        self.__district_state = None
+        self.__kpi_tracker = None
         self.buildings = []
         self.random_seed = self.schema['random_seed'] if random_seed is None else random_seed
         root_directory, buildings, episode_time_steps, rolling_episode_split, random_episode_split, \
@@ -146,6 +173,9 @@ class CityLearnEnv(Environment, Env):
                 simulate_power_outage=simulate_power_outage,
                 solar_generation=solar_generation,
                 random_seed=self.random_seed,
+                data_cache=data_cache,
+                data_file_cache=data_file_cache,
+                binary_pv_sizing_data=binary_pv_sizing_data,
             )
         self.root_directory = root_directory
         self.buildings = buildings
@@ -193,6 +223,24 @@ class CityLearnEnv(Environment, Env):
 
         return self.__buildings
     
+    @property
+    def district_state(self) -> DistrictState:
+        """Struct-of-arrays store of the current episode's building and device time series."""
+
+        return self.__district_state
+
+    @property
+    def kpi_tracker(self) -> KPITracker:
+        """Streaming accumulator of the current episode's :py:meth:`evaluate` cost functions."""
+
+        return self.__kpi_tracker
+
+    @property
+    def profiler(self) -> StageProfiler:
+        """Cumulative wall time and call count of :meth:`step`, :meth:`reset` and :meth:`evaluate` stages. `None` if profiling is disabled."""
+
+        return self.__profiler
+    
     @property
     def time_steps(self) -> int:
         """Number of time steps in current episode split."""
@@ -346,29 +394,48 @@ class CityLearnEnv(Environment, Env):
         is returned where each sublist is a list of 1 building's observation values and the sublist in the same order as `buildings`.
         """
 
+        observations = self.__update_observations_buffer()
+
         if self.central_agent:
-            observations = []
-            shared_observations = []
+            observations = [observations[self.__central_observations_index].tolist()]
+        
+        else:
+            observations = [observations[s].tolist() for s in self.__observations_slices]
+        
+        return observations
+    
+    @property
+    def observations_array(self) -> np.ndarray:
+        """Observations at current time step as a float32 array of shape (`n_agents`, `n_observations`).
 
-            for i, b in enumerate(self.buildings):
-                for k, v in b.observations(normalize=False, periodic_normalization=False, check_limits=True).items():
-                    if i == 0 or k not in self.shared_observations or k not in shared_observations:
-                        observations.append(v)
-                    
-                    else:
-                        pass
+        Built from the same preallocated district buffer as :py:attr:`observations` without constructing any dictionaries.
 
-                    if k in self.shared_observations and k not in shared_observations:
-                        shared_observations.append(k)
-                    
-                    else:
-                        pass
+        Notes
+        -----
+        If `central_agent` is True, the array has 1 row that contains all building observation values with `shared_observations`
+        only included once as in :py:attr:`observations`. If `central_agent` is False, the array has 1 row per building. When buildings 
+        have different numbers of active observations, rows are right-padded with `np.nan`. A new array is returned on every call.
+        """
+
+        observations = self.__update_observations_buffer()
 
-            observations = [observations]
+        if self.central_agent:
+            observations = observations[self.__central_observations_index][np.newaxis, :]
         
         else:
-            observations = [list(b.observations(normalize=False, periodic_normalization=False, check_limits=True).values()) for b in self.buildings]
-        
+            sizes = [s.stop - s.start for s in self.__observations_slices]
+
+            if len(set(sizes)) <= 1:
+                observations = observations.reshape(len(sizes), -1).copy()
+            
+            else:
+                padded_observations = np.full((len(sizes), max(sizes)), np.nan, dtype='float32')
+
+                for i, (s, size) in enumerate(zip(self.__observations_slices, sizes)):
+                    padded_observations[i, :size] = observations[s]
+
+                observations = padded_observations
+
         return observations
 
     @property
@@ -382,24 +449,81 @@ class CityLearnEnv(Environment, Env):
         is returned where each sublist is a list of 1 building's observation names and the sublist in the same order as `buildings`.
         """
 
+        self.__set_observations_layout()
+        observation_names = [n for b in self.buildings for n in b.active_observations]
+
         if self.central_agent:
-            observation_names = []
+            observation_names = [[observation_names[i] for i in self.__central_observations_index]]
+        
+        else:
+            observation_names = [observation_names[s] for s in self.__observations_slices]
 
-            for i, b in enumerate(self.buildings):
-                for k, _ in b.observations(normalize=False, periodic_normalization=False).items():
-                    if i == 0 or k not in self.shared_observations or k not in observation_names:
-                        observation_names.append(k)
-                    
-                    else:
-                        pass
+        return observation_names
+    
+    def __get_district_time_series(self, name: str) -> np.ndarray:
+        """Returns read-only view of district time series `name` up to and including current `time_step` from :py:attr:`kpi_tracker`."""
+
+        values = self.kpi_tracker.district_time_series[name][:self.time_step + 1]
+        values.flags.writeable = False
+
+        return values
+
+    def __update_observations_buffer(self) -> np.ndarray:
+        """Writes current time step observations of all buildings into the preallocated district observations buffer."""
+
+        self.__set_observations_layout()
 
-            observation_names = [observation_names]
+        for b, s in zip(self.buildings, self.__observations_slices):
+            b.get_observations_array(out=self.__observations_buffer[s])
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for b in self.buildings:
+                _ = b.observations(normalize=False, periodic_normalization=False, check_limits=True)
         
         else:
-            observation_names = [list(b.observations().keys()) for b in self.buildings]
+            pass
 
-        return observation_names
+        return self.__observations_buffer
     
+    def __set_observations_layout(self):
+        """Compiles the district observations buffer layout and resolves central agent shared observations once.
+        
+        The layout is recompiled after :py:meth:`reset` or when `buildings`, `central_agent` or `shared_observations` change.
+        """
+
+        if self.__observations_buffer is not None:
+            return
+        
+        else:
+            pass
+
+        slices = []
+        central_index = []
+        shared_observations = []
+        start = 0
+
+        for i, b in enumerate(self.buildings):
+            for j, k in enumerate(b.active_observations):
+                if i == 0 or k not in self.shared_observations or k not in shared_observations:
+                    central_index.append(start + j)
+                
+                else:
+                    pass
+
+                if k in self.shared_observations and k not in shared_observations:
+                    shared_observations.append(k)
+
+                else:
+                    pass
+
+            stop = start + len(b.active_observations)
+            slices.append(slice(start, stop))
+            start = stop
+
+        self.__observations_slices = slices
+        self.__central_observations_index = np.array(central_index, dtype=int)
+        self.__observations_buffer = np.zeros(start, dtype='float32')
+
     @property
     def action_names(self) -> List[List[str]]:
         """Names of received actions.
@@ -428,312 +552,241 @@ class CityLearnEnv(Environment, Env):
     def net_electricity_consumption_emission_without_storage_and_partial_load_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_emission_without_storage_and_partial_load_and_pv` time series, in [kg_co2]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_emission_without_storage_and_partial_load_and_pv 
-            if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_emission_without_storage_and_pv 
-                    for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_emission_without_storage_and_partial_load_and_pv')
 
     @property
     def net_electricity_consumption_cost_without_storage_and_partial_load_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_cost_without_storage_and_partial_load_and_pv` time series, in [$]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_cost_without_storage_and_partial_load_and_pv 
-                if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_cost_without_storage_and_pv 
-                    for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_cost_without_storage_and_partial_load_and_pv')
 
     @property
     def net_electricity_consumption_without_storage_and_partial_load_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_without_storage_and_partial_load_and_pv` time series, in [kWh]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_without_storage_and_partial_load_and_pv 
-                if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_without_storage_and_pv 
-                    for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-    
+        return self.__get_district_time_series('net_electricity_consumption_without_storage_and_partial_load_and_pv')
 
     @property
     def net_electricity_consumption_emission_without_storage_and_partial_load(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_emission_without_storage_and_partial_load` time series, in [kg_co2]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_emission_without_storage_and_partial_load 
-            if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_emission_without_storage
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_emission_without_storage_and_partial_load')
 
     @property
     def net_electricity_consumption_cost_without_storage_and_partial_load(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_cost_without_storage_and_partial_load` time series, in [$]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_cost_without_storage_and_partial_load 
-            if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_cost_without_storage
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_cost_without_storage_and_partial_load')
 
     @property
     def net_electricity_consumption_without_storage_and_partial_load(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_without_storage_and_partial_load` time series, in [kWh]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_without_storage_and_partial_load
-            if isinstance(b, DynamicsBuilding) else b.net_electricity_consumption_without_storage
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-    
+        return self.__get_district_time_series('net_electricity_consumption_without_storage_and_partial_load')
+
     @property
     def net_electricity_consumption_emission_without_storage_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_emission_without_storage_and_pv` time series, in [kg_co2]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_emission_without_storage_and_pv 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_emission_without_storage_and_pv')
 
     @property
     def net_electricity_consumption_cost_without_storage_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_cost_without_storage_and_pv` time series, in [$]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_cost_without_storage_and_pv 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_cost_without_storage_and_pv')
 
     @property
     def net_electricity_consumption_without_storage_and_pv(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_without_storage_and_pv` time series, in [kWh]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_without_storage_and_pv 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-    
+        return self.__get_district_time_series('net_electricity_consumption_without_storage_and_pv')
 
     @property
     def net_electricity_consumption_emission_without_storage(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_emission_without_storage` time series, in [kg_co2]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_emission_without_storage 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_emission_without_storage')
 
     @property
     def net_electricity_consumption_cost_without_storage(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_cost_without_storage` time series, in [$]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_cost_without_storage
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('net_electricity_consumption_cost_without_storage')
 
     @property
     def net_electricity_consumption_without_storage(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_without_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([
-            b.net_electricity_consumption_without_storage
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-
-    @property
-    def net_electricity_consumption_emission_without_storage(self) -> np.ndarray:
-        """Summed `Building.net_electricity_consumption_emission_without_storage` time series, in [kg_co2]."""
-
-        return pd.DataFrame([
-            b.net_electricity_consumption_emission_without_storage 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).tolist()
+        return self.__get_district_time_series('net_electricity_consumption_without_storage')
 
     @property
-    def net_electricity_consumption_cost_without_storage(self) -> np.ndarray:
-        """Summed `Building.net_electricity_consumption_cost_without_storage` time series, in [$]."""
-
-        return pd.DataFrame([
-            b.net_electricity_consumption_cost_without_storage 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-
-    @property
-    def net_electricity_consumption_without_storage(self) -> np.ndarray:
-        """Summed `Building.net_electricity_consumption_without_storage` time series, in [kWh]."""
-
-        return pd.DataFrame([
-            b.net_electricity_consumption_without_storage 
-                for b in self.buildings
-        ]).sum(axis = 0, min_count = 1).to_numpy()
-
-    @property
-    def net_electricity_consumption_emission(self) -> List[float]:
+    def net_electricity_consumption_emission(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_emission` time series, in [kg_co2]."""
 
-        return self.__net_electricity_consumption_emission
+        return self.__get_district_time_series('net_electricity_consumption_emission')
 
     @property
-    def net_electricity_consumption_cost(self) -> List[float]:
+    def net_electricity_consumption_cost(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption_cost` time series, in [$]."""
 
-        return self.__net_electricity_consumption_cost
+        return self.__get_district_time_series('net_electricity_consumption_cost')
 
     @property
-    def net_electricity_consumption(self) -> List[float]:
+    def net_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.net_electricity_consumption` time series, in [kWh]."""
 
-        return self.__net_electricity_consumption
+        return self.__get_district_time_series('net_electricity_consumption')
 
     @property
     def cooling_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.cooling_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.cooling_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('cooling_electricity_consumption')
 
     @property
     def heating_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.heating_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.heating_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('heating_electricity_consumption')
 
     @property
     def dhw_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.dhw_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.dhw_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('dhw_electricity_consumption')
 
     @property
     def cooling_storage_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.cooling_storage_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.cooling_storage_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('cooling_storage_electricity_consumption')
 
     @property
     def heating_storage_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.heating_storage_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.heating_storage_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('heating_storage_electricity_consumption')
 
     @property
     def dhw_storage_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.dhw_storage_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.dhw_storage_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('dhw_storage_electricity_consumption')
 
     @property
     def electrical_storage_electricity_consumption(self) -> np.ndarray:
         """Summed `Building.electrical_storage_electricity_consumption` time series, in [kWh]."""
 
-        return pd.DataFrame([b.electrical_storage_electricity_consumption for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('electrical_storage_electricity_consumption')
 
     @property
     def energy_from_cooling_device_to_cooling_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_cooling_device_to_cooling_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_cooling_device_to_cooling_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_cooling_device_to_cooling_storage')
 
     @property
     def energy_from_heating_device_to_heating_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_heating_device_to_heating_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_heating_device_to_heating_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_heating_device_to_heating_storage')
 
     @property
     def energy_from_dhw_device_to_dhw_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_dhw_device_to_dhw_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_dhw_device_to_dhw_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_dhw_device_to_dhw_storage')
 
     @property
     def energy_to_electrical_storage(self) -> np.ndarray:
         """Summed `Building.energy_to_electrical_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_to_electrical_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_to_electrical_storage')
 
     @property
     def energy_from_cooling_device(self) -> np.ndarray:
         """Summed `Building.energy_from_cooling_device` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_cooling_device for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_cooling_device')
 
     @property
     def energy_from_heating_device(self) -> np.ndarray:
         """Summed `Building.energy_from_heating_device` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_heating_device for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_heating_device')
 
     @property
     def energy_from_dhw_device(self) -> np.ndarray:
         """Summed `Building.energy_from_dhw_device` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_dhw_device for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
-    
+        return self.__get_district_time_series('energy_from_dhw_device')
+
     @property
     def energy_to_non_shiftable_load(self) -> np.ndarray:
         """Summed `Building.energy_to_non_shiftable_load` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_to_non_shiftable_load for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_to_non_shiftable_load')
 
     @property
     def energy_from_cooling_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_cooling_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_cooling_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_cooling_storage')
 
     @property
     def energy_from_heating_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_heating_storage` time series, in [kWh]."""
-        
-        return pd.DataFrame([b.energy_from_heating_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+
+        return self.__get_district_time_series('energy_from_heating_storage')
 
     @property
     def energy_from_dhw_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_dhw_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_dhw_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_dhw_storage')
 
     @property
     def energy_from_electrical_storage(self) -> np.ndarray:
         """Summed `Building.energy_from_electrical_storage` time series, in [kWh]."""
 
-        return pd.DataFrame([b.energy_from_electrical_storage for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('energy_from_electrical_storage')
 
     @property
     def cooling_demand(self) -> np.ndarray:
         """Summed `Building.cooling_demand`, in [kWh]."""
 
-        return pd.DataFrame([b.cooling_demand for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('cooling_demand')
 
     @property
     def heating_demand(self) -> np.ndarray:
         """Summed `Building.heating_demand`, in [kWh]."""
 
-        return pd.DataFrame([b.heating_demand for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('heating_demand')
 
     @property
     def dhw_demand(self) -> np.ndarray:
         """Summed `Building.dhw_demand`, in [kWh]."""
 
-        return pd.DataFrame([b.dhw_demand for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('dhw_demand')
 
     @property
     def non_shiftable_load(self) -> np.ndarray:
         """Summed `Building.non_shiftable_load`, in [kWh]."""
 
-        return pd.DataFrame([b.non_shiftable_load for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('non_shiftable_load')
 
     @property
     def solar_generation(self) -> np.ndarray:
-        """Summed `Building.solar_generation, in [kWh]`."""
+        """Summed `Building.solar_generation` time series, in [kWh]."""
 
-        return pd.DataFrame([b.solar_generation for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()
+        return self.__get_district_time_series('solar_generation')
 
     @property
     def power_outage(self) -> np.ndarray:
         """Time series of number of buildings experiencing power outage."""
 
-        return pd.DataFrame([b.power_outage_signal for b in self.buildings]).sum(axis = 0, min_count = 1).to_numpy()[:self.time_step + 1]
+        return self.__get_district_time_series('power_outage')
 
     @schema.setter
     def schema(self, schema: Union[str, Path, Mapping[str, Any]]):
@@ -746,6 +799,7 @@ class CityLearnEnv(Environment, Env):
     @buildings.setter
     def buildings(self, buildings: List[Building]):
         self.__buildings = buildings
+        self.__observations_buffer = None
 
     @Environment.episode_tracker.setter
     def episode_tracker(self, episode_tracker: EpisodeTracker):
@@ -770,13 +824,26 @@ class CityLearnEnv(Environment, Env):
     def reward_function(self, reward_function: RewardFunction):
         self.__reward_function = reward_function
 
+    @profiler.setter
+    def profiler(self, profiler: Union[bool, StageProfiler]):
+        if profiler is None or profiler is False:
+            self.__profiler = None
+
+        elif profiler is True:
+            self.__profiler = StageProfiler()
+
+        else:
+            self.__profiler = profiler
+
     @central_agent.setter
     def central_agent(self, central_agent: bool):
         self.__central_agent = central_agent
+        self.__observations_buffer = None
 
     @shared_observations.setter
     def shared_observations(self, shared_observations: List[str]):
         self.__shared_observations = self.get_default_shared_observations() if shared_observations is None else shared_observations
+        self.__observations_buffer = None
 
     @Environment.random_seed.setter
     def random_seed(self, seed: int):
@@ -848,22 +915,32 @@ class CityLearnEnv(Environment, Env):
             Override :meth"`get_info` to get custom key-value pairs in `info`.
         """
 
+        profiler = self.profiler
+
+        if profiler is not None:
+            step_start = start = profiler.start()
+        
+        else:
+            pass
+
         self.next_time_step()
+        start = None if profiler is None else profiler.record('step;next_time_step', start)
         actions = self._parse_actions(actions)
+        start = None if profiler is None else profiler.record('step;parse_actions', start)
 
-        for building, building_actions in zip(self.buildings, actions):
-            building.apply_actions(**building_actions)
-
+        self.district_state.apply_actions(actions, profiler=profiler, stage='step;apply_actions')
+        start = None if profiler is None else profiler.record('step;apply_actions', start)
         self.update_variables()
+        start = None if profiler is None else profiler.record('step;update_variables', start)
 
         # NOTE:
-        # This call to retrieve each building's observation dictionary is an expensive call especially since the observations 
-        # are retrieved again to send to agent but the observations in dict form is needed for the reward function to easily
-        # extract building-level values. Can't think of a better way to handle this without giving the reward direct access to
-        # env, which is not the best design for competition integrity sake. Will revisit the building.observations() function
-        # to see how it can be optimized.
+        # The observations in dict form are needed for the reward function to easily extract building-level values without
+        # giving the reward direct access to env, which is not the best design for competition integrity sake. The underlying
+        # observations data is cached per building and time step so the observations returned to the agent below reuse it.
         reward_observations = [b.observations(include_all=True, normalize=False, periodic_normalization=False) for b in self.buildings]
+        start = None if profiler is None else profiler.record('step;reward_observations', start)
         reward = self.reward_function.calculate(observations=reward_observations)
+        start = None if profiler is None else profiler.record('step;reward_function', start)
         self.__rewards.append(reward)
 
         # store episode reward summary
@@ -878,8 +955,20 @@ class CityLearnEnv(Environment, Env):
 
         else:
             pass
+
+        if profiler is not None:
+            start = profiler.record('step;episode_rewards', start)
+            observations = self.observations
+            start = profiler.record('step;observations', start)
+            info = self.get_info()
+            profiler.record('step;get_info', start)
+            profiler.record('step', step_start)
+        
+        else:
+            observations = self.observations
+            info = self.get_info()
         
-        return self.observations, reward, self.terminated, self.truncated, self.get_info()
+        return observations, reward, self.terminated, self.truncated, info
 
     def get_info(self) -> Mapping[Any, Any]:
         """Other information to return from the `citylearn.CityLearnEnv.step` function."""
@@ -942,7 +1031,7 @@ class CityLearnEnv(Environment, Env):
         data = self.evaluate(
             control_condition=EvaluationCondition.WITH_STORAGE_AND_PARTIAL_LOAD_AND_PV,
             baseline_condition=EvaluationCondition.WITHOUT_STORAGE_AND_PARTIAL_LOAD_BUT_WITH_PV,
-            comfort_band=1.0,
+            comfort_band=self.CITYLEARN_CHALLENGE_COMFORT_BAND,
         )
         data = data[data['level']=='district'].set_index('cost_function').to_dict('index')
         evaluation = {k: {**v, 'value': data[k]['value']} for k, v in evaluation.items()}
@@ -988,94 +1077,40 @@ class CityLearnEnv(Environment, Env):
         is the value when none of the storages and partial load cooling and heating devices in the environment are actively controlled.
         """
 
-        # lambda functions to get building or district level properties w.r.t. evaluation condition
-        get_net_electricity_consumption = lambda x, c: getattr(x, f'net_electricity_consumption{c.value}')
-        get_net_electricity_consumption_cost = lambda x, c: getattr(x, f'net_electricity_consumption_cost{c.value}')
-        get_net_electricity_consumption_emission = lambda x, c: getattr(x, f'net_electricity_consumption_emission{c.value}')
-
+        start = None if self.profiler is None else self.profiler.start()
         comfort_band = EnergySimulation.DEFUALT_COMFORT_BAND if comfort_band is None else comfort_band
-        building_level = []
+
+        # set default evaluation conditions w.r.t. first building type
+        if len(self.buildings) == 0 or isinstance(self.buildings[0], DynamicsBuilding):
+            control_condition = EvaluationCondition.WITH_STORAGE_AND_PARTIAL_LOAD_AND_PV if control_condition is None else control_condition
+            baseline_condition = EvaluationCondition.WITHOUT_STORAGE_AND_PARTIAL_LOAD_BUT_WITH_PV if baseline_condition is None else baseline_condition
+
+        else:
+            control_condition = EvaluationCondition.WITH_STORAGE_AND_PV if control_condition is None else control_condition
+            baseline_condition = EvaluationCondition.WITHOUT_STORAGE_BUT_WITH_PV if baseline_condition is None else baseline_condition
+
+        # use streamed cost functions when they are up to date otherwise recalculate from time series history
+        if self.kpi_tracker is not None and self.kpi_tracker.is_available(
+            self.time_step, control_condition.value, baseline_condition.value, comfort_band=comfort_band
+        ) and self.time_steps in self.kpi_tracker.peak_windows:
+            building_cost_functions = self.kpi_tracker.get_building_cost_functions(
+                control_condition.value, baseline_condition.value, comfort_band
+            )
+            district_cost_functions = self.kpi_tracker.get_district_cost_functions(
+                control_condition.value, baseline_condition.value, self.time_steps
+            )
+
+        else:
+            building_cost_functions = [
+                self._get_building_cost_functions(b, control_condition, baseline_condition, comfort_band) for b in self.buildings
+            ]
+            district_cost_functions = self._get_district_cost_functions(control_condition, baseline_condition)
         
-        for b in self.buildings:
-            if isinstance(b, DynamicsBuilding):
-                control_condition = EvaluationCondition.WITH_STORAGE_AND_PARTIAL_LOAD_AND_PV if control_condition is None else control_condition
-                baseline_condition = EvaluationCondition.WITHOUT_STORAGE_AND_PARTIAL_LOAD_BUT_WITH_PV if baseline_condition is None else baseline_condition
-            
-            else:
-                control_condition = EvaluationCondition.WITH_STORAGE_AND_PV if control_condition is None else control_condition
-                baseline_condition = EvaluationCondition.WITHOUT_STORAGE_BUT_WITH_PV if baseline_condition is None else baseline_condition
-
-            discomfort_kwargs = {
-                'indoor_dry_bulb_temperature': b.indoor_dry_bulb_temperature,
-                'dry_bulb_temperature_cooling_set_point': b.indoor_dry_bulb_temperature_cooling_set_point,
-                'dry_bulb_temperature_heating_set_point': b.indoor_dry_bulb_temperature_heating_set_point,
-                'band': b.comfort_band if comfort_band is None else comfort_band,
-                'occupant_count': b.occupant_count,
-            }
-            unmet, cold, hot,\
-                cold_minimum_delta, cold_maximum_delta, cold_average_delta,\
-                    hot_minimum_delta, hot_maximum_delta, hot_average_delta =\
-                        CostFunction.discomfort(**discomfort_kwargs)
-            expected_energy = b.cooling_demand + b.heating_demand + b.dhw_demand + b.non_shiftable_load
-            served_energy = b.energy_from_cooling_device + b.energy_from_cooling_storage\
-                + b.energy_from_heating_device + b.energy_from_heating_storage\
-                    + b.energy_from_dhw_device + b.energy_from_dhw_storage\
-                        + b.energy_to_non_shiftable_load
-            building_level_ = pd.DataFrame([{
-                'cost_function': 'electricity_consumption_total',
-                'value': CostFunction.electricity_consumption(get_net_electricity_consumption(b, control_condition))[-1]/\
-                    CostFunction.electricity_consumption(get_net_electricity_consumption(b, baseline_condition))[-1],
-            }, {
-                'cost_function': 'zero_net_energy',
-                'value': CostFunction.zero_net_energy(get_net_electricity_consumption(b, control_condition))[-1]/\
-                    CostFunction.zero_net_energy(get_net_electricity_consumption(b, baseline_condition))[-1],
-            }, {
-                'cost_function': 'carbon_emissions_total',
-                'value': CostFunction.carbon_emissions(get_net_electricity_consumption_emission(b, control_condition))[-1]/\
-                    CostFunction.carbon_emissions(get_net_electricity_consumption_emission(b, baseline_condition))[-1]\
-                        if sum(b.carbon_intensity.carbon_intensity) != 0 else None,
-            }, {
-                'cost_function': 'cost_total',
-                'value': CostFunction.cost(get_net_electricity_consumption_cost(b, control_condition))[-1]/\
-                    CostFunction.cost(get_net_electricity_consumption_cost(b, baseline_condition))[-1]\
-                        if sum(b.pricing.electricity_pricing) != 0 else None,
-            }, {
-                'cost_function': 'discomfort_proportion',
-                'value': unmet[-1],
-            }, {
-                'cost_function': 'discomfort_cold_proportion',
-                'value': cold[-1],
-            }, {
-                'cost_function': 'discomfort_hot_proportion',
-                'value': hot[-1],
-            }, {
-                'cost_function': 'discomfort_cold_delta_minimum',
-                'value': cold_minimum_delta[-1],
-            }, {
-                'cost_function': 'discomfort_cold_delta_maximum',
-                'value': cold_maximum_delta[-1],
-            }, {
-                'cost_function': 'discomfort_cold_delta_average',
-                'value': cold_average_delta[-1],
-            }, {
-                'cost_function': 'discomfort_hot_delta_minimum',
-                'value': hot_minimum_delta[-1],
-            }, {
-                'cost_function': 'discomfort_hot_delta_maximum',
-                'value': hot_maximum_delta[-1],
-            }, {
-                'cost_function': 'discomfort_hot_delta_average',
-                'value': hot_average_delta[-1],
-            }, {
-                'cost_function': 'one_minus_thermal_resilience_proportion',
-                'value': CostFunction.one_minus_thermal_resilience(power_outage=b.power_outage_signal, **discomfort_kwargs)[-1],
-            }, {
-                'cost_function': 'power_outage_normalized_unserved_energy_total',
-                'value': CostFunction.normalized_unserved_energy(expected_energy, served_energy, power_outage=b.power_outage_signal)[-1]
-            }, {
-                'cost_function': 'annual_normalized_unserved_energy_total',
-                'value': CostFunction.normalized_unserved_energy(expected_energy, served_energy)[-1]
-            }])
+        ## building level
+        building_level = []
+
+        for b, c in zip(self.buildings, building_cost_functions):
+            building_level_ = pd.DataFrame(c)
             building_level_['name'] = b.name
             building_level.append(building_level_)
 
@@ -1083,11 +1118,114 @@ class CityLearnEnv(Environment, Env):
         building_level['level'] = 'building'
 
         ## district level
-        # set default evaluation conditions
-        control_condition = EvaluationCondition.WITH_STORAGE_AND_PARTIAL_LOAD_AND_PV if control_condition is None else control_condition
-        baseline_condition = EvaluationCondition.WITHOUT_STORAGE_AND_PARTIAL_LOAD_BUT_WITH_PV if baseline_condition is None else baseline_condition
+        district_level = pd.DataFrame(district_cost_functions)
+        district_level = pd.concat([district_level, building_level], ignore_index=True, sort=False)
+        district_level = district_level.groupby(['cost_function'])[['value']].mean().reset_index()
+        district_level['name'] = 'District'
+        district_level['level'] = 'district'
+        cost_functions = pd.concat([district_level, building_level], ignore_index=True, sort=False)
+
+        if self.profiler is not None:
+            self.profiler.record('evaluate', start)
 
-        district_level = pd.DataFrame([{
+        else:
+            pass
+
+        return cost_functions
+
+    def _get_building_cost_functions(
+        self, building: Building, control_condition: EvaluationCondition, baseline_condition: EvaluationCondition, comfort_band: float
+    ) -> List[Mapping[str, Union[str, float]]]:
+        """Returns building-level :py:meth:`evaluate` cost functions calculated from `building` time series history."""
+
+        # lambda functions to get building level properties w.r.t. evaluation condition
+        get_net_electricity_consumption = lambda x, c: getattr(x, f'net_electricity_consumption{c.value}')
+        get_net_electricity_consumption_cost = lambda x, c: getattr(x, f'net_electricity_consumption_cost{c.value}')
+        get_net_electricity_consumption_emission = lambda x, c: getattr(x, f'net_electricity_consumption_emission{c.value}')
+
+        b = building
+        discomfort_kwargs = {
+            'indoor_dry_bulb_temperature': b.indoor_dry_bulb_temperature,
+            'dry_bulb_temperature_cooling_set_point': b.indoor_dry_bulb_temperature_cooling_set_point,
+            'dry_bulb_temperature_heating_set_point': b.indoor_dry_bulb_temperature_heating_set_point,
+            'band': b.comfort_band if comfort_band is None else comfort_band,
+            'occupant_count': b.occupant_count,
+        }
+        unmet, cold, hot,\
+            cold_minimum_delta, cold_maximum_delta, cold_average_delta,\
+                hot_minimum_delta, hot_maximum_delta, hot_average_delta =\
+                    CostFunction.discomfort(**discomfort_kwargs)
+        expected_energy = b.cooling_demand + b.heating_demand + b.dhw_demand + b.non_shiftable_load
+        served_energy = b.energy_from_cooling_device + b.energy_from_cooling_storage\
+            + b.energy_from_heating_device + b.energy_from_heating_storage\
+                + b.energy_from_dhw_device + b.energy_from_dhw_storage\
+                    + b.energy_to_non_shiftable_load
+        
+        return [{
+            'cost_function': 'electricity_consumption_total',
+            'value': CostFunction.electricity_consumption(get_net_electricity_consumption(b, control_condition))[-1]/\
+                CostFunction.electricity_consumption(get_net_electricity_consumption(b, baseline_condition))[-1],
+        }, {
+            'cost_function': 'zero_net_energy',
+            'value': CostFunction.zero_net_energy(get_net_electricity_consumption(b, control_condition))[-1]/\
+                CostFunction.zero_net_energy(get_net_electricity_consumption(b, baseline_condition))[-1],
+        }, {
+            'cost_function': 'carbon_emissions_total',
+            'value': CostFunction.carbon_emissions(get_net_electricity_consumption_emission(b, control_condition))[-1]/\
+                CostFunction.carbon_emissions(get_net_electricity_consumption_emission(b, baseline_condition))[-1]\
+                    if sum(b.carbon_intensity.carbon_intensity) != 0 else None,
+        }, {
+            'cost_function': 'cost_total',
+            'value': CostFunction.cost(get_net_electricity_consumption_cost(b, control_condition))[-1]/\
+                CostFunction.cost(get_net_electricity_consumption_cost(b, baseline_condition))[-1]\
+                    if sum(b.pricing.electricity_pricing) != 0 else None,
+        }, {
+            'cost_function': 'discomfort_proportion',
+            'value': unmet[-1],
+        }, {
+            'cost_function': 'discomfort_cold_proportion',
+            'value': cold[-1],
+        }, {
+            'cost_function': 'discomfort_hot_proportion',
+            'value': hot[-1],
+        }, {
+            'cost_function': 'discomfort_cold_delta_minimum',
+            'value': cold_minimum_delta[-1],
+        }, {
+            'cost_function': 'discomfort_cold_delta_maximum',
+            'value': cold_maximum_delta[-1],
+        }, {
+            'cost_function': 'discomfort_cold_delta_average',
+            'value': cold_average_delta[-1],
+        }, {
+            'cost_function': 'discomfort_hot_delta_minimum',
+            'value': hot_minimum_delta[-1],
+        }, {
+            'cost_function': 'discomfort_hot_delta_maximum',
+            'value': hot_maximum_delta[-1],
+        }, {
+            'cost_function': 'discomfort_hot_delta_average',
+            'value': hot_average_delta[-1],
+        }, {
+            'cost_function': 'one_minus_thermal_resilience_proportion',
+            'value': CostFunction.one_minus_thermal_resilience(power_outage=b.power_outage_signal, **discomfort_kwargs)[-1],
+        }, {
+            'cost_function': 'power_outage_normalized_unserved_energy_total',
+            'value': CostFunction.normalized_unserved_energy(expected_energy, served_energy, power_outage=b.power_outage_signal)[-1]
+        }, {
+            'cost_function': 'annual_normalized_unserved_energy_total',
+            'value': CostFunction.normalized_unserved_energy(expected_energy, served_energy)[-1]
+        }]
+
+    def _get_district_cost_functions(
+        self, control_condition: EvaluationCondition, baseline_condition: EvaluationCondition
+    ) -> List[Mapping[str, Union[str, float]]]:
+        """Returns district-level :py:meth:`evaluate` cost functions calculated from district time series history."""
+
+        # lambda function to get district level properties w.r.t. evaluation condition
+        get_net_electricity_consumption = lambda x, c: getattr(x, f'net_electricity_consumption{c.value}')
+
+        return [{
             'cost_function': 'ramping_average',
             'value': CostFunction.ramping(get_net_electricity_consumption(self, control_condition))[-1]/\
                 CostFunction.ramping(get_net_electricity_consumption(self, baseline_condition))[-1],
@@ -1107,15 +1245,7 @@ class CityLearnEnv(Environment, Env):
             'cost_function': 'all_time_peak_average',
             'value': CostFunction.peak(get_net_electricity_consumption(self, control_condition), window=self.time_steps)[-1]/\
                 CostFunction.peak(get_net_electricity_consumption(self, baseline_condition), window=self.time_steps)[-1],
-        }])
-
-        district_level = pd.concat([district_level, building_level], ignore_index=True, sort=False)
-        district_level = district_level.groupby(['cost_function'])[['value']].mean().reset_index()
-        district_level['name'] = 'District'
-        district_level['level'] = 'district'
-        cost_functions = pd.concat([district_level, building_level], ignore_index=True, sort=False)
-
-        return cost_functions
+        }]
 
     def next_time_step(self):
         r"""Advance all buildings to next `time_step`."""
@@ -1146,6 +1276,8 @@ class CityLearnEnv(Environment, Env):
             Override :meth"`get_info` to get custom key-value pairs in `info`.
         """
 
+        start = None if self.profiler is None else self.profiler.start()
+
         # object reset
         super().reset()
 
@@ -1167,27 +1299,93 @@ class CityLearnEnv(Environment, Env):
         for building in self.buildings:
             building.reset()
 
+        # bind building time series to shared district arrays
+        self.__district_state = DistrictState(self.buildings)
+        self.__district_state.reset()
+        self.__observations_buffer = None
+
+        # reset streaming cost functions
+        self.__kpi_tracker = KPITracker(
+            self.district_state,
+            comfort_bands=[EnergySimulation.DEFUALT_COMFORT_BAND, self.CITYLEARN_CHALLENGE_COMFORT_BAND],
+            peak_windows=[24, self.time_steps],
+        )
+        self.__kpi_tracker.reset()
+
         # reset reward function (does nothing by default)
         self.reward_function.reset()
 
         # variable reset
         self.__rewards = [[]]
-        self.__net_electricity_consumption = []
-        self.__net_electricity_consumption_cost = []
-        self.__net_electricity_consumption_emission = []
         self.update_variables()
+        observations, info = self.observations, self.get_info()
 
-        return self.observations, self.get_info()
+        if self.profiler is not None:
+            self.profiler.record('reset', start)
 
-    def update_variables(self):
-        # net electricity consumption
-        self.__net_electricity_consumption.append(sum([b.net_electricity_consumption[self.time_step] for b in self.buildings]))
+        else:
+            pass
+
+        return observations, info
+
+    def snapshot(self) -> StateSnapshot:
+        r"""Capture the mutable state of the environment at the current `time_step`.
+
+        The snapshot holds copies of the time series that are updated during control, device and storage states e.g. `soc`,
+        `energy_balance` and battery capacity history, dynamics model hidden states and input windows, district state and
+        KPI tracker buffers, random number generator states and `time_step`. Static data e.g. spaces, schema, weather,
+        pricing, carbon intensity and read-only episode parameters are kept by reference and not copied.
+
+        Returns
+        -------
+        snapshot: StateSnapshot
+            State that can be passed to :meth:`restore` any number of times.
+
+        Notes
+        -----
+        Use :meth:`snapshot` and :meth:`restore` to branch rollouts e.g. for model-predictive control or tree search
+        from an intermediate `time_step` without replaying the episode from :meth:`reset`. A snapshot remains valid after
+        :meth:`reset` and restores the objects and arrays it captured.
+        """
+
+        return StateSnapshot(self)
+
+    def restore(self, snapshot: StateSnapshot):
+        r"""Restore the environment to the state captured by :meth:`snapshot`.
+
+        Parameters
+        ----------
+        snapshot: StateSnapshot
+            State returned by :meth:`snapshot` on this environment.
+        """
+
+        snapshot.restore(self)
+
+    def fork(self) -> 'CityLearnEnv':
+        r"""Return an independent copy of the environment at the current `time_step`.
+
+        Unlike :meth:`snapshot`, the copy can be stepped alongside the original environment. The copy is a deep copy that 
+        shares the static data that :meth:`snapshot` keeps by reference e.g. weather, pricing and carbon intensity time series 
+        and read-only episode parameters, and keeps the building time series as views of its own district state arrays 
+        (see :py:meth:`citylearn.snapshot.StateSnapshot.get_copy_memo`). Observation getters compiled for the original 
+        buildings are cleared in the copy so that they are compiled again for its own buildings.
 
-        # net electriciy consumption cost
-        self.__net_electricity_consumption_cost.append(sum([b.net_electricity_consumption_cost[self.time_step] for b in self.buildings]))
+        Returns
+        -------
+        env: CityLearnEnv
+            Copy of the environment.
+        """
+
+        env = deepcopy(self, StateSnapshot(self).get_copy_memo())
+
+        for b in env.buildings:
+            b.clear_observation_getters()
 
-        # net electriciy consumption emission
-        self.__net_electricity_consumption_emission.append(sum([b.net_electricity_consumption_emission[self.time_step] for b in self.buildings]))
+        return env
+
+    def update_variables(self):
+        # district time series and cost functions
+        self.kpi_tracker.update(self.time_step)
 
     def load_agent(self, agent: Union[str, 'citylearn.agents.base.Agent'] = None, **kwargs) -> Union[Any, 'citylearn.agents.base.Agent']:
         """Return :class:`Agent` or sub class object as defined by the `schema`.
@@ -1271,23 +1469,7 @@ class CityLearnEnv(Environment, Env):
             Names of common observations across all buildings i.e. observations that have the same value irrespective of the building.
         """
         
-        if isinstance(schema, (str, Path)) and os.path.isfile(schema):
-            schema_filepath = Path(schema) if isinstance(schema, str) else schema
-            schema = read_json(schema)
-            schema['root_directory'] = os.path.split(schema_filepath.absolute())[0] if schema['root_directory'] is None\
-                else schema['root_directory']
-        
-        elif isinstance(schema, str) and schema in DataSet.get_names():
-            schema = DataSet.get_schema(schema)
-            schema['root_directory'] = '' if schema['root_directory'] is None else schema['root_directory']
-        
-        elif isinstance(schema, dict):
-            schema = deepcopy(schema)
-            schema['root_directory'] = '' if schema['root_directory'] is None else schema['root_directory']
-        
-        else:
-            raise UnknownSchemaError()
-
+        schema = self._parse_schema(schema)
         schema['root_directory'] = kwargs['root_directory'] if kwargs.get('root_directory') is not None else schema['root_directory']
         schema['random_seed'] =  schema.get('random_seed', None) if kwargs.get('random_seed', None) is None else schema.get('random_seed', None)
         schema['central_agent'] =  kwargs['central_agent'] if kwargs.get('central_agent') is not None else schema['central_agent']
@@ -1304,10 +1486,32 @@ class CityLearnEnv(Environment, Env):
         schema['simulation_end_time_step'] = kwargs['simulation_end_time_step'] if kwargs.get('simulation_end_time_step') is not None else\
             schema['simulation_end_time_step']
         episode_tracker = EpisodeTracker(schema['simulation_start_time_step'], schema['simulation_end_time_step'])
+
+        # set on-disk data file cache
+        data_file_cache = kwargs['data_file_cache'] if kwargs.get('data_file_cache') is not None else schema.get('data_file_cache', None)
+
+        if data_file_cache is None or data_file_cache is False:
+            data_file_cache = None
+
+        elif data_file_cache is True:
+            data_file_cache = DataFileCache()
+
+        elif isinstance(data_file_cache, DataFileCache):
+            pass
+
+        else:
+            data_file_cache = DataFileCache(directory=data_file_cache)
+
+        kwargs['data_file_cache'] = data_file_cache
         
         # get sizing data to reduce read time
-        pv_sizing_data = EnergySimulation.get_pv_sizing_data()
-        battery_sizing_data = EnergySimulation.get_battery_sizing_data()
+        data_cache = kwargs.get('data_cache')
+        binary_pv_sizing_data = kwargs['binary_pv_sizing_data'] if kwargs.get('binary_pv_sizing_data') is not None else\
+            schema.get('binary_pv_sizing_data', False)
+        pv_sizing_data = self._get_cached_data(
+            data_cache, ('sizing_data', 'pv', binary_pv_sizing_data), lambda: EnergySimulation.get_pv_sizing_data(binary=binary_pv_sizing_data)
+        )
+        battery_sizing_data = self._get_cached_data(data_cache, ('sizing_data', 'battery'), EnergySimulation.get_battery_sizing_data)
 
         # get buildings to include
         buildings_to_include = list(schema['buildings'].keys())
@@ -1369,28 +1573,84 @@ class CityLearnEnv(Environment, Env):
             schema['seconds_per_time_step'], reward_function, schema['central_agent'], shared_observations, episode_tracker
         )
     
+    @staticmethod
+    def _parse_schema(schema: Union[str, Path, Mapping[str, Any]]) -> Mapping[str, Any]:
+        """Returns :code:`dict` copy of a data set name, filepath to JSON representation or :code:`dict` object of a CityLearn schema 
+        with `root_directory` set."""
+
+        if isinstance(schema, (str, Path)) and os.path.isfile(schema):
+            schema_filepath = Path(schema) if isinstance(schema, str) else schema
+            schema = read_json(schema)
+            schema['root_directory'] = os.path.split(schema_filepath.absolute())[0] if schema['root_directory'] is None\
+                else schema['root_directory']
+        
+        elif isinstance(schema, str) and schema in DataSet.get_names():
+            schema = DataSet.get_schema(schema)
+            schema['root_directory'] = '' if schema['root_directory'] is None else schema['root_directory']
+        
+        elif isinstance(schema, dict):
+            schema = deepcopy(schema)
+            schema['root_directory'] = '' if schema['root_directory'] is None else schema['root_directory']
+        
+        else:
+            raise UnknownSchemaError()
+        
+        return schema
+    
+    @staticmethod
+    def _get_cached_data(data_cache: Mapping[Any, Any], key: Any, loader: Callable[[], Any]) -> Any:
+        """Returns `data_cache` value for `key` if set otherwise, returns `loader` output and stores it in `data_cache` if provided."""
+
+        if data_cache is None:
+            data = loader()
+        
+        elif key in data_cache:
+            data = data_cache[key]
+        
+        else:
+            data = loader()
+            data_cache[key] = data
+
+        return data
+    
+    def _read_data_file(
+        self, filepath: Union[Path, str], data_cache: Mapping[Any, Any] = None, data_file_cache: DataFileCache = None
+    ) -> Mapping[str, Union[List[Any], np.ndarray]]:
+        """Returns columns of CSV data file as :code:`dict` of lists, or of arrays if read through `data_file_cache`, 
+        that are shared through `data_cache` if provided."""
+
+        if data_file_cache is None:
+            loader = lambda: pd.read_csv(filepath).to_dict('list')
+
+        else:
+            loader = lambda: data_file_cache.read(filepath)
+
+        return self._get_cached_data(data_cache, ('data_file', str(filepath)), loader)
+
     def _load_building(self, index: int, building_name: str, schema: dict, episode_tracker: EpisodeTracker, pv_sizing_data: pd.DataFrame, battery_sizing_data: pd.DataFrame, **kwargs) -> Building:
         """Initializes and returns a building model."""
 
         building_schema = schema['buildings'][building_name]
         building_kwargs = {}
+        data_cache = kwargs.get('data_cache')
+        data_file_cache = kwargs.get('data_file_cache')
 
         # data
-        energy_simulation = pd.read_csv(os.path.join(schema['root_directory'],building_schema['energy_simulation']))
-        energy_simulation = EnergySimulation(**energy_simulation.to_dict('list'))
-        weather = pd.read_csv(os.path.join(schema['root_directory'],building_schema['weather']))
-        weather = Weather(**weather.to_dict('list'))
+        energy_simulation = self._read_data_file(os.path.join(schema['root_directory'],building_schema['energy_simulation']), data_cache, data_file_cache)
+        energy_simulation = EnergySimulation(**energy_simulation)
+        weather = self._read_data_file(os.path.join(schema['root_directory'],building_schema['weather']), data_cache, data_file_cache)
+        weather = Weather(**weather)
 
         if building_schema.get('carbon_intensity', None) is not None:
-            carbon_intensity = pd.read_csv(os.path.join(schema['root_directory'],building_schema['carbon_intensity']))
-            carbon_intensity = CarbonIntensity(**carbon_intensity.to_dict('list'))
+            carbon_intensity = self._read_data_file(os.path.join(schema['root_directory'],building_schema['carbon_intensity']), data_cache, data_file_cache)
+            carbon_intensity = CarbonIntensity(**carbon_intensity)
         
         else:
             carbon_intensity = CarbonIntensity(np.zeros(energy_simulation.hour.shape[0], dtype='float32'))
 
         if building_schema.get('pricing', None) is not None:
-            pricing = pd.read_csv(os.path.join(schema['root_directory'],building_schema['pricing']))
-            pricing = Pricing(**pricing.to_dict('list'))
+            pricing = self._read_data_file(os.path.join(schema['root_directory'],building_schema['pricing']), data_cache, data_file_cache)
+            pricing = Pricing(**pricing)
         
         else:
             pricing = Pricing(
@@ -1475,8 +1735,8 @@ class CityLearnEnv(Environment, Env):
             occupant_constructor = getattr(importlib.import_module(occupant_module), occupant_name)
             attributes: dict = building_occupant.get('attributes', {})
             parameters_filepath = os.path.join(schema['root_directory'], building_occupant['parameters_filename'])
-            parameters = pd.read_csv(parameters_filepath)
-            attributes['parameters'] = LogisticRegressionOccupantParameters(**parameters.to_dict('list'))
+            parameters = self._read_data_file(parameters_filepath, data_cache, data_file_cache)
+            attributes['parameters'] = LogisticRegressionOccupantParameters(**parameters)
             attributes['episode_tracker'] = episode_tracker
             attributes['random_seed'] = schema['random_seed']
 
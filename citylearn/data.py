@@ -1,7 +1,9 @@
+from collections import abc
+import hashlib
 import os
 from pathlib import Path
 import shutil
-from typing import Any, Iterable, Mapping, List, Union
+from typing import Any, Iterable, Mapping, List, Tuple, Union
 import numpy as np
 import pandas as pd
 from citylearn.utilities import read_json, read_yaml
@@ -16,6 +18,7 @@ QUERIES_DIRECTORY = os.path.join(MISC_DIRECTORY, 'queries')
 SETTINGS_FILEPATH = os.path.join(MISC_DIRECTORY, 'settings.yaml')
 BATTERY_CHOICES_FILEPATH = os.path.join(MISC_DATA_DIRECTORY, 'battery_choices.yaml')
 PV_CHOICES_FILEPATH = os.path.join(MISC_DATA_DIRECTORY, 'lbl-tracking_the_sun-res-pv.csv')
+CACHE_DIRECTORY = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'citylearn')
 
 def get_settings():
     directory = os.path.join(os.path.join(os.path.dirname(__file__), 'misc'))
@@ -87,6 +90,133 @@ class DataSet:
         schema['root_directory'] = root_directory
         
         return schema
+
+class DataFileCache:
+    r"""On-disk cache of CSV data files as typed binary columns.
+
+    Each CSV file is parsed once and its columns are stored as float32 and int32 arrays in uncompressed `.npy` files,
+    one per column, that are loaded memory-mapped. The cached files are keyed by the CSV file's absolute path,
+    modification time and size, so edited CSV files are parsed and cached again.
+
+    Parameters
+    ----------
+    directory: Union[Path, str], optional
+        Directory to store cached files in. Defaults to a :py:attr:`DEFAULT_DIRECTORY_NAME` directory in
+        :py:data:`citylearn.data.CACHE_DIRECTORY`.
+
+    Notes
+    -----
+    Files with non-numeric columns are not cached. Failure to write a cached file e.g., in a read-only cache
+    directory, is ignored and the parsed CSV columns are returned.
+    """
+
+    DEFAULT_DIRECTORY_NAME = 'data_files'
+    NAMES_FILENAME = 'names.npy'
+
+    def __init__(self, directory: Union[Path, str] = None):
+        self.directory = directory
+
+    @property
+    def directory(self) -> Union[Path, str]:
+        """Directory to store cached files in."""
+
+        return self.__directory
+
+    @directory.setter
+    def directory(self, directory: Union[Path, str]):
+        self.__directory = os.path.join(CACHE_DIRECTORY, self.DEFAULT_DIRECTORY_NAME) if directory is None else directory
+
+    def read(self, filepath: Union[Path, str]) -> Mapping[str, Union[np.ndarray, List[Any]]]:
+        r"""Returns columns of CSV data file from its cached files, parsing and caching the CSV file if it is not cached.
+
+        Parameters
+        ----------
+        filepath: Union[Path, str]
+            CSV data filepath.
+
+        Returns
+        -------
+        data: Mapping[str, Union[np.ndarray, List[Any]]]
+            Column name to values mapping. Values are read-only memory-mapped arrays if the file is cached
+            or lists if the file could not be cached.
+        """
+
+        cache_directory = self.get_filepath(filepath)
+        names_filepath = os.path.join(cache_directory, self.NAMES_FILENAME)
+
+        if os.path.isfile(names_filepath):
+            names = np.load(names_filepath, allow_pickle=False)
+            data = {
+                k: np.load(os.path.join(cache_directory, f'{i}.npy'), mmap_mode='r', allow_pickle=False)
+                for i, k in enumerate(names.tolist())
+            }
+
+        else:
+            data = pd.read_csv(filepath)
+            columns = self.__get_typed_columns(data)
+
+            if columns is None:
+                data = data.to_dict('list')
+
+            else:
+                data = columns
+                self.__write(cache_directory, data)
+
+        return data
+
+    def get_filepath(self, filepath: Union[Path, str]) -> str:
+        """Returns directory of cached column files for CSV data `filepath` w.r.t. its path, modification time and size."""
+
+        name = os.path.splitext(os.path.basename(filepath))[0]
+
+        return os.path.join(self.directory, f'{name}-{self.get_file_key(filepath)}')
+
+    @staticmethod
+    def get_file_key(filepath: Union[Path, str]) -> str:
+        """Returns MD5 hex digest of `filepath` absolute path, modification time and size."""
+
+        stat = os.stat(filepath)
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+
+        return hashlib.md5(repr(key).encode()).hexdigest()
+
+    @staticmethod
+    def __get_typed_columns(data: pd.DataFrame) -> Mapping[str, np.ndarray]:
+        columns = {}
+        int32 = np.iinfo('int32')
+
+        for k, v in data.items():
+            if pd.api.types.is_bool_dtype(v):
+                columns[k] = v.to_numpy(dtype='int32')
+
+            elif pd.api.types.is_integer_dtype(v):
+                columns[k] = v.to_numpy(dtype='int32' if v.shape[0] == 0 or (v.min() >= int32.min and v.max() <= int32.max) else 'int64')
+
+            elif pd.api.types.is_float_dtype(v):
+                columns[k] = v.to_numpy(dtype='float32')
+
+            else:
+                return None
+
+        return columns
+
+    @classmethod
+    def __write(cls, directory: str, data: Mapping[str, np.ndarray]):
+        # write to temporary directory then rename so concurrent readers never see partial files
+        temporary_directory = f'{directory}.{os.getpid()}.tmp'
+
+        try:
+            os.makedirs(temporary_directory, exist_ok=True)
+
+            for i, v in enumerate(data.values()):
+                np.save(os.path.join(temporary_directory, f'{i}.npy'), v, allow_pickle=False)
+
+            np.save(os.path.join(temporary_directory, cls.NAMES_FILENAME), np.array(list(data.keys()), dtype=str), allow_pickle=False)
+            os.replace(temporary_directory, directory)
+
+        except OSError:
+            # another process may have cached the file first
+            shutil.rmtree(temporary_directory, ignore_errors=True)
     
 class TimeSeriesData:
     """Generic time series data class.
@@ -117,7 +247,7 @@ class TimeSeriesData:
         except KeyError:
             raise AttributeError(f'_{name}')
         
-        if isinstance(variable, Iterable):
+        if isinstance(variable, abc.Iterable):
             start_time_step = self.start_time_step if start_time_step is None else start_time_step
             start_index = 0 if start_time_step is None else start_time_step
             end_time_step = self.end_time_step if end_time_step is None else end_time_step
@@ -135,6 +265,40 @@ class TimeSeriesData:
 
         self.__dict__[f'_{name}'] = value
 
+    def get_array(self, name: str) -> Tuple[np.ndarray, int]:
+        """Returns the full array of the named variable without slicing and the index in it that `start_time_step` 
+        maps to, so that the value at episode time step `t` is at index `start_index` + `t`.
+
+        The returned array is the stored object and not a copy hence, it reflects in-place updates but not a rebinding 
+        of the variable by a later :py:meth:`__setattr__` call.
+
+        Parameters
+        ----------
+        name: str
+            Variable name.
+
+        Returns
+        -------
+        array: np.ndarray
+            Variable's full array.
+        start_index: int
+            Index of `start_time_step` in `array`.
+        """
+
+        variables = self.__dict__
+
+        try:
+            array = variables[f'_{name}']
+        except KeyError:
+            raise AttributeError(f'_{name}')
+
+        return array, variables['_start_time_step'] or 0
+
+    def get_array_names(self) -> List[str]:
+        """Returns names of variables whose values are arrays."""
+
+        return [k[1:] for k, v in self.__dict__.items() if isinstance(v, np.ndarray)]
+
 class EnergySimulation(TimeSeriesData):
     """`Building` `energy_simulation` data class.
 
@@ -190,6 +354,10 @@ class EnergySimulation(TimeSeriesData):
     """
 
     DEFUALT_COMFORT_BAND = 2.0
+    PV_SIZING_COLUMNS = [
+        'nameplate_capacity_module_1', 'inverter_loading_ratio', 'tilt_1', 'azimuth_1', 'bifacial_module_1', 'PV_system_size_DC', 'module_area'
+    ]
+    __SIZING_DATA = {}
 
     def __init__(
         self, month: Iterable[int], hour: Iterable[int], day_type: Iterable[int],
@@ -250,8 +418,19 @@ class EnergySimulation(TimeSeriesData):
         self.hvac_mode = np.array(hvac_mode, dtype='int32')
 
     @staticmethod
-    def get_pv_sizing_data() -> pd.DataFrame:
+    def get_pv_sizing_data(cache: bool = None, binary: bool = None) -> pd.DataFrame:
         """Reads and returns NREL's Tracking The Sun dataset that has been prefilered for completeness.
+
+        Parameters
+        ----------
+        cache: bool, default: True
+            Whether to return the process-wide copy that is read on first call and shared by later calls. 
+            The column arrays of the shared dataframe are read-only.
+        binary: bool, default: False
+            Whether to read a typed binary copy of only the :py:attr:`PV_SIZING_COLUMNS` used by 
+            :py:meth:`citylearn.energy_model.PV.autosize`, that is created in :py:data:`citylearn.data.CACHE_DIRECTORY` on first use.
+            All rows are kept so sampling is unchanged but :py:attr:`citylearn.energy_model.PV.autosize_config` then only
+            includes the :py:attr:`PV_SIZING_COLUMNS`.
         
         Returns
         -------
@@ -262,30 +441,109 @@ class EnergySimulation(TimeSeriesData):
         Data source: https://github.com/intelligent-environments-lab/CityLearn/tree/master/citylearn/data/misc/lbl-tracking_the_sun_res-pv.csv.
         """
 
+        cache = True if cache is None else cache
+        binary = False if binary is None else binary
+        key = ('pv', binary)
+
+        if cache and key in EnergySimulation.__SIZING_DATA:
+            return EnergySimulation.__SIZING_DATA[key]
+
+        else:
+            pass
+
         filepath = PV_CHOICES_FILEPATH
-        data = pd.read_csv(filepath, low_memory=False)
+
+        if binary:
+            binary_filepath = os.path.join(
+                CACHE_DIRECTORY, 'sizing_data', f'{Path(filepath).stem}-{DataFileCache.get_file_key(filepath)}.npz'
+            )
+
+            if os.path.isfile(binary_filepath):
+                with np.load(binary_filepath, allow_pickle=False) as binary_data:
+                    data = pd.DataFrame({k: binary_data[k] for k in EnergySimulation.PV_SIZING_COLUMNS})
+
+            else:
+                data = pd.read_csv(filepath, usecols=EnergySimulation.PV_SIZING_COLUMNS, low_memory=False)
+                data = data[EnergySimulation.PV_SIZING_COLUMNS].astype('float64')
+
+                try:
+                    os.makedirs(os.path.dirname(binary_filepath), exist_ok=True)
+                    temporary_filepath = f'{binary_filepath}.{os.getpid()}.tmp'
+
+                    with open(temporary_filepath, 'wb') as f:
+                        np.savez(f, **{k: v.to_numpy() for k, v in data.items()})
+
+                    os.replace(temporary_filepath, binary_filepath)
+
+                except OSError:
+                    pass
+
+        else:
+            data = pd.read_csv(filepath, low_memory=False)
+
+        if cache:
+            data = EnergySimulation.__get_read_only(data)
+            EnergySimulation.__SIZING_DATA[key] = data
+
+        else:
+            pass
         
         return data
     
     @staticmethod
-    def get_battery_sizing_data() -> Mapping[str, Union[float, str]]:
+    def get_battery_sizing_data(cache: bool = None) -> pd.DataFrame:
         """Reads and returns internally defined real world manufacturer models.
+
+        Parameters
+        ----------
+        cache: bool, default: True
+            Whether to return the process-wide copy that is read on first call and shared by later calls. 
+            The column arrays of the shared dataframe are read-only.
         
         Returns
         -------
-        data: Mapping[str, Union[float, str]]
+        data: pd.DataFrame
 
         Notes
         -----
         Data source: https://github.com/intelligent-environments-lab/CityLearn/tree/master/citylearn/data/misc/battery_choices.yaml.
         """
 
+        cache = True if cache is None else cache
+        key = ('battery',)
+
+        if cache and key in EnergySimulation.__SIZING_DATA:
+            return EnergySimulation.__SIZING_DATA[key]
+
+        else:
+            pass
+
         filepath = BATTERY_CHOICES_FILEPATH
         data = read_yaml(filepath)
         data = pd.DataFrame([{'model': k, **v['attributes']} for k, v in data.items()])
         data = data.set_index('model')
 
+        if cache:
+            data = EnergySimulation.__get_read_only(data)
+            EnergySimulation.__SIZING_DATA[key] = data
+
+        else:
+            pass
+
         return data
+
+    @staticmethod
+    def __get_read_only(data: pd.DataFrame) -> pd.DataFrame:
+        """Returns copy of `data` built on non-writeable column arrays so that the process-wide copy cannot be modified in place."""
+
+        columns = {}
+
+        for k, v in data.items():
+            values = v.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[k] = values
+
+        return pd.DataFrame(columns, index=data.index, copy=False)
     
 class LogisticRegressionOccupantParameters(TimeSeriesData):
     def __init__(self, a_increase: Iterable[float], b_increase: Iterable[float], a_decrease: Iterable[float], b_decrease: Iterable[float], start_time_step: int = None, end_time_step: int = None):
@@ -1,12 +1,14 @@
+import hashlib
+import json
 import logging
 import math
+import os
 from pathlib import Path
 from typing import Any, Iterable, List, Mapping, Tuple, Union
 import numpy as np
 import pandas as pd
-from PySAM import Pvwattsv8
 from citylearn.base import Environment
-from citylearn.data import EnergySimulation, ZERO_DIVISION_PLACEHOLDER
+from citylearn.data import CACHE_DIRECTORY, DataFileCache, EnergySimulation, ZERO_DIVISION_PLACEHOLDER
 np.seterr(divide='ignore', invalid='ignore')
 
 LOGGER = logging.getLogger()
@@ -141,6 +143,16 @@ class ElectricDevice(Device):
             f'electricity_consumption must be >= 0 but value: {electricity_consumption} was provided.'
         self.__electricity_consumption[self.time_step] += electricity_consumption
 
+    def get_time_series(self) -> Mapping[str, np.ndarray]:
+        return {
+            **super().get_time_series(),
+            'electricity_consumption': self.__electricity_consumption,
+        }
+
+    def set_time_series(self, time_series: Mapping[str, np.ndarray]):
+        super().set_time_series(time_series)
+        self.__electricity_consumption = time_series['electricity_consumption']
+
     def reset(self):
         r"""Reset `ElectricDevice` to initial state and set `electricity_consumption` at `time_step` 0 to = 0.0."""
 
@@ -477,7 +489,7 @@ class PV(ElectricDevice):
 
         return self.nominal_power*np.array(inverter_ac_power_per_kw)/1000.0
 
-    def autosize(self, demand: float, epw_filepath: Union[Path, str], use_sample_target: bool = None, zero_net_energy_proportion: Union[float, Tuple[float, float]] = None, roof_area: float = None, safety_factor: Union[float, Tuple[float, float]] = None, sizing_data: pd.DataFrame = None) -> Tuple[float, np.ndarray]:
+    def autosize(self, demand: float, epw_filepath: Union[Path, str], use_sample_target: bool = None, zero_net_energy_proportion: Union[float, Tuple[float, float]] = None, roof_area: float = None, safety_factor: Union[float, Tuple[float, float]] = None, sizing_data: pd.DataFrame = None, cache: bool = None) -> Tuple[float, np.ndarray]:
         r"""Autosize `nominal_power` and `inverter_ac_power_per_kw`.
 
         Samples PV data from Tracking the Sun dataset to set PV system design parameters in System Adivosry Model's `PVWattsNone` model.
@@ -504,7 +516,14 @@ class PV(ElectricDevice):
             The sizing dataframe from which PV systems are sampled from. If initialized from
             py:class:`citylearn.citylearn.CityLearnEnv`, the data is parsed in when autosizing
             a building's PV. If the dataframe is not provided it is read in using
-            :py:meth:`citylearn.data.EnergySimulation.get_pv_sizing_data`.
+            :py:meth:`citylearn.data.EnergySimulation.get_pv_sizing_data`. The sampled row is set as `autosize_config`
+            hence, it only includes :py:attr:`citylearn.data.EnergySimulation.PV_SIZING_COLUMNS` when the dataframe
+            is read with `binary` set to `True`.
+        cache: bool, default: True
+            Whether to reuse the :code:`PVWattsNone` :code:`ac` output of a previous simulation with the same `epw_filepath` file,
+            i.e. path, modification time and size, sampled system design and PySAM version that is stored in
+            :py:data:`citylearn.data.CACHE_DIRECTORY`, and to store new simulation outputs there. PySAM is not imported
+            if the output is cached. The system design is still sampled from `sizing_data` on every call.
 
         Returns
         -------
@@ -527,19 +546,21 @@ class PV(ElectricDevice):
         random_seed = self.random_seed
         tries = 3
 
+        cache = True if cache is None else cache
+
         for i in range(3):
             self._autosize_config = sizing_data.sample(1, random_state=random_seed + i).iloc[0].to_dict()
-            model = Pvwattsv8.default('PVWattsNone')
             pv_nominal_power = self.autosize_config['nameplate_capacity_module_1']/1000.0
-            model.SystemDesign.system_capacity = pv_nominal_power
-            model.SystemDesign.dc_ac_ratio = self.autosize_config['inverter_loading_ratio']
-            model.SystemDesign.tilt = self.autosize_config['tilt_1']
-            model.SystemDesign.azimuth = self.autosize_config['azimuth_1']
-            model.SystemDesign.bifaciality = self.autosize_config['bifacial_module_1']*0.65
-            model.SolarResource.solar_resource_file = epw_filepath
+            system_design = {
+                'system_capacity': float(pv_nominal_power),
+                'dc_ac_ratio': float(self.autosize_config['inverter_loading_ratio']),
+                'tilt': float(self.autosize_config['tilt_1']),
+                'azimuth': float(self.autosize_config['azimuth_1']),
+                'bifaciality': float(self.autosize_config['bifacial_module_1']*0.65),
+            }
         
             try:
-                model.execute()
+                ac = self.__simulate(epw_filepath, system_design, cache)
                 break
 
             except Exception as e:
@@ -552,7 +573,7 @@ class PV(ElectricDevice):
                     pass
                 
         
-        inverter_ac_power_per_kw = np.array(model.Outputs.ac, dtype='float32')/pv_nominal_power
+        inverter_ac_power_per_kw = np.array(ac, dtype='float32')/pv_nominal_power
 
         if use_sample_target:
             target_nominal_power = self.autosize_config['PV_system_size_DC']
@@ -576,8 +597,8 @@ class PV(ElectricDevice):
             'roof_area': roof_area,
             'safety_factor': safety_factor,
             'pv_area': pv_area,
-            'nameplate_capacity_module_1': model.SystemDesign.system_capacity,
-            'bifacial_module_1': model.SystemDesign.bifaciality,
+            'nameplate_capacity_module_1': system_design['system_capacity'],
+            'bifacial_module_1': system_design['bifaciality'],
             'target_nominal_power': target_nominal_power,
             'roof_limit_nominal_power': roof_limit_nominal_power,
             'nominal_power': nominal_power
@@ -585,6 +606,73 @@ class PV(ElectricDevice):
         
         return nominal_power, inverter_ac_power_per_kw
 
+    @staticmethod
+    def __simulate(epw_filepath: Union[Path, str], system_design: Mapping[str, float], cache: bool) -> np.ndarray:
+        """Returns :code:`PVWattsNone` :code:`ac` output for `system_design`, reading it from or writing it to the cache if `cache` is True."""
+
+        if cache:
+            # PySAM version is read from package metadata so that cached outputs are returned without importing PySAM.
+            # importlib.metadata is not available before Python 3.8 and its PackageNotFoundError is an ImportError
+            try:
+                from importlib.metadata import version
+                pysam_version = version('nrel-pysam')
+
+            except ImportError:
+                pysam_version = None
+
+            key = json.dumps({
+                'epw': DataFileCache.get_file_key(epw_filepath),
+                'system_design': system_design,
+                'pysam': pysam_version,
+            }, sort_keys=True)
+            filepath = os.path.join(CACHE_DIRECTORY, 'pv_autosize', f'{hashlib.md5(key.encode()).hexdigest()}.npy')
+
+            if os.path.isfile(filepath):
+                return np.load(filepath, allow_pickle=False)
+
+            else:
+                pass
+
+        else:
+            pass
+
+        # PySAM is only imported when a PV is simulated
+        from PySAM import Pvwattsv8
+
+        model = Pvwattsv8.default('PVWattsNone')
+
+        for k, v in system_design.items():
+            setattr(model.SystemDesign, k, v)
+
+        model.SolarResource.solar_resource_file = str(epw_filepath)
+        model.execute()
+        ac = np.array(model.Outputs.ac, dtype='float64')
+
+        if cache:
+            temporary_filepath = f'{filepath}.{os.getpid()}.tmp'
+
+            try:
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+                with open(temporary_filepath, 'wb') as f:
+                    np.save(f, ac, allow_pickle=False)
+
+                os.replace(temporary_filepath, filepath)
+
+            except OSError:
+                LOGGER.debug(f'Failed to cache PVWatts output to {filepath}.')
+
+                if os.path.isfile(temporary_filepath):
+                    os.remove(temporary_filepath)
+
+                else:
+                    pass
+
+        else:
+            pass
+
+        return ac
+
 class StorageDevice(Device):
     r"""Base storage device class.
 
@@ -757,6 +845,18 @@ class StorageDevice(Device):
 
         return capacity
 
+    def get_time_series(self) -> Mapping[str, np.ndarray]:
+        return {
+            **super().get_time_series(),
+            'soc': self.__soc,
+            'energy_balance': self.__energy_balance,
+        }
+
+    def set_time_series(self, time_series: Mapping[str, np.ndarray]):
+        super().set_time_series(time_series)
+        self.__soc = time_series['soc']
+        self.__energy_balance = time_series['energy_balance']
+
     def reset(self):
         r"""Reset `StorageDevice` to initial state."""
 
@@ -856,12 +956,14 @@ class Battery(StorageDevice, ElectricDevice):
     """
     
     def __init__(self, capacity: float = None, nominal_power: float = None, capacity_loss_coefficient: Union[float, Tuple[float, float]] = None, power_efficiency_curve: List[List[float]] = None, capacity_power_curve: List[List[float]] = None, depth_of_discharge: Union[float, Tuple[float, float]] = None, **kwargs: Any):
-        self._efficiency_history = []
-        self._capacity_history = []
+        self._efficiency_history = np.array([], dtype='float64')
+        self._capacity_history = np.array([], dtype='float64')
+        self.__initial_efficiency = None
+        self.__initial_capacity = None
+        self.__episode_history = False
         self.random_seed = kwargs.get('random_seed', None)
         self.depth_of_discharge = depth_of_discharge
         super().__init__(capacity=capacity, nominal_power=nominal_power, **kwargs)
-        self._capacity_history = [self.capacity]
         self.capacity_loss_coefficient = capacity_loss_coefficient
         self.power_efficiency_curve = power_efficiency_curve
         self.capacity_power_curve = capacity_power_curve
@@ -903,26 +1005,38 @@ class Battery(StorageDevice, ElectricDevice):
         return self.__depth_of_discharge
 
     @property
-    def efficiency_history(self) -> List[float]:
-        """Time series of technical efficiency."""
+    def efficiency_history(self) -> np.ndarray:
+        """Time series of technical efficiency up to and including current `time_step`."""
 
-        return self._efficiency_history
+        return self.__get_history(self._efficiency_history)
 
     @property
-    def capacity_history(self) -> List[float]:
-        """Time series of maximum amount of energy the storage device can store in [kWh]."""
+    def capacity_history(self) -> np.ndarray:
+        """Time series of maximum amount of energy the storage device can store in [kWh] up to and including current `time_step`."""
 
-        return self._capacity_history
+        return self.__get_history(self._capacity_history)
     
     @StorageDevice.capacity.setter
     def capacity(self, capacity: Union[float, Tuple[float, float]]):
         StorageDevice.capacity.fset(self, capacity)
-        self._capacity_history = [super().capacity]
+        self.__initial_capacity = super().capacity
+
+        if self.__episode_history:
+            self._capacity_history[self.time_step] = self.__initial_capacity
+
+        else:
+            self._capacity_history = np.array([self.__initial_capacity], dtype='float64')
 
     @efficiency.setter
     def efficiency(self, efficiency: Union[float, Tuple[float, float]]):
         StorageDevice.efficiency.fset(self, efficiency)
-        self._efficiency_history.append(super().efficiency)
+        self.__initial_efficiency = super().efficiency if self.__initial_efficiency is None else self.__initial_efficiency
+
+        if self.__episode_history:
+            self._efficiency_history[self.time_step] = super().efficiency
+
+        else:
+            self._efficiency_history = np.append(self._efficiency_history, super().efficiency)
 
     @capacity_loss_coefficient.setter
     def capacity_loss_coefficient(self, capacity_loss_coefficient: Union[float, Tuple[float, float]]):
@@ -1004,7 +1118,7 @@ class Battery(StorageDevice, ElectricDevice):
 
         super().charge(energy)
         degraded_capacity = max(self.degraded_capacity - self.degrade(), 0.0)
-        self._capacity_history.append(degraded_capacity)
+        self._capacity_history[self.time_step] = degraded_capacity
         self.update_electricity_consumption(self.energy_balance[self.time_step], enforce_polarity=False)
 
     def get_max_output_power(self) -> float:
@@ -1156,9 +1270,35 @@ class Battery(StorageDevice, ElectricDevice):
 
         return capacity, nominal_power, depth_of_discharge, efficiency, loss_coefficient, capacity_loss_coefficient
 
+    def get_time_series(self) -> Mapping[str, np.ndarray]:
+        return {
+            **super().get_time_series(),
+            'efficiency_history': self._efficiency_history,
+            'capacity_history': self._capacity_history,
+        }
+
+    def set_time_series(self, time_series: Mapping[str, np.ndarray]):
+        super().set_time_series(time_series)
+        self._efficiency_history = time_series['efficiency_history']
+        self._capacity_history = time_series['capacity_history']
+
+    def next_time_step(self):
+        r"""Advance to next `time_step` and carry `efficiency` and `degraded_capacity` forward from the previous `time_step`."""
+
+        super().next_time_step()
+        self._efficiency_history[self.time_step] = self._efficiency_history[self.time_step - 1]
+        self._capacity_history[self.time_step] = self._capacity_history[self.time_step - 1]
+
     def reset(self):
-        r"""Reset `Battery` to initial state."""
+        r"""Reset `Battery` to initial state and set `efficiency` and `degraded_capacity` at `time_step` 0 to initial values."""
 
         super().reset()
-        self._efficiency_history = self._efficiency_history[0:1]
-        self._capacity_history = self._capacity_history[0:1]
\ No newline at end of file
+        self._efficiency_history = np.zeros(self.episode_tracker.episode_time_steps, dtype='float64')
+        self._efficiency_history[0] = self.__initial_efficiency
+        self._capacity_history = np.zeros(self.episode_tracker.episode_time_steps, dtype='float64')
+        self._capacity_history[0] = self.__initial_capacity
+        self.__episode_history = True
+
+    def __get_history(self, history: np.ndarray) -> np.ndarray:
+        # histories are per-episode arrays indexed by `time_step` after the first reset
+        return history[0:self.time_step + 1] if self.__episode_history else history
\ No newline at end of file
@@ -0,0 +1,563 @@
+from typing import List, Mapping, Union
+import numpy as np
+from citylearn.building import DynamicsBuilding
+from citylearn.data import EnergySimulation
+from citylearn.energy_model import ElectricHeater, HeatPump
+from citylearn.state import DistrictState
+
+class KPITracker:
+    r"""Streaming accumulator of the cost functions returned by :py:meth:`citylearn.citylearn.CityLearnEnv.evaluate`.
+
+    Running sums, extrema, window and comfort counters are updated in O(1) per time step in :py:meth:`update` so that
+    :py:meth:`get_building_cost_functions` and :py:meth:`get_district_cost_functions` return the same values as the
+    :py:class:`citylearn.cost_function.CostFunction` methods applied to the full time series history, at any time step
+    and without rebuilding the history.
+
+    Parameters
+    ----------
+    district_state: DistrictState
+        Struct-of-arrays store of the current episode's building and device time series.
+    comfort_bands: List[float], optional
+        Comfort bands to track discomfort cost functions for. Defaults to
+        [:py:attr:`citylearn.data.EnergySimulation.DEFUALT_COMFORT_BAND`].
+    load_factor_windows: List[int], default: [24, 730]
+        Windows to track `one_minus_load_factor` cost functions for.
+    peak_windows: List[int], default: [24]
+        Windows to track `peak` cost functions for.
+
+    Notes
+    -----
+    :py:meth:`reset` must be called after `district_state` has been reset at the start of each episode and :py:meth:`update` must then
+    be called once per time step starting at time step 0. Net electricity consumption, cost and emission are tracked for all
+    :py:class:`citylearn.citylearn.EvaluationCondition` values.
+    """
+
+    END_USES = ['cooling', 'heating', 'dhw']
+    CONDITIONS = [
+        '', '_without_storage', '_without_storage_and_pv',
+        '_without_storage_and_partial_load', '_without_storage_and_partial_load_and_pv'
+    ]
+    PARTIAL_LOAD_CONDITIONS = CONDITIONS[3:]
+    DISTRICT_TIME_SERIES_NAMES = [
+        *[f'net_electricity_consumption{c}' for c in CONDITIONS],
+        *[f'net_electricity_consumption_cost{c}' for c in CONDITIONS],
+        *[f'net_electricity_consumption_emission{c}' for c in CONDITIONS],
+        'cooling_electricity_consumption', 'heating_electricity_consumption', 'dhw_electricity_consumption',
+        'cooling_storage_electricity_consumption', 'heating_storage_electricity_consumption', 'dhw_storage_electricity_consumption',
+        'electrical_storage_electricity_consumption',
+        'energy_from_cooling_device_to_cooling_storage', 'energy_from_heating_device_to_heating_storage',
+        'energy_from_dhw_device_to_dhw_storage', 'energy_to_electrical_storage',
+        'energy_from_cooling_device', 'energy_from_heating_device', 'energy_from_dhw_device', 'energy_to_non_shiftable_load',
+        'energy_from_cooling_storage', 'energy_from_heating_storage', 'energy_from_dhw_storage', 'energy_from_electrical_storage',
+        'cooling_demand', 'heating_demand', 'dhw_demand', 'non_shiftable_load', 'solar_generation', 'power_outage',
+    ]
+
+    def __init__(
+        self, district_state: DistrictState, comfort_bands: List[float] = None, load_factor_windows: List[int] = None,
+        peak_windows: List[int] = None
+    ):
+        self.district_state = district_state
+        self.comfort_bands = comfort_bands
+        self.load_factor_windows = load_factor_windows
+        self.peak_windows = peak_windows
+        self.__time_step = None
+
+    @property
+    def district_state(self) -> DistrictState:
+        """Struct-of-arrays store of the current episode's building and device time series."""
+
+        return self.__district_state
+
+    @property
+    def comfort_bands(self) -> List[float]:
+        """Comfort bands to track discomfort cost functions for."""
+
+        return self.__comfort_bands
+
+    @property
+    def load_factor_windows(self) -> List[int]:
+        """Windows to track `one_minus_load_factor` cost functions for."""
+
+        return self.__load_factor_windows
+
+    @property
+    def peak_windows(self) -> List[int]:
+        """Windows to track `peak` cost functions for."""
+
+        return self.__peak_windows
+
+    @property
+    def district_time_series(self) -> Mapping[str, np.ndarray]:
+        """Episode-length district sums of building time series in :py:attr:`DISTRICT_TIME_SERIES_NAMES` that are filled up to
+        the last time step passed to :py:meth:`update`. Partial load series fall back to the storage-only series for buildings
+        that are not :py:class:`citylearn.building.DynamicsBuilding`."""
+
+        return self.__district_time_series
+
+    @property
+    def time_step(self) -> int:
+        """Last time step passed to :py:meth:`update` or None if the history is incomplete."""
+
+        return self.__time_step
+
+    @district_state.setter
+    def district_state(self, district_state: DistrictState):
+        self.__district_state = district_state
+
+    @comfort_bands.setter
+    def comfort_bands(self, comfort_bands: List[float]):
+        self.__comfort_bands = [EnergySimulation.DEFUALT_COMFORT_BAND] if comfort_bands is None else list(comfort_bands)
+
+    @load_factor_windows.setter
+    def load_factor_windows(self, load_factor_windows: List[int]):
+        self.__load_factor_windows = [24, 730] if load_factor_windows is None else list(load_factor_windows)
+
+    @peak_windows.setter
+    def peak_windows(self, peak_windows: List[int]):
+        self.__peak_windows = [24] if peak_windows is None else list(peak_windows)
+
+    def is_available(self, time_step: int, control_condition: str, baseline_condition: str, comfort_band: float = None) -> bool:
+        r"""Whether tracked cost functions are up to date at `time_step` and cover the conditions and comfort band.
+
+        Parameters
+        ----------
+        time_step: int
+            Current environment time step.
+        control_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the control scenario.
+        baseline_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the baseline scenario.
+        comfort_band: float, optional
+            Comfort band. Only checked if provided.
+        """
+
+        conditions = [control_condition, baseline_condition]
+
+        return self.__time_step is not None and self.__time_step == time_step\
+            and all(c in self.CONDITIONS for c in conditions)\
+                and (not any(c in self.PARTIAL_LOAD_CONDITIONS for c in conditions) or self.__partial_load_available)\
+                    and (comfort_band is None or comfort_band in self.comfort_bands)
+
+    def reset(self):
+        """Capture the current episode's static time series and building data and reset all accumulators."""
+
+        buildings = self.district_state.buildings
+        building_count = len(buildings)
+        condition_count = len(self.CONDITIONS)
+        band_count = len(self.comfort_bands)
+        self.__time_step = -1
+
+        # static time series
+        self.__electricity_pricing = np.array([b.pricing.electricity_pricing for b in buildings], dtype='float32')
+        self.__carbon_intensity = np.array([b.carbon_intensity.carbon_intensity for b in buildings], dtype='float32')
+        self.__storage_divisors = {}
+        self.__dynamics = np.array([isinstance(b, DynamicsBuilding) for b in buildings], dtype=bool)
+        self.__partial_load_available = building_count > 0 and bool(self.__dynamics.all())
+        self.__partial_load_divisors = {}
+
+        for end_use in self.END_USES:
+            divisors = []
+
+            for b in buildings:
+                device = getattr(b, f'{end_use}_device')
+                temperature = b.weather.outdoor_dry_bulb_temperature
+
+                if isinstance(device, HeatPump):
+                    divisors.append(device.get_cop(temperature, heating=end_use != 'cooling'))
+
+                else:
+                    divisors.append(np.full(temperature.shape[0], device.efficiency, dtype='float32'))
+
+            self.__storage_divisors[end_use] = np.array(divisors, dtype='float32')
+
+        for end_use in ['cooling', 'heating']:
+            divisors = []
+
+            for b, d in zip(buildings, self.__dynamics):
+                temperature = b.weather.outdoor_dry_bulb_temperature
+
+                if not d:
+                    divisors.append(np.ones(temperature.shape[0], dtype='float32'))
+
+                elif end_use == 'cooling':
+                    divisors.append(b.cooling_device.get_cop(temperature, heating=False))
+
+                elif isinstance(b.heating_device, HeatPump):
+                    divisors.append(b.heating_device.get_cop(temperature.astype('float64'), heating=True))
+
+                elif isinstance(b.dhw_device, ElectricHeater):
+                    divisors.append(np.full(temperature.shape[0], b.dhw_device.efficiency, dtype='float32'))
+
+                else:
+                    divisors.append(np.ones(temperature.shape[0], dtype='float32'))
+                    self.__partial_load_available = False
+
+            self.__partial_load_divisors[end_use] = np.array(divisors, dtype='float32')
+
+        # static time series are made read-only to be shared rather than copied by snapshots
+        for v in [self.__electricity_pricing, self.__carbon_intensity, self.__dynamics]\
+            + list(self.__storage_divisors.values()) + list(self.__partial_load_divisors.values()):
+            v.flags.writeable = False
+
+        self.__carbon_intensity_available = [sum(b.carbon_intensity.carbon_intensity) != 0 for b in buildings]
+        self.__electricity_pricing_available = [sum(b.pricing.electricity_pricing) != 0 for b in buildings]
+
+        # live time series that may be updated by building dynamics and occupants
+        names = [
+            'indoor_dry_bulb_temperature', 'indoor_dry_bulb_temperature_cooling_set_point', 'indoor_dry_bulb_temperature_heating_set_point',
+            'occupant_count', 'cooling_demand', 'heating_demand', 'dhw_demand', 'non_shiftable_load',
+            'cooling_demand_without_control', 'heating_demand_without_control'
+        ]
+        self.__energy_simulation = {k: [getattr(b.energy_simulation, k) for b in buildings] for k in names}
+
+        # district time series
+        time_steps = 0 if building_count == 0 else self.district_state.time_series['net_electricity_consumption'].shape[1]
+        self.__district_time_series_values = np.full((len(self.DISTRICT_TIME_SERIES_NAMES), time_steps), np.nan, dtype='float32')
+        self.__district_time_series = {
+            k: v for k, v in zip(self.DISTRICT_TIME_SERIES_NAMES, self.__district_time_series_values)
+        }
+
+        # building accumulators
+        self.__electricity_consumption = np.zeros((condition_count, building_count), dtype='float64')
+        self.__zero_net_energy = np.zeros((condition_count, building_count), dtype='float64')
+        self.__carbon_emissions = np.zeros((condition_count, building_count), dtype='float64')
+        self.__cost = np.zeros((condition_count, building_count), dtype='float64')
+        self.__occupied_count = np.zeros(building_count, dtype='float64')
+        self.__occupied_power_outage_count = np.zeros(building_count, dtype='float64')
+        self.__comfort_band_values = np.array(self.comfort_bands, dtype='float64')[:, np.newaxis]
+        self.__discomfort_count = np.zeros((band_count, building_count), dtype='float64')
+        self.__discomfort_cold_count = np.zeros((band_count, building_count), dtype='float64')
+        self.__discomfort_hot_count = np.zeros((band_count, building_count), dtype='float64')
+        self.__delta_minimum = np.full((2, building_count), np.nan, dtype='float64') # cold, hot
+        self.__delta_maximum = np.full((2, building_count), np.nan, dtype='float64')
+        self.__delta_sum = np.zeros((2, building_count), dtype='float64')
+        self.__delta_count = np.zeros((2, building_count), dtype='float64')
+        self.__unserved_energy = np.zeros((2, building_count), dtype='float64') # power outage, annual
+        self.__expected_energy = np.zeros((2, building_count), dtype='float64')
+
+        # district accumulators
+        self.__previous_district_net_electricity_consumption = None
+        self.__ramping = np.zeros(condition_count, dtype='float64')
+        self.__windows = np.array(self.load_factor_windows + self.peak_windows, dtype='int64')
+        self.__load_factor_window = np.array(
+            [True]*len(self.load_factor_windows) + [False]*len(self.peak_windows), dtype=bool
+        )[:, np.newaxis]
+        window_shape = (self.__windows.shape[0], condition_count)
+        self.__window_value_sum = np.zeros(window_shape, dtype='float64')
+        self.__window_value_count = np.zeros(window_shape, dtype='float64')
+        self.__window_sum = np.zeros(window_shape, dtype='float64')
+        self.__window_count = np.zeros(window_shape, dtype='float64')
+        self.__window_maximum = np.full(window_shape, np.nan, dtype='float64')
+
+    def update(self, time_step: int):
+        r"""Update district time series and accumulators with building and district values at `time_step`.
+
+        Parameters
+        ----------
+        time_step: int
+            Current environment time step. Must be one more than the previous call's `time_step`, otherwise the tracker
+            stops accumulating cost functions until the next :py:meth:`reset`.
+        """
+
+        if self.__time_step is None or time_step != self.__time_step + 1:
+            self.__time_step = None
+
+        else:
+            self.__time_step = time_step
+
+        if len(self.district_state.buildings) == 0:
+            return
+
+        else:
+            pass
+
+        t = time_step
+        time_series = self.district_state.time_series
+        energy_simulation = {k: np.array([v_[t] for v_ in v], dtype='float32') for k, v in self.__energy_simulation.items()}
+        solar_generation = time_series['solar_generation'][:, t]
+        electricity_pricing = self.__electricity_pricing[:, t]
+        carbon_intensity = self.__carbon_intensity[:, t]
+        power_outage = time_series['power_outage_signal'][:, t] != 0.0
+
+        # net electricity consumption, cost and emission per condition
+        storage_electricity_consumption = [
+            time_series[f'{e}_storage.energy_balance'][:, t]/self.__storage_divisors[e][:, t] for e in self.END_USES
+        ]
+        without_storage = time_series['net_electricity_consumption'][:, t] - (
+            storage_electricity_consumption[0] + storage_electricity_consumption[1]\
+                + storage_electricity_consumption[2] + time_series['electrical_storage.electricity_consumption'][:, t]
+        )
+        partial_load_electricity_consumption = [
+            np.where(
+                self.__dynamics,
+                (energy_simulation[f'{e}_demand_without_control'] - energy_simulation[f'{e}_demand'])/self.__partial_load_divisors[e][:, t],
+                0.0
+            ).astype('float32') for e in ['cooling', 'heating']
+        ]
+        without_storage_and_partial_load = without_storage + (partial_load_electricity_consumption[0] + partial_load_electricity_consumption[1])
+        net_electricity_consumption = np.array([
+            time_series['net_electricity_consumption'][:, t],
+            without_storage,
+            without_storage - solar_generation,
+            without_storage_and_partial_load,
+            without_storage_and_partial_load - solar_generation,
+        ], dtype='float32')
+        cost = electricity_pricing*net_electricity_consumption
+        cost[0] = time_series['net_electricity_consumption_cost'][:, t]
+        emission = (carbon_intensity*net_electricity_consumption).clip(min=0)
+        emission[0] = time_series['net_electricity_consumption_emission'][:, t]
+
+        # district time series in DISTRICT_TIME_SERIES_NAMES order
+        energy_balance = [time_series[f'{e}_storage.energy_balance'][:, t] for e in self.END_USES + ['electrical']]
+        building_values = np.concatenate([net_electricity_consumption, cost, emission, np.array([
+            time_series['cooling_device.electricity_consumption'][:, t],
+            time_series['heating_device.electricity_consumption'][:, t],
+            time_series['dhw_device.electricity_consumption'][:, t],
+            *storage_electricity_consumption,
+            time_series['electrical_storage.electricity_consumption'][:, t],
+            *[np.maximum(v, 0.0) for v in energy_balance],
+            time_series['energy_from_cooling_device'][:, t],
+            time_series['energy_from_heating_device'][:, t],
+            time_series['energy_from_dhw_device'][:, t],
+            time_series['energy_to_non_shiftable_load'][:, t],
+            *[np.minimum(v, 0.0)*-1 for v in energy_balance],
+            energy_simulation['cooling_demand'],
+            energy_simulation['heating_demand'],
+            energy_simulation['dhw_demand'],
+            energy_simulation['non_shiftable_load'],
+            solar_generation,
+            time_series['power_outage_signal'][:, t],
+        ], dtype='float32')])
+        valid = building_values == building_values
+        district_values = np.where(valid, building_values, 0.0).sum(axis=1, dtype='float32')
+        district_values[~valid.any(axis=1)] = np.nan
+        self.__district_time_series_values[:, t] = district_values
+
+        if self.__time_step is None:
+            return
+
+        else:
+            pass
+
+        # building cost functions
+        self.__electricity_consumption += net_electricity_consumption.clip(min=0)
+        self.__zero_net_energy += net_electricity_consumption
+        self.__carbon_emissions += emission.clip(min=0)
+        self.__cost += cost.clip(min=0)
+
+        # comfort
+        occupied = energy_simulation['occupant_count'] > 0.0
+        self.__occupied_count += occupied
+        self.__occupied_power_outage_count += occupied & power_outage
+        cooling_delta = energy_simulation['indoor_dry_bulb_temperature'] - energy_simulation['indoor_dry_bulb_temperature_cooling_set_point']
+        heating_delta = energy_simulation['indoor_dry_bulb_temperature'] - energy_simulation['indoor_dry_bulb_temperature_heating_set_point']
+        hot = cooling_delta.astype('float64') > self.__comfort_band_values
+        cold = heating_delta.astype('float64') < -self.__comfort_band_values
+        self.__discomfort_count += hot | cold
+        self.__discomfort_cold_count += cold
+        self.__discomfort_hot_count += hot
+        delta = np.abs(np.array([heating_delta.clip(max=0), cooling_delta.clip(min=0)], dtype='float32'))
+        valid = delta == delta
+        self.__delta_minimum = np.fmin(self.__delta_minimum, delta)
+        self.__delta_maximum = np.fmax(self.__delta_maximum, delta)
+        self.__delta_sum += np.where(valid, delta, 0.0)
+        self.__delta_count += valid
+
+        # unserved energy
+        expected_energy = energy_simulation['cooling_demand'] + energy_simulation['heating_demand']\
+            + energy_simulation['dhw_demand'] + energy_simulation['non_shiftable_load']
+        served_energy = time_series['energy_from_cooling_device'][:, t]\
+            + np.minimum(time_series['cooling_storage.energy_balance'][:, t], 0.0)*-1\
+                + time_series['energy_from_heating_device'][:, t]\
+                    + np.minimum(time_series['heating_storage.energy_balance'][:, t], 0.0)*-1\
+                        + time_series['energy_from_dhw_device'][:, t]\
+                            + np.minimum(time_series['dhw_storage.energy_balance'][:, t], 0.0)*-1\
+                                + time_series['energy_to_non_shiftable_load'][:, t]
+        mask = np.array([power_outage, np.ones(power_outage.shape[0], dtype=bool)])
+        self.__unserved_energy += np.where(mask, expected_energy - served_energy, 0.0)
+        self.__expected_energy += np.where(mask, expected_energy, 0.0)
+
+        # district
+        district_net_electricity_consumption = net_electricity_consumption.sum(axis=1)
+
+        if self.__previous_district_net_electricity_consumption is not None:
+            self.__ramping += (district_net_electricity_consumption - self.__previous_district_net_electricity_consumption).clip(min=0)
+
+        else:
+            pass
+
+        self.__previous_district_net_electricity_consumption = district_net_electricity_consumption
+        district_net_electricity_consumption = district_net_electricity_consumption.astype('float64')
+        new_window = (t%self.__windows == 0) & (t > 0)
+
+        if new_window.any():
+            self.__add_window_values(new_window)
+            self.__window_sum[new_window] = 0.0
+            self.__window_count[new_window] = 0.0
+            self.__window_maximum[new_window] = np.nan
+
+        else:
+            pass
+
+        valid = district_net_electricity_consumption == district_net_electricity_consumption
+        self.__window_sum += np.where(valid, district_net_electricity_consumption, 0.0)
+        self.__window_count += valid
+        self.__window_maximum = np.fmax(self.__window_maximum, district_net_electricity_consumption)
+
+    def get_building_cost_functions(self, control_condition: str, baseline_condition: str, comfort_band: float) -> List[List[Mapping[str, Union[str, float]]]]:
+        r"""Returns building-level cost functions at the last updated time step.
+
+        Parameters
+        ----------
+        control_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the control scenario.
+        baseline_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the baseline scenario.
+        comfort_band: float
+            Comfort band. Must be one of `comfort_bands`.
+
+        Returns
+        -------
+        cost_functions: List[List[Mapping[str, Union[str, float]]]]
+            `cost_function` name and `value` records for each building in the same order as
+            :py:meth:`citylearn.citylearn.CityLearnEnv.evaluate`.
+        """
+
+        c = self.CONDITIONS.index(control_condition)
+        b = self.CONDITIONS.index(baseline_condition)
+        k = self.comfort_bands.index(comfort_band)
+        cost_functions = []
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            discomfort = self.__discomfort_count[k]/self.__occupied_count
+            discomfort_cold = self.__discomfort_cold_count[k]/self.__occupied_count
+            discomfort_hot = self.__discomfort_hot_count[k]/self.__occupied_count
+            thermal_resilience = self.__discomfort_count[k]/self.__occupied_power_outage_count
+            average_delta = self.__delta_sum/self.__delta_count
+            unserved_energy = self.__unserved_energy/self.__expected_energy
+
+        for i in range(len(self.district_state.buildings)):
+            cost_functions.append([{
+                'cost_function': 'electricity_consumption_total',
+                'value': float(self.__electricity_consumption[c, i])/float(self.__electricity_consumption[b, i]),
+            }, {
+                'cost_function': 'zero_net_energy',
+                'value': float(self.__zero_net_energy[c, i])/float(self.__zero_net_energy[b, i]),
+            }, {
+                'cost_function': 'carbon_emissions_total',
+                'value': float(self.__carbon_emissions[c, i])/float(self.__carbon_emissions[b, i])\
+                    if self.__carbon_intensity_available[i] else None,
+            }, {
+                'cost_function': 'cost_total',
+                'value': float(self.__cost[c, i])/float(self.__cost[b, i])\
+                    if self.__electricity_pricing_available[i] else None,
+            }, {
+                'cost_function': 'discomfort_proportion',
+                'value': float(discomfort[i]),
+            }, {
+                'cost_function': 'discomfort_cold_proportion',
+                'value': float(discomfort_cold[i]),
+            }, {
+                'cost_function': 'discomfort_hot_proportion',
+                'value': float(discomfort_hot[i]),
+            }, {
+                'cost_function': 'discomfort_cold_delta_minimum',
+                'value': float(self.__delta_minimum[0, i]),
+            }, {
+                'cost_function': 'discomfort_cold_delta_maximum',
+                'value': float(self.__delta_maximum[0, i]),
+            }, {
+                'cost_function': 'discomfort_cold_delta_average',
+                'value': float(average_delta[0, i]),
+            }, {
+                'cost_function': 'discomfort_hot_delta_minimum',
+                'value': float(self.__delta_minimum[1, i]),
+            }, {
+                'cost_function': 'discomfort_hot_delta_maximum',
+                'value': float(self.__delta_maximum[1, i]),
+            }, {
+                'cost_function': 'discomfort_hot_delta_average',
+                'value': float(average_delta[1, i]),
+            }, {
+                'cost_function': 'one_minus_thermal_resilience_proportion',
+                'value': float(thermal_resilience[i]),
+            }, {
+                'cost_function': 'power_outage_normalized_unserved_energy_total',
+                'value': float(unserved_energy[0, i]),
+            }, {
+                'cost_function': 'annual_normalized_unserved_energy_total',
+                'value': float(unserved_energy[1, i]),
+            }])
+
+        return cost_functions
+
+    def get_district_cost_functions(self, control_condition: str, baseline_condition: str, all_time_peak_window: int) -> List[Mapping[str, Union[str, float]]]:
+        r"""Returns district-level cost functions at the last updated time step.
+
+        Parameters
+        ----------
+        control_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the control scenario.
+        baseline_condition: str
+            :py:class:`citylearn.citylearn.EvaluationCondition` value for the baseline scenario.
+        all_time_peak_window: int
+            Peak window used for `all_time_peak_average`. Must be one of `peak_windows`.
+
+        Returns
+        -------
+        cost_functions: List[Mapping[str, Union[str, float]]]
+            `cost_function` name and `value` records in the same order as :py:meth:`citylearn.citylearn.CityLearnEnv.evaluate`.
+        """
+
+        c = self.CONDITIONS.index(control_condition)
+        b = self.CONDITIONS.index(baseline_condition)
+        ramping = self.__ramping if self.__time_step > 0 else np.full(len(self.CONDITIONS), np.nan, dtype='float64')
+        value = self.__get_window_values()
+        load_factor = {int(w): v for w, v, l in zip(self.__windows, value, self.__load_factor_window[:, 0]) if l}
+        peak = {int(w): v for w, v, l in zip(self.__windows, value, self.__load_factor_window[:, 0]) if not l}
+
+        return [{
+            'cost_function': 'ramping_average',
+            'value': float(ramping[c])/float(ramping[b]),
+        }, {
+            'cost_function': 'daily_one_minus_load_factor_average',
+            'value': float(load_factor[24][c])/float(load_factor[24][b]),
+        },{
+            'cost_function': 'monthly_one_minus_load_factor_average',
+            'value': float(load_factor[730][c])/float(load_factor[730][b]),
+        }, {
+            'cost_function': 'daily_peak_average',
+            'value': float(peak[24][c])/float(peak[24][b]),
+        }, {
+            'cost_function': 'all_time_peak_average',
+            'value': float(peak[all_time_peak_window][c])/float(peak[all_time_peak_window][b]),
+        }]
+
+    def __get_window_values(self) -> np.ndarray:
+        """Returns mean of completed and current window values for each tracked window."""
+
+        value_sum = self.__window_value_sum.copy()
+        value_count = self.__window_value_count.copy()
+        self.__add_window_values(np.ones(self.__windows.shape[0], dtype=bool), value_sum, value_count)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = np.where(value_count > 0, value_sum/value_count, np.nan)
+
+        return value
+
+    def __add_window_values(self, windows: np.ndarray, value_sum: np.ndarray = None, value_count: np.ndarray = None):
+        """Adds current `one_minus_load_factor` or `peak` value of selected `windows` to completed window values."""
+
+        value_sum = self.__window_value_sum if value_sum is None else value_sum
+        value_count = self.__window_value_count if value_count is None else value_count
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = np.where(
+                self.__load_factor_window,
+                1 - (self.__window_sum/self.__window_count)/self.__window_maximum,
+                self.__window_maximum
+            )[windows]
+
+        valid = value == value
+        value_sum[windows] += np.where(valid, value, 0.0)
+        value_count[windows] += valid
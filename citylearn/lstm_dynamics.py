@@ -0,0 +1,426 @@
+import os
+from pathlib import Path
+from typing import Any, List, Mapping, Union
+import numpy as np
+import torch
+import torch.nn
+from citylearn.dynamics import Dynamics
+
+class LSTMDynamics(Dynamics, torch.nn.Module):
+    """LSTM building dynamics model that predicts indoor temperature based on partial cooling/heating load and other weather variables.
+    
+    Parameters
+    ----------
+    filepath: Union[Path, str]
+        Path to model state dictionary.
+    input_observation_names: List[str]
+        List of maximum values used for input observation min-max normalization.
+    input_normalization_minimum: List[float]
+        List of minumum values used for input observation min-max normalization.
+    input_normalization_maximum: List[float]
+        List of maximum values used for input observation min-max normalization.
+    hidden_size: int
+        The number of neurons in hidden layer.
+    num_layers: int
+        Number of hidden layers.
+    lookback: int
+        Number of samples used for prediction.
+    input_size: int, optional
+        Number of variables used for prediction. This may not equal `input_observation_names`
+        e.g. cooling and heating demand may be included in `input_observation_names` but only
+        one of two may be used for the actual prediction depending on building needs.
+        The default is to set set `input_size` to the length of `input_observation_names`.
+    dropout: float, default: 0.0
+        Probability of excluding input and recurrent connections to LSTM units from activation 
+        and weight updates while training a network. This has the effect of reducing overfitting 
+        and improving model performance.
+
+    Notes
+    -----
+    State dictionaries are read from `filepath` once per process and shared read-only by all models that use the same file,
+    so that :py:meth:`reset` restores weights with an in-memory copy or skips the restore when weights are frozen.
+    """
+
+    __STATE_DICTS = {}
+
+    def __init__(
+            self, filepath: Union[Path, str], input_observation_names: List[str], input_normalization_minimum: List[float], 
+            input_normalization_maximum: List[float], hidden_size: int, num_layers: int, lookback: int, input_size: int = None,
+            dropout: float = None
+    ):
+        Dynamics.__init__(self)
+        torch.nn.Module.__init__(self)
+        assert len(input_observation_names) == len(input_normalization_minimum) == len(input_normalization_maximum),\
+            'input_observation_names, input_normalization_minimum and input_normalization_maximum must have the same length.'
+        self.input_observation_names = input_observation_names
+        self.input_normalization_minimum = input_normalization_minimum
+        self.input_normalization_maximum = input_normalization_maximum
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.num_layers = num_layers
+        self.lookback = lookback
+        self.filepath = filepath
+        self.l_lstm = self.set_lstm()
+        self.l_linear = self.set_linear()
+        self._hidden_state = None
+        self._model_input = None
+        self._model_input_time_step = None
+        self.__state_dict_key = None
+        self.dropout = torch.nn.Dropout(dropout if dropout is not None else 0.0)
+
+    @property
+    def input_size(self) -> int:
+        return self.__input_size
+    
+    @input_size.setter
+    def input_size(self, value: int):
+        self.__input_size = len(self.input_observation_names) if value is None else value
+    
+    def set_lstm(self) -> torch.nn.LSTM:
+        """Initialize LSTM model."""
+
+        return torch.nn.LSTM(
+            input_size=self.input_size,
+            hidden_size=self.hidden_size,
+            num_layers=self.num_layers,
+            batch_first=True,
+        )
+
+    def set_linear(self) -> torch.nn.Linear:
+        """Initialize linear transformer."""
+
+        return torch.nn.Linear(
+            in_features=self.hidden_size,
+            out_features=1
+        )
+    
+    def forward(self, x, h):
+        """Predict indoor dry bulb temperature."""
+
+        lstm_out, h = self.l_lstm(x, h)
+        lstm_out = self.dropout(lstm_out)
+        out = lstm_out[:, -1, :]
+        out_linear_transf = self.l_linear(out)
+        return out_linear_transf, h
+
+    def init_hidden(self, batch_size: int):
+        """Initialize hidden states."""
+
+        hidden_state = torch.zeros(self.num_layers, batch_size, self.hidden_size)
+        cell_state = torch.zeros(self.num_layers, batch_size, self.hidden_size)
+        hidden = (hidden_state, cell_state)
+        
+        return hidden
+
+    def reset(self):
+        """Loads dynamic model state dict, and initializes hidden states and model input.
+        
+        The state dict is not restored if it was already loaded from the same file and all
+        parameters have `requires_grad` set to `False`, i.e. the weights are frozen.
+        """
+
+        super().reset()
+        key = LSTMDynamics.get_state_dict_key(self.filepath)
+        frozen = all(not p.requires_grad for p in self.parameters())
+
+        if key != self.__state_dict_key or not frozen:
+            self.load_state_dict(LSTMDynamics.get_state_dict(self.filepath))
+            self.__state_dict_key = key
+
+        else:
+            pass
+
+        self._hidden_state = self.init_hidden(1)
+        self._model_input = np.zeros((2*(self.lookback + 1), len(self.input_observation_names)), dtype='float32')
+        self._model_input_time_step = 0
+
+    @property
+    def model_input(self) -> np.ndarray:
+        r"""Normalized input observations of the last `lookback` + 1 time steps in chronological order.
+
+        The model input is kept in a preallocated float32 ring buffer where each row is written twice, `lookback` + 1
+        rows apart, so that the window is always a contiguous view of shape (`lookback` + 1, `len(input_observation_names)`).
+        """
+
+        start_ix = self._model_input_time_step%(self.lookback + 1)
+
+        return self._model_input[start_ix:start_ix + self.lookback + 1]
+
+    @property
+    def model_input_ready(self) -> bool:
+        """Whether :py:attr:`model_input` has been filled for `lookback` + 1 time steps."""
+
+        return self._model_input_time_step is not None and self._model_input_time_step >= self.lookback + 1
+
+    def update_model_input(self, values: np.ndarray):
+        """Append normalized input observations for current time step to :py:attr:`model_input` dropping the oldest.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            Normalized value of each of `input_observation_names`.
+        """
+
+        ix = self._model_input_time_step%(self.lookback + 1)
+        self._model_input[ix] = values
+        self._model_input[ix + self.lookback + 1] = values
+        self._model_input_time_step += 1
+
+    def set_current_model_input(self, ix: int, value: float):
+        """Set normalized value of input observation at index `ix` in `input_observation_names` for current time step."""
+
+        row_ix = (self._model_input_time_step - 1)%(self.lookback + 1)
+        self._model_input[row_ix, ix] = value
+        self._model_input[row_ix + self.lookback + 1, ix] = value
+
+    def predict(self, model_input: np.ndarray) -> float:
+        """Predict normalized indoor dry-bulb temperature and advance `hidden_state` in place.
+
+        Parameters
+        ----------
+        model_input: np.ndarray
+            Model input of shape (`input_size`, `lookback`).
+
+        Returns
+        -------
+        prediction: float
+        """
+
+        model_input_tensor = torch.from_numpy(np.ascontiguousarray(model_input.T, dtype='float32'))[None, :, :]
+
+        with torch.no_grad():
+            prediction, hidden_state = self(model_input_tensor, self._hidden_state)
+
+            for h, h_next in zip(self._hidden_state, hidden_state):
+                h.copy_(h_next)
+
+        return prediction.item()
+
+    @staticmethod
+    def get_state_dict(filepath: Union[Path, str]) -> Mapping[str, torch.Tensor]:
+        """Returns the process-wide copy of model state dict in `filepath` that is read on first call and shared by later calls.
+
+        The file is read again if its modification time or size changes. The shared state dict must not be modified.
+
+        Parameters
+        ----------
+        filepath: Union[Path, str]
+            Path to model state dictionary or checkpoint with `model_state_dict` key.
+
+        Returns
+        -------
+        state_dict: Mapping[str, torch.Tensor]
+        """
+
+        key = LSTMDynamics.get_state_dict_key(filepath)
+
+        if key not in LSTMDynamics.__STATE_DICTS:
+            data = torch.load(filepath, map_location=torch.device('cpu'))
+            data = data['model_state_dict'] if isinstance(data, Mapping) and 'model_state_dict' in data else data
+            LSTMDynamics.__STATE_DICTS = {
+                k: v for k, v in LSTMDynamics.__STATE_DICTS.items() if k[0] != key[0]
+            }
+            LSTMDynamics.__STATE_DICTS[key] = data
+
+        else:
+            pass
+
+        return LSTMDynamics.__STATE_DICTS[key]
+
+    @staticmethod
+    def get_state_dict_key(filepath: Union[Path, str]) -> tuple:
+        """Returns the cache key of `filepath` made of its absolute path, modification time and size."""
+
+        stat = os.stat(filepath)
+
+        return (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def clear_state_dict_cache():
+        """Removes all state dicts shared by :py:meth:`get_state_dict`."""
+
+        LSTMDynamics.__STATE_DICTS = {}
+
+    def terminate(self):
+        return
+
+class LSTMDynamicsExecutor:
+    r"""Batched inference for a collection of :py:class:`citylearn.lstm_dynamics.LSTMDynamics` models.
+
+    Models that share an architecture, i.e. `input_size`, `hidden_size`, `num_layers` and `lookback`, are grouped and
+    their weights stacked so that each group is advanced with one set of batched matrix multiplications per time step
+    instead of one forward pass of batch size 1 per model. Models whose forward pass cannot be reproduced this way, e.g.
+    subclasses that override :py:meth:`LSTMDynamics.forward` or models with active dropout, are predicted individually.
+
+    Parameters
+    ----------
+    dynamics: List[LSTMDynamics]
+        Dynamics models to predict with.
+
+    Notes
+    -----
+    Weights are stacked in :py:meth:`reset` and stacked again in :py:meth:`predict` when any parameter of a group has been
+    modified since e.g. by an optimizer step or :py:meth:`torch.nn.Module.load_state_dict`.
+    """
+
+    def __init__(self, dynamics: List[LSTMDynamics]):
+        self.dynamics = dynamics
+        self.__groups = []
+        self.__group_ixs = []
+
+    @property
+    def dynamics(self) -> List[LSTMDynamics]:
+        """Dynamics models to predict with."""
+
+        return self.__dynamics
+
+    @dynamics.setter
+    def dynamics(self, dynamics: List[LSTMDynamics]):
+        self.__dynamics = list(dynamics)
+
+    def reset(self):
+        """Group models by architecture and stack the weights of each group."""
+
+        groups = {}
+        self.__group_ixs = [None]*len(self.dynamics)
+
+        for i, d in enumerate(self.dynamics):
+            key = (d.input_size, d.hidden_size, d.num_layers, d.lookback) if self.__is_batchable(d) else (i,)
+            groups[key] = groups.get(key, []) + [i]
+
+        self.__groups = []
+
+        for members in groups.values():
+            for j, i in enumerate(members):
+                self.__group_ixs[i] = (len(self.__groups), j)
+
+            group = {
+                'members': members, 'batchable': self.__is_batchable(self.dynamics[members[0]]),
+                'layers': None, 'linear': None, 'versions': None
+            }
+            self.__stack(group)
+            self.__groups.append(group)
+
+    def predict(self, ixs: List[int], inputs: List[np.ndarray]) -> np.ndarray:
+        r"""Predict normalized indoor dry-bulb temperature with a subset of models and advance their hidden states.
+
+        Parameters
+        ----------
+        ixs: List[int]
+            Indices of models in :py:attr:`dynamics` to predict with.
+        inputs: List[np.ndarray]
+            Model input of shape (`input_size`, `lookback`) for each model in `ixs` as returned by
+            :py:meth:`citylearn.building.LSTMDynamicsBuilding.get_dynamics_input`.
+
+        Returns
+        -------
+        predictions: np.ndarray
+            Normalized prediction for each model in `ixs`.
+        """
+
+        predictions = np.zeros(len(ixs), dtype='float32')
+        group_requests = {}
+
+        for k, i in enumerate(ixs):
+            g, j = self.__group_ixs[i]
+            group_requests[g] = group_requests.get(g, []) + [(k, j)]
+
+        for g, requests in group_requests.items():
+            group = self.__groups[g]
+            ks = [k for k, _ in requests]
+            js = [j for _, j in requests]
+
+            if not group['batchable']:
+                predictions[ks] = [self.dynamics[group['members'][j]].predict(inputs[k]) for k, j in requests]
+
+            else:
+                # weights may have been updated in place e.g. by an optimizer step or load_state_dict since they were stacked
+                if group['versions'] != self.__get_versions(group):
+                    self.__stack(group)
+
+                else:
+                    pass
+
+                predictions[ks] = self.__predict_group(group, js, np.stack([inputs[k] for k in ks]))
+
+        return predictions
+
+    def __stack(self, group: Mapping[str, Any]):
+        """Stack the LSTM and linear weights of the members of a batchable `group` along a new first dimension."""
+
+        if group['batchable']:
+            models = [self.dynamics[i] for i in group['members']]
+
+            with torch.no_grad():
+                group['layers'] = [{
+                    n: torch.stack([getattr(m.l_lstm, f'{n}_l{l}').detach() for m in models])
+                    for n in ['weight_ih', 'weight_hh', 'bias_ih', 'bias_hh']
+                } for l in range(models[0].num_layers)]
+                group['linear'] = {n: torch.stack([getattr(m.l_linear, n).detach() for m in models]) for n in ['weight', 'bias']}
+
+            group['versions'] = self.__get_versions(group)
+
+        else:
+            pass
+
+    def __get_versions(self, group: Mapping[str, Any]) -> List[tuple]:
+        """Returns the version counter and storage address of every parameter of the members of `group`.
+
+        Both change when a parameter is modified in place or its data is replaced, which invalidates the stacked weights.
+        """
+
+        return [(p._version, p.data_ptr()) for i in group['members'] for p in self.dynamics[i].parameters()]
+
+    def __predict_group(self, group: Mapping[str, Any], js: List[int], inputs: np.ndarray) -> np.ndarray:
+        """Grouped LSTM forward pass for members `js` of `group` with inputs of shape (`len(js)`, `input_size`, `lookback`)."""
+
+        models = [self.dynamics[group['members'][j]] for j in js]
+        select = None if len(js) == len(group['members']) else torch.tensor(js)
+        get = lambda v: v if select is None else v.index_select(0, select)
+
+        with torch.no_grad():
+            x = torch.from_numpy(np.ascontiguousarray(inputs.transpose(0, 2, 1), dtype='float32'))
+            h = torch.stack([m._hidden_state[0][:, 0, :] for m in models])
+            c = torch.stack([m._hidden_state[1][:, 0, :] for m in models])
+            h_out, c_out = [], []
+
+            for l, layer in enumerate(group['layers']):
+                weight_ih, weight_hh = get(layer['weight_ih']), get(layer['weight_hh'])
+                bias_ih, bias_hh = get(layer['bias_ih']), get(layer['bias_hh'])
+                projection = torch.baddbmm(bias_ih[:, None, :], x, weight_ih.transpose(1, 2))
+                h_l, c_l = h[:, l, :], c[:, l, :]
+                outputs = []
+
+                for t in range(x.shape[1]):
+                    gates = projection[:, t, :] + torch.baddbmm(bias_hh[:, None, :], h_l[:, None, :], weight_hh.transpose(1, 2))[:, 0, :]
+                    i_gate, f_gate, g_gate, o_gate = gates.chunk(4, dim=1)
+                    c_l = torch.sigmoid(f_gate)*c_l + torch.sigmoid(i_gate)*torch.tanh(g_gate)
+                    h_l = torch.sigmoid(o_gate)*torch.tanh(c_l)
+                    outputs.append(h_l)
+
+                x = torch.stack(outputs, dim=1)
+                h_out.append(h_l)
+                c_out.append(c_l)
+
+            h = torch.stack(h_out, dim=1)
+            c = torch.stack(c_out, dim=1)
+            weight, bias = get(group['linear']['weight']), get(group['linear']['bias'])
+            out = torch.baddbmm(bias[:, None, :], x[:, -1:, :], weight.transpose(1, 2))[:, 0, 0]
+
+            for k, m in enumerate(models):
+                m._hidden_state[0].copy_(h[k][:, None, :])
+                m._hidden_state[1].copy_(c[k][:, None, :])
+
+        return out.numpy()
+
+    @staticmethod
+    def __is_batchable(dynamics: LSTMDynamics) -> bool:
+        """Whether the forward pass of `dynamics` is the unidirectional LSTM and linear head that :py:meth:`predict` batches."""
+
+        lstm = dynamics.l_lstm
+
+        return type(dynamics).forward is LSTMDynamics.forward \
+            and type(lstm) == torch.nn.LSTM and type(dynamics.l_linear) == torch.nn.Linear \
+                and lstm.batch_first and lstm.bias and not lstm.bidirectional and lstm.proj_size == 0 \
+                    and (lstm.dropout == 0.0 or lstm.num_layers == 1 or not lstm.training) \
+                        and (dynamics.dropout.p == 0.0 or not dynamics.dropout.training)
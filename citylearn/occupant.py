@@ -1,11 +1,13 @@
 from pathlib import Path
-from typing import List, Mapping, Tuple, Union
+from typing import Any, List, Mapping, Tuple, TYPE_CHECKING, Union
 import numpy as np
-from sklearn.tree import DecisionTreeClassifier
 from citylearn.base import Environment
 from citylearn.data import LogisticRegressionOccupantParameters
 from citylearn.utilities import read_pickle
 
+if TYPE_CHECKING:
+    from sklearn.tree import DecisionTreeClassifier
+
 class Occupant(Environment):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -15,15 +17,112 @@ class Occupant(Environment):
 
         return delta
 
+class DecisionTreeArrays:
+    r"""Plain numpy representation of fitted `sklearn.tree.DecisionTreeClassifier` trees.
+
+    Parameters
+    ----------
+    feature: np.ndarray
+        Split feature index of each node.
+    threshold: np.ndarray
+        Split threshold of each node. Samples with feature value <= threshold go to the left child.
+    children_left: np.ndarray
+        Left child index of each node or -1 for leaves.
+    children_right: np.ndarray
+        Right child index of each node or -1 for leaves.
+    outputs: np.ndarray
+        Predicted class of each node.
+
+    Notes
+    -----
+    Several trees can be stored in one set of arrays with :py:meth:`concatenate` and each sample can be evaluated with
+    a different tree by parsing the trees' root node indices to :py:meth:`predict`.
+    """
+
+    LEAF = -1
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, children_left: np.ndarray, children_right: np.ndarray, outputs: np.ndarray):
+        self.feature = np.asarray(feature, dtype='int64')
+        self.threshold = np.asarray(threshold, dtype='float64')
+        self.children_left = np.asarray(children_left, dtype='int64')
+        self.children_right = np.asarray(children_right, dtype='int64')
+        self.outputs = np.asarray(outputs)
+
+    @property
+    def node_count(self) -> int:
+        return self.feature.shape[0]
+
+    @classmethod
+    def from_model(cls, model: Any) -> 'DecisionTreeArrays':
+        """Returns arrays of a fitted single-output decision tree classifier or `None` if `model` is not one."""
+
+        tree = getattr(model, 'tree_', None)
+        classes = getattr(model, 'classes_', None)
+
+        if tree is None or classes is None or getattr(model, 'n_outputs_', 1) != 1 or isinstance(classes, list):
+            return None
+
+        else:
+            return cls(tree.feature, tree.threshold, tree.children_left, tree.children_right, classes[np.argmax(tree.value[:, 0, :], axis=1)])
+
+    @classmethod
+    def concatenate(cls, trees: List['DecisionTreeArrays']) -> Tuple['DecisionTreeArrays', np.ndarray]:
+        """Returns `trees` stored in one set of arrays and the root node index of each tree."""
+
+        roots = np.cumsum([0] + [t.node_count for t in trees[:-1]], dtype='int64')
+        offset_children = lambda c, o: np.where(c == cls.LEAF, cls.LEAF, c + o)
+        tree = cls(
+            np.concatenate([t.feature for t in trees]),
+            np.concatenate([t.threshold for t in trees]),
+            np.concatenate([offset_children(t.children_left, o) for t, o in zip(trees, roots)]),
+            np.concatenate([offset_children(t.children_right, o) for t, o in zip(trees, roots)]),
+            np.concatenate([t.outputs for t in trees]),
+        )
+
+        return tree, roots
+
+    def predict(self, x: np.ndarray, roots: np.ndarray = None) -> np.ndarray:
+        r"""Returns predicted class of each sample.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            Samples of shape (`n_samples`, `n_features`).
+        roots: np.ndarray, optional
+            Root node index of the tree to evaluate each sample with. Defaults to the first tree.
+
+        Returns
+        -------
+        outputs: np.ndarray
+            Predicted class of each sample.
+        """
+
+        # sklearn compares float32 features to float64 thresholds
+        x = np.atleast_2d(np.asarray(x, dtype='float32'))
+        rows = np.arange(x.shape[0])
+        nodes = np.zeros(x.shape[0], dtype='int64') if roots is None else np.array(roots, dtype='int64')
+        active = rows[self.children_left[nodes] != self.LEAF]
+
+        while active.shape[0] > 0:
+            n = nodes[active]
+            left = x[active, self.feature[n]] <= self.threshold[n]
+            nodes[active] = np.where(left, self.children_left[n], self.children_right[n])
+            active = active[self.children_left[nodes[active]] != self.LEAF]
+
+        return self.outputs[nodes]
+
 class LogisticRegressionOccupant(Occupant):
     def __init__(
             self, setpoint_increase_model_filepath: Union[Path, str], setpoint_decrease_model_filepath: Union[Path, str], 
             delta_output_map: Mapping[int, float], parameters: LogisticRegressionOccupantParameters, **kwargs
         ):
         super().__init__(**kwargs)
-        self.__setpoint_increase_model: DecisionTreeClassifier = None
-        self.__setpoint_decrease_model: DecisionTreeClassifier = None
+        self.__setpoint_increase_model: 'DecisionTreeClassifier' = None
+        self.__setpoint_decrease_model: 'DecisionTreeClassifier' = None
+        self.__setpoint_increase_tree: DecisionTreeArrays = None
+        self.__setpoint_decrease_tree: DecisionTreeArrays = None
         self.__probabilities = None
+        self.__random_state = None
         self.setpoint_increase_model_filepath = setpoint_increase_model_filepath
         self.setpoint_decrease_model_filepath = setpoint_decrease_model_filepath
         self.delta_output_map = delta_output_map
@@ -44,51 +143,73 @@ class LogisticRegressionOccupant(Occupant):
     @property
     def delta_output_map(self) -> Mapping[int, float]:
         return self.__delta_output_map
+
+    @property
+    def setpoint_increase_model(self) -> 'DecisionTreeClassifier':
+        """Set point increase model read from `setpoint_increase_model_filepath`."""
+
+        return self.__setpoint_increase_model
+
+    @property
+    def setpoint_decrease_model(self) -> 'DecisionTreeClassifier':
+        """Set point decrease model read from `setpoint_decrease_model_filepath`."""
+
+        return self.__setpoint_decrease_model
+
+    @property
+    def setpoint_increase_tree(self) -> DecisionTreeArrays:
+        """Numpy representation of `setpoint_increase_model` or `None` if it is not a decision tree classifier."""
+
+        return self.__setpoint_increase_tree
+
+    @property
+    def setpoint_decrease_tree(self) -> DecisionTreeArrays:
+        """Numpy representation of `setpoint_decrease_model` or `None` if it is not a decision tree classifier."""
+
+        return self.__setpoint_decrease_tree
+
+    @property
+    def random_state(self) -> np.random.RandomState:
+        """Pseudorandom number generator that is seeded with `random_seed` on :py:meth:`reset` and draws one
+        random probability per :py:meth:`predict` call."""
+
+        return self.__random_state
     
     @setpoint_increase_model_filepath.setter
     def setpoint_increase_model_filepath(self, value: Union[Path, str]):
         self.__setpoint_increase_model_filepath = value
         self.__setpoint_increase_model = read_pickle(self.setpoint_increase_model_filepath)
+        self.__setpoint_increase_tree = DecisionTreeArrays.from_model(self.__setpoint_increase_model)
 
     @setpoint_decrease_model_filepath.setter
     def setpoint_decrease_model_filepath(self, value: Union[Path, str]):
         self.__setpoint_decrease_model_filepath = value
         self.__setpoint_decrease_model = read_pickle(self.setpoint_decrease_model_filepath)
+        self.__setpoint_decrease_tree = DecisionTreeArrays.from_model(self.__setpoint_decrease_model)
 
     @delta_output_map.setter
     def delta_output_map(self, value: Mapping[Union[str, int], float]):
         self.__delta_output_map = {int(k): v for k, v in value.items()}
 
     def predict(self, x: Tuple[float, List[List[float]]]) -> float:
-        delta = super().predict()
-        response = None
         interaction_input, delta_input = x
-        interaction_probability = lambda  a, b, x_ : 1/(1 + np.exp(-(a + b*x_)))
-        increase_setpoint_probability = interaction_probability(self.parameters.a_increase[self.time_step], self.parameters.b_increase[self.time_step], interaction_input)
-        decrease_setpoint_probability = interaction_probability(self.parameters.a_decrease[self.time_step], self.parameters.b_decrease[self.time_step], interaction_input)
-        random_seed = max(self.random_seed, 1) + self.time_step
-        nprs = np.random.RandomState(random_seed)
-        random_probability = nprs.uniform()
-        self.__probabilities['increase_setpoint'][self.time_step] = increase_setpoint_probability
-        self.__probabilities['decrease_setpoint'][self.time_step] = decrease_setpoint_probability
-        self.__probabilities['random'][self.time_step] = random_probability
-        
-        if (increase_setpoint_probability < random_probability and decrease_setpoint_probability < random_probability) \
-                or (increase_setpoint_probability >= random_probability and decrease_setpoint_probability >= random_probability):
-            pass
-
-        elif increase_setpoint_probability >= random_probability:
-            response = self.__setpoint_increase_model.predict(delta_input)
-            delta = self.delta_output_map[response[0]]
+        delta = LogisticRegressionOccupantExecutor.predict_occupants(
+            [self], 
+            np.array([[
+                self.parameters.a_increase[self.time_step], self.parameters.b_increase[self.time_step],
+                self.parameters.a_decrease[self.time_step], self.parameters.b_decrease[self.time_step],
+            ]], dtype='float32'),
+            [interaction_input],
+            [delta_input],
+        )[0]
 
-        elif decrease_setpoint_probability >= random_probability:
-            response = self.__setpoint_decrease_model.predict(delta_input)
-            delta = -self.delta_output_map[response[0]]
+        return float(delta)
 
-        else:
-            pass
+    @staticmethod
+    def get_interaction_probability(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Returns logistic probability of set point interaction given temperature `x`."""
 
-        return delta
+        return 1/(1 + np.exp(-(a + b*x)))
     
     def reset(self):
         super().reset()
@@ -96,4 +217,154 @@ class LogisticRegressionOccupant(Occupant):
             'increase_setpoint': np.zeros(self.episode_tracker.episode_time_steps, dtype='float32'),
             'decrease_setpoint': np.zeros(self.episode_tracker.episode_time_steps, dtype='float32'),
             'random': np.zeros(self.episode_tracker.episode_time_steps, dtype='float32'),
-        }
\ No newline at end of file
+        }
+        self.__random_state = np.random.RandomState(self.random_seed)
+
+class LogisticRegressionOccupantExecutor:
+    r"""Batched set point delta prediction for a collection of :py:class:`citylearn.occupant.LogisticRegressionOccupant` models.
+
+    The interaction probabilities of all occupants are calculated in one set of array operations and the set point increase
+    and decrease decision trees of all occupants are concatenated into one :py:class:`DecisionTreeArrays` each so that the
+    occupants that interact at a time step are evaluated in one call per tree type instead of one `sklearn` call per occupant.
+    Occupants whose models are not decision tree classifiers are predicted individually with their `sklearn` model.
+
+    Parameters
+    ----------
+    occupants: List[LogisticRegressionOccupant]
+        Occupant models to predict with.
+
+    Notes
+    -----
+    Interaction parameters of the current episode are stacked in :py:meth:`reset` hence, :py:meth:`reset` must be called
+    after the occupants' parameters have been set to the episode's time steps.
+    """
+
+    def __init__(self, occupants: List[LogisticRegressionOccupant]):
+        self.occupants = occupants
+        self.__parameters = None
+        self.__trees = {}
+
+    @property
+    def occupants(self) -> List[LogisticRegressionOccupant]:
+        """Occupant models to predict with."""
+
+        return self.__occupants
+
+    @occupants.setter
+    def occupants(self, occupants: List[LogisticRegressionOccupant]):
+        self.__occupants = list(occupants)
+
+    def reset(self):
+        """Stack the occupants' episode interaction parameters and concatenate their decision trees."""
+
+        names = ['a_increase', 'b_increase', 'a_decrease', 'b_decrease']
+        self.__parameters = np.stack([
+            np.stack([getattr(o.parameters, n) for n in names], axis=1) for o in self.occupants
+        ]) if len(self.occupants) > 0 else None
+        self.__trees = self.get_trees(self.occupants)
+
+    def predict(self, ixs: List[int], interaction_inputs: List[float], delta_inputs: List[List[List[float]]]) -> np.ndarray:
+        r"""Returns set point delta of occupants in `ixs` at their current time step.
+
+        Parameters
+        ----------
+        ixs: List[int]
+            Indices of occupants in :py:attr:`occupants` to predict.
+        interaction_inputs: List[float]
+            Indoor dry-bulb temperature of each occupant's building.
+        delta_inputs: List[List[List[float]]]
+            Set point model input sample of each occupant's building.
+
+        Returns
+        -------
+        deltas: np.ndarray
+            Set point delta of each occupant.
+        """
+
+        ixs = np.array(ixs, dtype='int64')
+        occupants = [self.occupants[i] for i in ixs]
+        time_steps = np.array([o.time_step for o in occupants], dtype='int64')
+
+        return self.predict_occupants(occupants, self.__parameters[ixs, time_steps], interaction_inputs, delta_inputs, trees={
+            k: (t, r[ixs]) for k, (t, r) in self.__trees.items()
+        })
+
+    @classmethod
+    def predict_occupants(
+        cls, occupants: List[LogisticRegressionOccupant], parameters: np.ndarray, interaction_inputs: List[float], 
+        delta_inputs: List[List[List[float]]], trees: Mapping[str, Tuple[DecisionTreeArrays, np.ndarray]] = None
+    ) -> np.ndarray:
+        """Returns set point delta of `occupants` given their current interaction `parameters` of shape (`n_occupants`, 4)
+        ordered as increase intercept, increase coefficient, decrease intercept and decrease coefficient."""
+
+        trees = cls.get_trees(occupants) if trees is None else trees
+        x = np.array(interaction_inputs, dtype='float32')
+        delta_x = np.array(delta_inputs, dtype='float32').reshape(len(occupants), -1)
+        increase_probability = LogisticRegressionOccupant.get_interaction_probability(parameters[:, 0], parameters[:, 1], x)
+        decrease_probability = LogisticRegressionOccupant.get_interaction_probability(parameters[:, 2], parameters[:, 3], x)
+        random_probability = np.array([o.random_state.uniform() for o in occupants], dtype='float64')
+
+        for o, i, d, r in zip(occupants, increase_probability, decrease_probability, random_probability):
+            o.probabilities['increase_setpoint'][o.time_step] = i
+            o.probabilities['decrease_setpoint'][o.time_step] = d
+            o.probabilities['random'][o.time_step] = r
+
+        # no interaction when both or neither probabilities exceed the random probability
+        increase = increase_probability >= random_probability
+        decrease = decrease_probability >= random_probability
+        increase, decrease = increase & ~decrease, decrease & ~increase
+        deltas = np.zeros(len(occupants), dtype='float64')
+
+        for name, mask, sign in [('increase', increase, 1.0), ('decrease', decrease, -1.0)]:
+            rows = np.nonzero(mask)[0]
+
+            if rows.shape[0] == 0:
+                continue
+
+            else:
+                pass
+
+            responses = cls.__predict_responses(name, [occupants[i] for i in rows], delta_x[rows], trees[name][0], trees[name][1][rows])
+            deltas[rows] = [sign*occupants[i].delta_output_map[r] for i, r in zip(rows, responses)]
+
+        return deltas
+
+    @staticmethod
+    def get_trees(occupants: List[LogisticRegressionOccupant]) -> Mapping[str, Tuple[DecisionTreeArrays, np.ndarray]]:
+        """Returns concatenated set point increase and decrease trees of `occupants` and the root node index of each occupant's
+        tree where the root is -1 for occupants whose model is not a decision tree classifier."""
+
+        trees = {}
+
+        for name in ['increase', 'decrease']:
+            occupant_trees = [getattr(o, f'setpoint_{name}_tree') for o in occupants]
+            compiled = [t for t in occupant_trees if t is not None]
+
+            if len(compiled) > 0:
+                tree, compiled_roots = DecisionTreeArrays.concatenate(compiled)
+
+            else:
+                tree, compiled_roots = None, []
+
+            roots = np.full(len(occupants), DecisionTreeArrays.LEAF, dtype='int64')
+            roots[[i for i, t in enumerate(occupant_trees) if t is not None]] = compiled_roots
+            trees[name] = (tree, roots)
+
+        return trees
+
+    @staticmethod
+    def __predict_responses(name: str, occupants: List[LogisticRegressionOccupant], x: np.ndarray, tree: DecisionTreeArrays, roots: np.ndarray) -> List[Any]:
+        responses = [None]*len(occupants)
+        compiled = np.nonzero(roots != DecisionTreeArrays.LEAF)[0]
+
+        if compiled.shape[0] > 0:
+            for i, r in zip(compiled, tree.predict(x[compiled], roots=roots[compiled])):
+                responses[i] = r
+
+        else:
+            pass
+
+        for i in np.nonzero(roots == DecisionTreeArrays.LEAF)[0]:
+            responses[i] = getattr(occupants[i], f'setpoint_{name}_model').predict(x[i:i + 1])[0]
+
+        return responses
@@ -24,7 +24,7 @@ class PowerOutage:
     def random_seed(self, value: int):
         self.__random_seed = value
 
-    def get_signals(self, time_steps: int, **kwargs) -> np.ndarray:
+    def get_signals(self, time_steps: int, count: int = None, **kwargs) -> np.ndarray:
         """Returns power outage signal time series.
 
         Returns time series with randomly selected time steps set as candidates for power outage.
@@ -33,6 +33,9 @@ class PowerOutage:
         ----------
         time_steps: int
             Number of time steps in returned signal time series.
+        count: int, optional
+            Number of independent signal time series to return e.g. one for each building. If provided, the signals are 
+            returned as a 2-D array of shape (`count`, `time_steps`) otherwise, one signal is returned as a 1-D array.
         
         Other Parameters
         ----------------
@@ -48,9 +51,9 @@ class PowerOutage:
         """
 
         nprs = np.random.RandomState(self.random_seed)
-        signals = nprs.choice([0, 1], size=time_steps) 
+        signals = nprs.choice([0, 1], size=time_steps if count is None else (count, time_steps))
 
-        return signals  
+        return signals
 
 class ReliabilityMetricsPowerOutage(PowerOutage):
     """Power outage signal stochastic model based on Distribution System Reliability Metrics.
@@ -117,7 +120,7 @@ class ReliabilityMetricsPowerOutage(PowerOutage):
     def start_time_steps(self, value: List[float]):
         self.__start_time_steps = value
 
-    def get_signals(self, time_steps: int, seconds_per_time_step: float, **kwargs) -> np.ndarray:
+    def get_signals(self, time_steps: int, seconds_per_time_step: float, count: int = None, **kwargs) -> np.ndarray:
         """Returns power outage signal time series.
 
         Returns time series with randomly selected time steps set as candidates for power outage.
@@ -128,6 +131,9 @@ class ReliabilityMetricsPowerOutage(PowerOutage):
             Number of time steps in returned signal time series.
         seconds_per_time_step: float
             Number of seconds in one `time_step`.
+        count: int, optional
+            Number of independent signal time series to return e.g. one for each building. If provided, the signals are 
+            returned as a 2-D array of shape (`count`, `time_steps`) otherwise, one signal is returned as a 1-D array.
         
         Other Parameters
         ----------------
@@ -148,23 +154,34 @@ class ReliabilityMetricsPowerOutage(PowerOutage):
         seconds_per_minute = 60.0
         time_steps_per_day = seconds_per_day/seconds_per_time_step
         time_steps_per_minute = seconds_per_minute/seconds_per_time_step
-        day_count = time_steps/time_steps_per_day
+        day_count = int(time_steps/time_steps_per_day)
         daily_outage_probability = self.saifi/days_per_year
-        outage_days = nprs.binomial(n=1, p=daily_outage_probability, size=int(day_count))
-        outage_day_ixs = outage_days*np.arange(day_count)
-        outage_day_ixs = outage_day_ixs[outage_day_ixs != 0]
-        outage_day_count = outage_days[outage_days == 1].shape[0]
+        outage_days = nprs.binomial(n=1, p=daily_outage_probability, size=day_count if count is None else (count, day_count))
+        outage_days = outage_days.reshape(1 if count is None else count, day_count)
+        outage_day_count = int(outage_days.sum())
         start_time_steps = list(range(int(time_steps_per_day))) if self.start_time_steps is None else self.start_time_steps
         outage_start_time_steps = nprs.choice(start_time_steps, size=outage_day_count)
         outage_durations = nprs.exponential(scale=self.caidi, size=outage_day_count) # [mins]
         outage_duration_time_steps = outage_durations*time_steps_per_minute
-        signals = np.zeros(time_steps, dtype=int)
-
-        for i, j , k in zip(outage_day_ixs, outage_start_time_steps, outage_duration_time_steps):
-            start_ix = i*time_steps_per_day + j
-            end_ix = start_ix + k
-            start_ix = int(start_ix)
-            end_ix = int(end_ix)
-            signals[start_ix:end_ix] = 1
+
+        # each signal's outage days are paired in order with its block of sampled start time steps and durations.
+        # The first day of a signal is excluded from outages so its sample, if any, is left unused at the end of the block.
+        signal_ixs, outage_day_ixs = np.nonzero(outage_days[:, 1:])
+        outage_day_ixs += 1
+        signal_outage_day_counts = outage_days.sum(axis=1)
+        signal_event_counts = np.bincount(signal_ixs, minlength=outage_days.shape[0])
+        event_ixs = (np.cumsum(signal_outage_day_counts) - signal_outage_day_counts)[signal_ixs] \
+            + np.arange(signal_ixs.shape[0]) - np.repeat(np.cumsum(signal_event_counts) - signal_event_counts, signal_event_counts)
+        start_ixs = outage_day_ixs*time_steps_per_day + outage_start_time_steps[event_ixs]
+        end_ixs = (start_ixs + outage_duration_time_steps[event_ixs]).astype(int)
+        start_ixs = start_ixs.astype(int)
+
+        # mark outage time steps by summing +1 at event starts and -1 at event ends
+        start_ixs = np.clip(start_ixs, 0, time_steps)
+        end_ixs = np.clip(end_ixs, start_ixs, time_steps)
+        changes = np.zeros((outage_days.shape[0], time_steps + 1), dtype=int)
+        np.add.at(changes, (signal_ixs, start_ixs), 1)
+        np.add.at(changes, (signal_ixs, end_ixs), -1)
+        signals = (np.cumsum(changes[:, :-1], axis=1) > 0).astype(int)
         
-        return signals
\ No newline at end of file
+        return signals[0] if count is None else signals
\ No newline at end of file
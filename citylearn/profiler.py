@@ -0,0 +1,92 @@
+import time
+from typing import List, Mapping, Union
+from pathlib import Path
+
+class StageProfiler:
+    r"""Cumulative wall time and call count of named simulation stages.
+
+    Stages are named by their call path with levels separated by ';' e.g. 'step;apply_actions' so that the recorded
+    times can be exported as collapsed stacks that flame graph tools e.g. `flamegraph.pl` and speedscope read.
+
+    Examples
+    --------
+    >>> profiler = StageProfiler()
+    >>> start = profiler.start()
+    >>> start = profiler.record('step;next_time_step', start)
+    """
+
+    SEPARATOR = ';'
+
+    def __init__(self):
+        self.reset()
+
+    @property
+    def stages(self) -> Mapping[str, Mapping[str, Union[int, float]]]:
+        """Stage name to `count`, cumulative `total` and `mean` wall time in seconds mapping."""
+
+        return {k: {'count': c, 'total': t, 'mean': t/c} for k, (c, t) in self.__stages.items()}
+
+    @staticmethod
+    def start() -> float:
+        """Returns current performance counter value to pass to :meth:`record`."""
+
+        return time.perf_counter()
+
+    def record(self, name: str, start: float) -> float:
+        r"""Add the wall time elapsed since `start` to stage `name`.
+
+        Parameters
+        ----------
+        name: str
+            Stage name.
+        start: float
+            Performance counter value at the start of the stage.
+
+        Returns
+        -------
+        end: float
+            Performance counter value at the end of the stage that can be used as `start` of the next stage.
+        """
+
+        end = time.perf_counter()
+        count, total = self.__stages.get(name, (0, 0.0))
+        self.__stages[name] = (count + 1, total + end - start)
+
+        return end
+
+    def get_collapsed_stacks(self) -> List[str]:
+        r"""Returns stages as collapsed stack lines of stage name and self time in microseconds.
+
+        The self time of a stage is its cumulative time less the cumulative time of its direct sub stages.
+        """
+
+        stages = self.stages
+        lines = []
+
+        for name, stage in stages.items():
+            level = name.count(self.SEPARATOR)
+            children = [
+                v['total'] for k, v in stages.items()
+                if k.startswith(f'{name}{self.SEPARATOR}') and k.count(self.SEPARATOR) == level + 1
+            ]
+            self_time = max(stage['total'] - sum(children), 0.0)
+            lines.append(f'{name} {int(round(self_time*1e6))}')
+
+        return lines
+
+    def write_collapsed_stacks(self, filepath: Union[str, Path]):
+        r"""Write :meth:`get_collapsed_stacks` to a flame graph compatible text file.
+
+        Parameters
+        ----------
+        filepath: Union[str, Path]
+            Output filepath.
+        """
+
+        with open(filepath, 'w') as f:
+            f.write('\n'.join(self.get_collapsed_stacks()) + '\n')
+
+    def reset(self):
+        """Clear recorded stages."""
+
+        self.__stages = {}
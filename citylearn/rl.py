@@ -1,4 +1,3 @@
-import random
 import numpy as np
 
 # conditional imports
@@ -73,45 +72,333 @@ class PolicyNetwork(nn.Module):
         return super(PolicyNetwork, self).to(device)
     
 class ReplayBuffer:
-    def __init__(self, capacity):
-        self.capacity = capacity
-        self.buffer = []
+    r"""Circular buffer of transitions stored in preallocated float32 arrays.
+
+    Observations, actions, rewards, next observations and done flags are kept in separate arrays that are allocated on the 
+    first :py:meth:`push` once their dimensions are known. :py:meth:`sample` draws a batch with one `rng.integers` call
+    i.e., with replacement, and fancy-indexes each array.
+
+    Parameters
+    ----------
+    capacity: int
+        Maximum number of transitions. The oldest transition is overwritten once full.
+    random_seed: int, optional
+        Seed for the sampling random number generator.
+    pin_memory: bool, default: False
+        Whether to allocate the arrays as views of pinned torch tensors and stage sampled batches in pinned memory 
+        for faster host to device copies in :py:meth:`sample_tensors`. Ignored if CUDA is not available.
+    """
+
+    def __init__(self, capacity: int, random_seed: int = None, pin_memory: bool = None):
+        self.capacity = int(capacity)
+        self.position = 0
+        self.__size = 0
+        self.__rng = np.random.default_rng(random_seed)
+        self.pin_memory = False if pin_memory is None else pin_memory and torch.cuda.is_available()
+        self.__state = None
+        self.__action = None
+        self.__reward = None
+        self.__next_state = None
+        self.__done = None
+        self.__batch = {}
+
+    @property
+    def state(self) -> np.ndarray:
+        """Observations of stored transitions in storage order."""
+
+        return self.__state[:self.__size]
+    
+    @property
+    def action(self) -> np.ndarray:
+        """Actions of stored transitions in storage order."""
+
+        return self.__action[:self.__size]
+    
+    @property
+    def reward(self) -> np.ndarray:
+        """Rewards of stored transitions in storage order."""
+
+        return self.__reward[:self.__size]
+    
+    @property
+    def next_state(self) -> np.ndarray:
+        """Next observations of stored transitions in storage order."""
+
+        return self.__next_state[:self.__size]
+    
+    @property
+    def done(self) -> np.ndarray:
+        """Done flags of stored transitions in storage order."""
+
+        return self.__done[:self.__size]
+
+    @property
+    def buffer(self) -> list:
+        """Stored transitions as (state, action, reward, next_state, done) tuples in storage order."""
+
+        return [] if self.__state is None else list(zip(self.state, self.action, self.reward, self.next_state, self.done))
+    
+    @buffer.setter
+    def buffer(self, buffer: list):
+        self.__size = 0
         self.position = 0
+        self.__state = None
+
+        for transition in buffer:
+            self.push(*transition)
     
     def push(self, state, action, reward, next_state, done):
-        if len(self.buffer) < self.capacity:
-            self.buffer.append(None)
+        if self.__state is None:
+            self.__allocate(len(state), len(action))
         
-        self.buffer[self.position] = (state, action, reward, next_state, done)
+        else:
+            pass
+
+        self.__state[self.position] = state
+        self.__action[self.position] = action
+        self.__reward[self.position] = reward
+        self.__next_state[self.position] = next_state
+        self.__done[self.position] = done
         self.position = (self.position + 1) % self.capacity
+        self.__size = min(self.__size + 1, self.capacity)
     
-    def sample(self, batch_size):
-        batch = random.sample(self.buffer, batch_size)
-        state, action, reward, next_state, done = map(np.stack, zip(*batch))
-        return state, action, reward, next_state, done
+    def sample(self, batch_size: int):
+        ix = self.__rng.integers(0, self.__size, size=batch_size)
+
+        return self.__state[ix], self.__action[ix], self.__reward[ix], self.__next_state[ix], self.__done[ix]
+    
+    def sample_tensors(self, batch_size: int, device: torch.device = None):
+        """Sample a batch as contiguous float32 tensors on `device` with reward and done of shape (`batch_size`, 1).
+
+        The batch is gathered from zero-copy torch views of the arrays and, if :py:attr:`pin_memory`, staged in
+        pinned memory before it is copied to `device`.
+        """
+
+        device = torch.device('cpu') if device is None else device
+        ix = torch.from_numpy(self.__rng.integers(0, self.__size, size=batch_size))
+        batch = []
+
+        for k, v in zip(['state', 'action', 'reward', 'next_state', 'done'], 
+            [self.__state, self.__action, self.__reward, self.__next_state, self.__done]
+        ):
+            v = torch.from_numpy(v)
+
+            if self.pin_memory and device.type == 'cuda':
+                key = (k, batch_size)
+
+                if key not in self.__batch:
+                    self.__batch[key] = torch.empty((batch_size, *v.shape[1:]), dtype=v.dtype, pin_memory=True)
+                
+                else:
+                    pass
+
+                v = torch.index_select(v, 0, ix, out=self.__batch[key]).to(device)
+
+            else:
+                v = v.index_select(0, ix).to(device)
+
+            batch.append(v.unsqueeze(1) if v.dim() == 1 else v)
+
+        return tuple(batch)
+    
+    def transform(self, state_function=None, reward_function=None):
+        """Apply `state_function` to the observations and next observations and `reward_function` to the rewards of all
+        stored transitions e.g. to normalize them once exploration ends.
+
+        The functions are called once on the arrays of all stored transitions and may change the observation dimension.
+        """
+
+        if self.__size == 0:
+            return
+        
+        else:
+            pass
+
+        if state_function is not None:
+            state = np.asarray(state_function(self.state), dtype='float32')
+            next_state = np.asarray(state_function(self.next_state), dtype='float32')
+
+            if state.shape[1] != self.__state.shape[1]:
+                action, reward, done = self.action.copy(), self.reward.copy(), self.done.copy()
+                self.__allocate(state.shape[1], action.shape[1])
+                self.__action[:self.__size] = action
+                self.__reward[:self.__size] = reward
+                self.__done[:self.__size] = done
+
+            else:
+                pass
+
+            self.__state[:self.__size] = state
+            self.__next_state[:self.__size] = next_state
+        
+        else:
+            pass
+
+        if reward_function is not None:
+            self.__reward[:self.__size] = reward_function(self.reward)
+
+        else:
+            pass
+
+    def __allocate(self, state_dimension: int, action_dimension: int):
+        empty = (lambda *shape: torch.zeros(shape, dtype=torch.float32, pin_memory=True).numpy()) if self.pin_memory \
+            else (lambda *shape: np.zeros(shape, dtype='float32'))
+        self.__state = empty(self.capacity, state_dimension)
+        self.__action = empty(self.capacity, action_dimension)
+        self.__reward = empty(self.capacity)
+        self.__next_state = empty(self.capacity, state_dimension)
+        self.__done = empty(self.capacity)
+        self.__batch = {}
     
     def __len__(self):
-        return len(self.buffer)
+        return self.__size
         
 class RegressionBuffer:
+    r"""Circular buffer of regression variables and targets stored in preallocated float64 arrays.
+
+    Parameters
+    ----------
+    capacity: int
+        Maximum number of samples. The oldest sample is overwritten once full.
+    """
+
     def __init__(self, capacity):
-        self.capacity = capacity
-        self.x = []
-        self.y = []
+        self.capacity = int(capacity)
         self.position = 0
+        self.__size = 0
+        self.__x = None
+        self.__y = None
+
+    @property
+    def x(self) -> np.ndarray:
+        """Regression variables of stored samples in storage order."""
+
+        return np.zeros((0, 0)) if self.__x is None else self.__x[:self.__size]
+    
+    @property
+    def y(self) -> np.ndarray:
+        """Regression targets of stored samples in storage order."""
+
+        return np.zeros(0) if self.__y is None else self.__y[:self.__size]
     
     def push(self, variables, targets):
-        if len(self.x) < self.capacity and len(self.x)==len(self.y):
-            self.x.append(None)
-            self.y.append(None)
+        if self.__x is None:
+            self.__x = np.zeros((self.capacity, len(variables)), dtype='float64')
+            self.__y = np.zeros(self.capacity, dtype='float64')
         
-        self.x[self.position] = variables
-        self.y[self.position] = targets
+        else:
+            pass
+        
+        self.__x[self.position] = variables
+        self.__y[self.position] = targets
         self.position = (self.position + 1) % self.capacity
+        self.__size = min(self.__size + 1, self.capacity)
     
     def __len__(self):
-        return len(self.x)
+        return self.__size
+    
+class IncrementalLinearRegression:
+    r"""Ordinary least squares linear regression with intercept that is fitted incrementally from sufficient statistics.
+
+    Sample count, means and centered cross-products of the variables and targets are accumulated by :py:meth:`partial_fit` 
+    using pairwise (Chan et al.) mean updates and can be removed again with :py:meth:`forget` e.g. when a sample is evicted 
+    from a :py:class:`RegressionBuffer`, so that the fit is over a sliding window. The coefficients are solved lazily at 
+    the next :py:meth:`predict` from the centered normal equations at a cost that does not depend on the number of samples.
+
+    The solution approximates `sklearn.linear_model.LinearRegression` fitted on the same samples but is not identical to it: 
+    solving the normal equations squares the condition number of the variables, and round-off from :py:meth:`forget` 
+    accumulates over the window, so agreement degrades for ill-conditioned variables and for variables whose offset is 
+    large relative to their spread. Rank-deficient systems are solved with :py:func:`numpy.linalg.lstsq` that returns the 
+    minimum-norm coefficients.
+    """
+
+    def __init__(self):
+        self.__count = 0
+        self.__x_mean = None
+        self.__y_mean = 0.0
+        self.__xx = None
+        self.__xy = None
+        self.coef_ = None
+        self.intercept_ = 0.0
+
+    def partial_fit(self, x, y):
+        """Add samples with variables `x` of shape (n_samples, n_features) and targets `y` of shape (n_samples,)."""
+
+        self.__update(x, y, 1)
+
+        return self
     
+    def forget(self, x, y):
+        """Remove samples that were previously added with :py:meth:`partial_fit`."""
+
+        self.__update(x, y, -1)
+
+        return self
+
+    def predict(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype='float64')
+
+        if self.coef_ is None:
+            self.__solve(x.shape[1])
+        
+        else:
+            pass
+
+        return x @ self.coef_ + self.intercept_
+
+    def __update(self, x, y, sign: int):
+        x = np.atleast_2d(np.asarray(x, dtype='float64'))
+        y = np.atleast_1d(np.asarray(y, dtype='float64'))
+
+        if self.__xx is None:
+            self.__x_mean = np.zeros(x.shape[1], dtype='float64')
+            self.__xx = np.zeros((x.shape[1], x.shape[1]), dtype='float64')
+            self.__xy = np.zeros(x.shape[1], dtype='float64')
+        
+        else:
+            pass
+
+        # batch statistics
+        batch_count = x.shape[0]
+        batch_x_mean = x.mean(axis=0)
+        batch_y_mean = y.mean()
+        batch_x = x - batch_x_mean
+        batch_y = y - batch_y_mean
+        count = self.__count + sign*batch_count
+
+        if count <= 0:
+            self.__count = 0
+            self.__x_mean[:] = 0.0
+            self.__y_mean = 0.0
+            self.__xx[:] = 0.0
+            self.__xy[:] = 0.0
+
+        else:
+            # `other` are the statistics of the samples that remain after a removal or that existed before an addition
+            other_count = count if sign < 0 else self.__count
+            x_mean = self.__x_mean + sign*batch_count*(batch_x_mean - self.__x_mean)/count
+            y_mean = self.__y_mean + sign*batch_count*(batch_y_mean - self.__y_mean)/count
+            other_x_mean, other_y_mean = (x_mean, y_mean) if sign < 0 else (self.__x_mean, self.__y_mean)
+            x_delta = batch_x_mean - other_x_mean
+            y_delta = batch_y_mean - other_y_mean
+            weight = other_count*batch_count/(other_count + batch_count)
+            self.__xx += sign*(batch_x.T @ batch_x + weight*np.outer(x_delta, x_delta))
+            self.__xy += sign*(batch_x.T @ batch_y + weight*x_delta*y_delta)
+            self.__count = count
+            self.__x_mean = x_mean
+            self.__y_mean = y_mean
+
+        self.coef_ = None
+
+    def __solve(self, n_features: int):
+        if self.__count <= 0:
+            self.coef_ = np.zeros(n_features, dtype='float64')
+            self.intercept_ = 0.0
+        
+        else:
+            self.coef_ = np.linalg.lstsq(self.__xx, self.__xy, rcond=None)[0]
+            self.intercept_ = self.__y_mean - self.__x_mean @ self.coef_
+
 class SoftQNetwork(nn.Module):
     def __init__(self, num_inputs, num_actions, hidden_size=[400,300], init_w=3e-3):
         super(SoftQNetwork, self).__init__()
@@ -130,4 +417,115 @@ class SoftQNetwork(nn.Module):
         x = self.ln1(F.relu(self.linear1(x)))
         x = self.ln2(F.relu(self.linear2(x)))
         x = self.linear3(x)
-        return x
\ No newline at end of file
+        return x
+
+class GroupedLinear(nn.Module):
+    r"""Linear layers of several networks with stacked parameters that are applied with one batched matmul.
+
+    Parameters
+    ----------
+    linears: List[nn.Linear]
+        Layers to stack. Their parameters are copied so the grouped layer starts from the same initialization.
+    """
+
+    def __init__(self, linears):
+        super(GroupedLinear, self).__init__()
+        self.weight = nn.Parameter(torch.stack([l.weight.data.transpose(0, 1) for l in linears]).clone())
+        self.bias = nn.Parameter(torch.stack([l.bias.data for l in linears]).clone()[:, None, :])
+
+    def forward(self, x):
+        return torch.baddbmm(self.bias, x, self.weight)
+
+class GroupedLayerNorm(nn.Module):
+    r"""Layer normalizations of several networks with stacked affine parameters.
+
+    Parameters
+    ----------
+    layer_norms: List[nn.LayerNorm]
+        Layer normalizations to stack.
+    """
+
+    def __init__(self, layer_norms):
+        super(GroupedLayerNorm, self).__init__()
+        self.normalized_shape = layer_norms[0].normalized_shape
+        self.eps = layer_norms[0].eps
+        self.weight = nn.Parameter(torch.stack([l.weight.data for l in layer_norms]).clone()[:, None, :])
+        self.bias = nn.Parameter(torch.stack([l.bias.data for l in layer_norms]).clone()[:, None, :])
+
+    def forward(self, x):
+        return F.layer_norm(x, self.normalized_shape, eps=self.eps)*self.weight + self.bias
+
+class GroupedSoftQNetwork(nn.Module):
+    r"""Several :py:class:`SoftQNetwork` with the same dimensions fused into one module with a leading group axis.
+
+    Inputs and outputs have shape (`len(networks)`, batch size, dimension).
+
+    Parameters
+    ----------
+    networks: List[SoftQNetwork]
+        Networks to fuse.
+    """
+
+    def __init__(self, networks):
+        super(GroupedSoftQNetwork, self).__init__()
+        self.linear1 = GroupedLinear([n.linear1 for n in networks])
+        self.linear2 = GroupedLinear([n.linear2 for n in networks])
+        self.linear3 = GroupedLinear([n.linear3 for n in networks])
+        self.ln1 = GroupedLayerNorm([n.ln1 for n in networks])
+        self.ln2 = GroupedLayerNorm([n.ln2 for n in networks])
+
+    def forward(self, state, action):
+        x = torch.cat([state, action], 2)
+        x = self.ln1(F.relu(self.linear1(x)))
+        x = self.ln2(F.relu(self.linear2(x)))
+        x = self.linear3(x)
+        return x
+
+class GroupedPolicyNetwork(nn.Module):
+    r"""Several :py:class:`PolicyNetwork` with the same dimensions fused into one module with a leading group axis.
+
+    Inputs and outputs have shape (`len(networks)`, batch size, dimension).
+
+    Parameters
+    ----------
+    networks: List[PolicyNetwork]
+        Networks to fuse.
+    """
+
+    def __init__(self, networks):
+        super(GroupedPolicyNetwork, self).__init__()
+        self.log_std_min = networks[0].log_std_min
+        self.log_std_max = networks[0].log_std_max
+        self.epsilon = networks[0].epsilon
+        self.linear1 = GroupedLinear([n.linear1 for n in networks])
+        self.linear2 = GroupedLinear([n.linear2 for n in networks])
+        self.mean_linear = GroupedLinear([n.mean_linear for n in networks])
+        self.log_std_linear = GroupedLinear([n.log_std_linear for n in networks])
+        self.action_scale = torch.stack([n.action_scale for n in networks])[:, None, :]
+        self.action_bias = torch.stack([n.action_bias for n in networks])[:, None, :]
+
+    def forward(self, state):
+        x = F.relu(self.linear1(state))
+        x = F.relu(self.linear2(x))
+        mean = self.mean_linear(x)
+        log_std = self.log_std_linear(x)
+        log_std = torch.clamp(log_std, min=self.log_std_min, max=self.log_std_max)
+        return mean, log_std
+
+    def sample(self, state):
+        mean, log_std = self.forward(state)
+        std = log_std.exp()
+        normal = Normal(mean, std)
+        x_t = normal.rsample()
+        y_t = torch.tanh(x_t)
+        action = y_t * self.action_scale + self.action_bias
+        log_prob = normal.log_prob(x_t)
+        log_prob -= torch.log(self.action_scale * (1 - y_t.pow(2)) + self.epsilon)
+        log_prob = log_prob.sum(2, keepdim=True)
+        mean = torch.tanh(mean) * self.action_scale + self.action_bias
+        return action, log_prob, mean
+
+    def to(self, device):
+        self.action_scale = self.action_scale.to(device)
+        self.action_bias = self.action_bias.to(device)
+        return super(GroupedPolicyNetwork, self).to(device)
@@ -0,0 +1,332 @@
+import sys
+from typing import Any, List, Mapping, Tuple
+import numpy as np
+from citylearn.data import TimeSeriesData
+
+class StateSnapshot:
+    r"""Copy of the mutable state of a CityLearn object graph that can be restored in place.
+
+    The graph is walked from `root` through the instance attributes of objects defined in the `citylearn` package
+    e.g. :py:class:`citylearn.citylearn.CityLearnEnv`, its buildings, devices, storage systems, dynamics models,
+    :py:class:`citylearn.state.DistrictState` and :py:class:`citylearn.kpi.KPITracker`. Writeable numpy arrays and torch
+    tensors are copied, scalars are kept by value, lists, tuples and dictionaries are walked element by element and
+    random number generator states are saved. Array views e.g. the building time series rows of
+    :py:class:`citylearn.state.DistrictState` are restored through the array they view.
+
+    Static data is kept by reference and not copied. This includes the time series of :py:class:`citylearn.data.TimeSeriesData`
+    objects e.g. weather, pricing, carbon intensity and energy simulation data, except for the variables that are modified
+    during control i.e. those with a `<variable>_without_control` counterpart e.g. `cooling_demand` and
+    `indoor_dry_bulb_temperature_cooling_set_point`. Read-only arrays and other objects e.g. gymnasium spaces, pandas data
+    frames, compiled observation getters and torch module parameters are also kept by reference.
+
+    Parameters
+    ----------
+    root: Any
+        Object to capture the state of.
+
+    Notes
+    -----
+    A snapshot can only be restored into the object graph it was captured from and can be restored any number of times.
+    Attributes are rebound to the objects, arrays and tensors they referenced at capture time and the captured values are
+    copied back into these arrays and tensors in place so that views and references held elsewhere remain valid.
+    """
+
+    __ARRAY = 'array'
+    __VIEW = 'view'
+    __TENSOR = 'tensor'
+    __VALUE = 'value'
+    __VALUES = 'values'
+    __OBJECT = 'object'
+    __LIST = 'list'
+    __TUPLE = 'tuple'
+    __DICT = 'dict'
+    __RANDOM_STATE = 'random_state'
+    __GENERATOR = 'generator'
+    __REFERENCE = 'reference'
+    __VALUE_TYPES = (type(None), bool, int, float, complex, str, bytes, np.generic)
+    __TORCH_MODULE_INTERNALS = None
+
+    def __init__(self, root: Any):
+        self.__root = root
+        self.__arrays = []
+        self.__static_arrays = {}
+        self.__views = []
+        self.__state = self.__capture(root, {})
+        self.__shared_arrays = list(self.__static_arrays.values())
+
+        # arrays are copied once the whole graph has been walked so that static data arrays
+        # that were reached before their owner are not copied
+        for payload in self.__arrays:
+            array = payload[0]
+
+            if array.flags.writeable and id(array) not in self.__static_arrays:
+                payload[1] = array.copy()
+            
+            elif id(array) not in self.__static_arrays:
+                self.__shared_arrays.append(array)
+
+            else:
+                pass
+
+        self.__arrays = None
+        self.__static_arrays = None
+
+    @property
+    def root(self) -> Any:
+        """Object the state was captured from."""
+
+        return self.__root
+
+    def restore(self, root: Any = None):
+        """Restore the captured state into `root`.
+
+        Parameters
+        ----------
+        root: Any, optional
+            Object the state was captured from. Defaults to :py:attr:`root`.
+        """
+
+        root = self.root if root is None else root
+        assert root is self.root, 'A snapshot can only be restored into the object it was captured from.'
+        self.__restore(self.__state, {})
+
+    def get_copy_memo(self) -> Mapping[int, Any]:
+        """Returns a :py:func:`copy.deepcopy` memo for :py:attr:`root`.
+
+        The memo maps the static data and read-only arrays that the snapshot keeps by reference to themselves so that 
+        a deep copy of :py:attr:`root` shares them. Arrays that are viewed elsewhere in the graph are mapped to copies and 
+        their views to the same views of these copies so that the deep copy keeps its views e.g. the building time series 
+        rows of :py:class:`citylearn.state.DistrictState`, which :py:func:`copy.deepcopy` would otherwise copy into 
+        independent arrays.
+
+        Returns
+        -------
+        memo: Mapping[int, Any]
+            Mapping of object `id` to the object to use in its place in the copy.
+        """
+
+        memo = {id(a): a for a in self.__shared_arrays}
+
+        for base, view in self.__views:
+            if id(base) not in memo:
+                memo[id(base)] = base.copy(order='K')
+
+            else:
+                pass
+
+            copy = memo[id(base)]
+
+            if id(view) in memo:
+                continue
+
+            elif copy is base:
+                memo[id(view)] = view
+
+            else:
+                offset = view.__array_interface__['data'][0] - base.__array_interface__['data'][0]
+                copy_view = np.ndarray(view.shape, dtype=view.dtype, buffer=copy, offset=offset, strides=view.strides)
+                copy_view.flags.writeable = view.flags.writeable
+                memo[id(view)] = copy_view
+
+        return memo
+
+    def __capture(self, value: Any, memo: Mapping[int, Tuple[str, Any]]) -> Tuple[str, Any]:
+        if id(value) in memo:
+            return memo[id(value)]
+
+        else:
+            pass
+
+        if isinstance(value, self.__VALUE_TYPES):
+            return (self.__VALUE, value)
+
+        elif isinstance(value, np.ndarray):
+            base = self.__get_base(value)
+
+            if base is value:
+                payload = [value, None]
+                self.__arrays.append(payload)
+                entry = (self.__ARRAY, payload)
+
+            else:
+                entry = (self.__VIEW, (self.__capture(base, memo), value))
+                self.__views.append((base, value))
+
+        elif self.__is_tensor(value):
+            entry = (self.__TENSOR, (value, value.detach().clone()))
+
+        elif isinstance(value, np.random.RandomState):
+            entry = (self.__RANDOM_STATE, (value, value.get_state()))
+
+        elif isinstance(value, np.random.Generator):
+            entry = (self.__GENERATOR, (value, value.bit_generator.state))
+
+        elif isinstance(value, (set, frozenset)):
+            return (self.__VALUE, type(value)(value))
+
+        elif type(value) == tuple and all(isinstance(v, self.__VALUE_TYPES) for v in value):
+            return (self.__VALUE, value)
+
+        elif type(value) == list and all(isinstance(v, self.__VALUE_TYPES) for v in value):
+            entry = (self.__VALUES, (value, list(value)))
+
+        elif type(value) == dict and all(isinstance(v, self.__VALUE_TYPES) for v in value.values()):
+            entry = (self.__VALUES, (value, dict(value)))
+
+        elif type(value) in (list, tuple):
+            children = []
+            entry = (self.__LIST if isinstance(value, list) else self.__TUPLE, (value, children))
+            memo[id(value)] = entry
+            children.extend([self.__capture(v, memo) for v in value])
+
+        elif type(value) == dict:
+            children = {}
+            entry = (self.__DICT, (value, children))
+            memo[id(value)] = entry
+            children.update({k: self.__capture(v, memo) for k, v in value.items()})
+
+        elif isinstance(value, TimeSeriesData):
+            attributes = {}
+            entry = (self.__OBJECT, (value, attributes))
+            memo[id(value)] = entry
+            variables = vars(value)
+
+            for k, v in variables.items():
+                if isinstance(v, np.ndarray) and f'{k}_without_control' not in variables:
+                    base = self.__get_base(v)
+                    self.__static_arrays[id(base)] = base
+
+                elif isinstance(v, (np.ndarray,) + self.__VALUE_TYPES):
+                    attributes[k] = self.__capture(v, memo)
+
+                else:
+                    pass
+
+        elif self.__is_citylearn_object(value):
+            attributes = {}
+            entry = (self.__OBJECT, (value, attributes))
+            memo[id(value)] = entry
+            skipped = self.__get_skipped_attributes(value)
+            attributes.update({k: self.__capture(v, memo) for k, v in vars(value).items() if k not in skipped})
+
+        else:
+            return (self.__REFERENCE, value)
+
+        # shared objects map to the same entry so that they are restored as shared objects
+        memo[id(value)] = entry
+
+        return entry
+
+    def __restore(self, entry: Tuple[str, Any], memo: Mapping[int, Any]) -> Any:
+        kind, saved = entry
+
+        if kind in [self.__VALUE, self.__REFERENCE]:
+            return type(saved)(saved) if isinstance(saved, (set, frozenset)) else saved
+
+        elif id(entry) in memo:
+            return memo[id(entry)]
+
+        else:
+            pass
+
+        if kind == self.__ARRAY:
+            value, data = saved
+
+            if data is not None:
+                np.copyto(value, data)
+
+            else:
+                pass
+
+        elif kind == self.__VIEW:
+            base_entry, value = saved
+            self.__restore(base_entry, memo)
+
+        elif kind == self.__TENSOR:
+            value, data = saved
+            value.data.copy_(data)
+
+        elif kind == self.__RANDOM_STATE:
+            value, state = saved
+            value.set_state(state)
+
+        elif kind == self.__GENERATOR:
+            value, state = saved
+            value.bit_generator.state = state
+
+        elif kind == self.__VALUES:
+            value, values = saved
+
+            if isinstance(value, list):
+                value[:] = values
+
+            else:
+                value.clear()
+                value.update(values)
+
+        elif kind == self.__LIST:
+            value, children = saved
+            memo[id(entry)] = value
+            value[:] = [self.__restore(e, memo) for e in children]
+
+        elif kind == self.__TUPLE:
+            value, children = saved
+            values = [self.__restore(e, memo) for e in children]
+            value = value if all(v is c for v, c in zip(values, value)) else tuple(values)
+
+        elif kind == self.__DICT:
+            value, children = saved
+            memo[id(entry)] = value
+            values = {k: self.__restore(e, memo) for k, e in children.items()}
+            value.clear()
+            value.update(values)
+
+        elif kind == self.__OBJECT:
+            value, attributes = saved
+            memo[id(entry)] = value
+            variables = vars(value)
+
+            for k, e in attributes.items():
+                variables[k] = self.__restore(e, memo)
+
+        else:
+            raise ValueError(f'Unknown snapshot entry kind: {kind}')
+
+        memo[id(entry)] = value
+
+        return value
+
+    @staticmethod
+    def __get_base(value: np.ndarray) -> np.ndarray:
+        """Returns the array that owns the memory `value` views."""
+
+        while isinstance(value.base, np.ndarray):
+            value = value.base
+
+        return value
+
+    @staticmethod
+    def __is_citylearn_object(value: Any) -> bool:
+        module = type(value).__module__
+
+        return (module == 'citylearn' or module.startswith('citylearn.')) and hasattr(value, '__dict__')
+
+    @staticmethod
+    def __is_tensor(value: Any) -> bool:
+        return 'torch' in sys.modules and isinstance(value, sys.modules['torch'].Tensor)
+
+    @classmethod
+    def __get_skipped_attributes(cls, value: Any) -> List[str]:
+        """Returns torch module internals of `value` i.e. parameters, buffers, submodules and hooks."""
+
+        if 'torch' in sys.modules and isinstance(value, sys.modules['torch'].nn.Module):
+            if cls.__TORCH_MODULE_INTERNALS is None:
+                cls.__TORCH_MODULE_INTERNALS = set(vars(sys.modules['torch'].nn.Module()).keys()) - {'training'}
+
+            else:
+                pass
+
+            return [k for k in vars(value) if k in cls.__TORCH_MODULE_INTERNALS]
+
+        else:
+            return []
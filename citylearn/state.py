@@ -0,0 +1,513 @@
+from typing import Any, List, Mapping, Tuple
+import numpy as np
+from citylearn.building import Building, DynamicsBuilding, LogisticRegressionOccupantInteractionBuilding, LSTMDynamicsBuilding, OccupantInteractionBuilding
+from citylearn.data import TOLERANCE, ZERO_DIVISION_PLACEHOLDER
+from citylearn.energy_model import Battery, ElectricDevice, ElectricHeater, HeatPump, StorageTank
+from citylearn.occupant import LogisticRegressionOccupant, LogisticRegressionOccupantExecutor
+from citylearn.profiler import StageProfiler
+
+class DistrictState:
+    r"""Struct-of-arrays store of the per-episode state of all buildings in a district.
+
+    Every per-episode time series owned by a :py:class:`citylearn.building.Building` and its devices, e.g. `net_electricity_consumption`
+    or `electrical_storage.soc`, is held as one row of a shared 2-D array of shape (`n_buildings`, `episode_time_steps`). Each building
+    and device is rebound to a view of its row so that scalar updates made by a building and array updates made across the district
+    read and write the same memory.
+
+    :py:meth:`apply_actions` advances all buildings whose control does not depend on custom dynamics in one set of array operations
+    and falls back to :py:meth:`citylearn.building.Building.apply_actions` for the other buildings as well as for buildings
+    experiencing a power outage at the current time step. The indoor dry-bulb temperature of all
+    :py:class:`citylearn.building.LSTMDynamicsBuilding` buildings that do not override `apply_actions`, `update_dynamics` or
+    `update_indoor_dry_bulb_temperature` is predicted in one batch per time step with a
+    :py:class:`citylearn.lstm_dynamics.LSTMDynamicsExecutor` and the occupant set point deltas of all
+    :py:class:`citylearn.building.LogisticRegressionOccupantInteractionBuilding` buildings are predicted in one batch per time step
+    with a :py:class:`citylearn.occupant.LogisticRegressionOccupantExecutor`.
+
+    Parameters
+    ----------
+    buildings: List[Building]
+        Buildings in district.
+
+    Notes
+    -----
+    Device parameters and exogenous time series used by the vectorized dispatch are captured in :py:meth:`reset` hence,
+    :py:meth:`reset` must be called after the buildings have been reset at the start of each episode.
+    """
+
+    END_USES = ['cooling', 'heating', 'dhw']
+    STORAGE_ACTIONS = ['cooling_storage', 'heating_storage', 'dhw_storage', 'electrical_storage']
+
+    def __init__(self, buildings: List[Building]):
+        self.buildings = buildings
+        self.__time_series = {}
+        self.__vectorizable = np.zeros(len(self.buildings), dtype=bool)
+        self.__parameters = {}
+        self.__dynamics = np.zeros(len(self.buildings), dtype=bool)
+        self.__dynamics_executor = None
+        self.__occupant_interaction = np.zeros(0, dtype=bool)
+        self.__occupant_executor = None
+
+    @property
+    def buildings(self) -> List[Building]:
+        """Buildings in district."""
+
+        return self.__buildings
+
+    @property
+    def time_series(self) -> Mapping[str, np.ndarray]:
+        """Mapping of time series name to 2-D array of shape (`n_buildings`, `episode_time_steps`).
+
+        Names follow :py:meth:`citylearn.building.Building.get_time_series`.
+        """
+
+        return self.__time_series
+
+    @property
+    def vectorizable(self) -> np.ndarray:
+        """Boolean mask of buildings whose actions are applied with array operations when there is no power outage."""
+
+        return self.__vectorizable
+
+    @buildings.setter
+    def buildings(self, buildings: List[Building]):
+        self.__buildings = list(buildings)
+
+    def reset(self):
+        r"""Rebind building and device time series to rows of newly allocated shared arrays and cache dispatch parameters."""
+
+        building_time_series = [b.get_time_series() for b in self.buildings]
+        names = [] if len(building_time_series) == 0 else list(building_time_series[0].keys())
+        self.__time_series = {n: np.array([t[n] for t in building_time_series], dtype=building_time_series[0][n].dtype) for n in names}
+
+        for i, b in enumerate(self.buildings):
+            b.set_time_series({k: v[i] for k, v in self.__time_series.items()})
+
+        self.__vectorizable = np.array([self.__is_vectorizable(b) for b in self.buildings], dtype=bool)
+        self.__set_parameters()
+        self.__dynamics = np.array([self.__is_dynamics_batchable(b) for b in self.buildings], dtype=bool)
+
+        # torch is only imported for districts with dynamics buildings
+        if self.__dynamics.any():
+            from citylearn.lstm_dynamics import LSTMDynamicsExecutor
+            self.__dynamics_executor = LSTMDynamicsExecutor([b.dynamics for b, d in zip(self.buildings, self.__dynamics) if d])
+            self.__dynamics_executor.reset()
+
+        else:
+            self.__dynamics_executor = None
+
+        dynamics_buildings = [b for b, d in zip(self.buildings, self.__dynamics) if d]
+        self.__occupant_interaction = np.array([self.__is_occupant_batchable(b) for b in dynamics_buildings], dtype=bool)
+
+        if self.__occupant_interaction.any():
+            self.__occupant_executor = LogisticRegressionOccupantExecutor(
+                [b.occupant for b, o in zip(dynamics_buildings, self.__occupant_interaction) if o]
+            )
+            self.__occupant_executor.reset()
+
+        else:
+            self.__occupant_executor = None
+
+    def apply_actions(self, actions: List[Mapping[str, float]], profiler: StageProfiler = None, stage: str = None):
+        r"""Apply actions to all buildings for the current time step and update their variables.
+
+        Parameters
+        ----------
+        actions: List[Mapping[str, float]]
+            Keyword arguments to :py:meth:`citylearn.building.Building.apply_actions` for each building.
+        profiler: StageProfiler, optional
+            Records the time spent on each building that is updated individually, the batch dynamics prediction
+            and the vectorized update as sub stages of `stage`.
+        stage: str, default: 'apply_actions'
+            Parent stage name in `profiler`.
+        """
+
+        if len(self.buildings) == 0:
+            return
+
+        else:
+            pass
+
+        time_step = self.buildings[0].time_step
+        values = np.array([[a.get(f'{k}_action', np.nan) for k in self.STORAGE_ACTIONS] for a in actions], dtype='float64')
+        values = np.where(self.__parameters['active_actions'], values, 0.0)
+        outage = self.__parameters['simulate_power_outage'] & (self.__time_series['power_outage_signal'][:, time_step] != 0.0)
+        vectorized = self.__vectorizable & ~outage & np.isfinite(values).all(axis=1)
+
+        if profiler is not None:
+            stage = 'apply_actions' if stage is None else stage
+            start = profiler.start()
+
+        else:
+            pass
+
+        for i in np.nonzero(~vectorized)[0]:
+            if self.__dynamics[i]:
+                self.buildings[i].apply_control_actions(**actions[i])
+
+            else:
+                self.buildings[i].apply_actions(**actions[i])
+
+            if profiler is not None:
+                start = profiler.record(f'{stage}{profiler.SEPARATOR}{self.buildings[i].name}', start)
+
+            else:
+                pass
+
+        if self.__dynamics.any():
+            self.__update_dynamics()
+
+            if profiler is not None:
+                start = profiler.record(f'{stage}{profiler.SEPARATOR}update_dynamics', start)
+
+            else:
+                pass
+
+        else:
+            pass
+
+        rows = np.nonzero(vectorized)[0]
+
+        if rows.shape[0] > 0:
+            self.__apply_actions(rows, values[rows], time_step)
+
+            if profiler is not None:
+                start = profiler.record(f'{stage}{profiler.SEPARATOR}vectorized', start)
+
+            else:
+                pass
+
+        else:
+            pass
+
+    def __apply_actions(self, rows: np.ndarray, actions: np.ndarray, time_step: int):
+        """Vectorized equivalent of :py:meth:`citylearn.building.Building.apply_actions` for buildings without a power outage.
+
+        Without a power outage, `downward_electrical_flexibility` is unbounded and the devices of each end-use only interact with
+        their own storage so, the action priority reduces to discharging storage before and charging storage after meeting each demand.
+        """
+
+        for i, end_use in enumerate(self.END_USES):
+            self.__update_end_use(end_use, rows, actions[:, i], time_step)
+
+        self.__update_non_shiftable_load(rows, time_step)
+        self.__update_electrical_storage(rows, actions[:, 3], time_step)
+        self.__update_net_electricity_consumption(rows, time_step)
+
+        for i in rows:
+            self.buildings[i].clear_observations_cache()
+
+    def __update_end_use(self, end_use: str, rows: np.ndarray, actions: np.ndarray, time_step: int):
+        parameters = self.__parameters[end_use]
+        demand = parameters['demand'][rows, time_step]
+        cop = parameters['cop'][rows, time_step]
+        energy = actions*parameters['capacity'][rows]
+        discharge = actions < 0.0
+
+        # discharge storage before meeting demand
+        self.__update_storage_tank(end_use, rows[discharge], energy[discharge], demand[discharge], cop[discharge], time_step)
+
+        # meet demand
+        consumption = self.__time_series[f'{end_use}_device.electricity_consumption']
+        storage_output = -np.minimum(self.__time_series[f'{end_use}_storage.energy_balance'][rows, time_step], 0.0)
+        max_device_output = (parameters['nominal_power'][rows] - consumption[rows, time_step])*cop
+        invalid = ~((demand <= max_device_output) | (np.abs(demand - max_device_output) < TOLERANCE))
+        assert not invalid.any(), f'demand is greater than {end_use}_device max output | buildings: {self.__get_names(rows[invalid])}'
+        device_output = np.minimum(demand - storage_output, max_device_output)
+        self.__time_series[f'energy_from_{end_use}_device'][rows, time_step] = device_output
+        electricity_consumption = device_output/cop
+        invalid = ~((electricity_consumption >= 0.0) | (np.abs(electricity_consumption) < TOLERANCE))
+        assert not invalid.any(), f'negative electricity consumption for {end_use} demand | buildings: {self.__get_names(rows[invalid])}'
+        consumption[rows, time_step] += np.maximum(0.0, electricity_consumption)
+
+        # charge storage after meeting demand
+        self.__update_storage_tank(end_use, rows[~discharge], energy[~discharge], demand[~discharge], cop[~discharge], time_step)
+
+    def __update_storage_tank(self, end_use: str, rows: np.ndarray, energy: np.ndarray, demand: np.ndarray, cop: np.ndarray, time_step: int):
+        parameters = self.__parameters[end_use]
+        consumption = self.__time_series[f'{end_use}_device.electricity_consumption']
+        max_output = (parameters['nominal_power'][rows] - consumption[rows, time_step])*cop
+        energy = np.where(energy > 0.0, np.minimum(max_output, energy), np.maximum(-demand, energy))
+        energy = np.where(
+            energy >= 0.0,
+            np.fmin(energy, parameters['max_input_power'][rows]),
+            np.fmax(-parameters['max_output_power'][rows], energy)
+        )
+        soc = self.__time_series[f'{end_use}_storage.soc']
+        energy_balance = self.__time_series[f'{end_use}_storage.energy_balance']
+        self.__charge(
+            soc, energy_balance, rows, energy, parameters['capacity'][rows], parameters['loss_coefficient'][rows],
+            parameters['round_trip_efficiency'][rows], time_step
+        )
+        charged_energy = np.maximum(energy_balance[rows, time_step], 0.0)
+        consumption[rows, time_step] += charged_energy/cop
+
+    def __update_non_shiftable_load(self, rows: np.ndarray, time_step: int):
+        demand = self.__parameters['non_shiftable_load'][rows, time_step]
+        self.__time_series['energy_to_non_shiftable_load'][rows, time_step] = demand
+        self.__time_series['non_shiftable_load_device.electricity_consumption'][rows, time_step] += demand
+
+    def __update_electrical_storage(self, rows: np.ndarray, actions: np.ndarray, time_step: int):
+        parameters = self.__parameters['electrical_storage']
+        efficiency_history = self.__time_series['electrical_storage.efficiency_history']
+        capacity_history = self.__time_series['electrical_storage.capacity_history']
+        efficiency = efficiency_history[rows, time_step]
+        degraded_capacity = capacity_history[rows, time_step]
+        capacity = parameters['capacity'][rows]
+        nominal_power = parameters['nominal_power'][rows]
+        loss_coefficient = parameters['loss_coefficient'][rows]
+        soc = self.__time_series['electrical_storage.soc']
+        energy_balance = self.__time_series['electrical_storage.energy_balance']
+        consumption = self.__time_series['electrical_storage.electricity_consumption']
+        action_energy = actions*capacity
+
+        # maximum charge/discharge power wrt capacity power curve
+        previous_soc = soc[rows, time_step - 1]
+        energy_init = np.maximum(0.0, previous_soc*capacity*(1.0 - loss_coefficient))
+        soc_init = energy_init/np.maximum(capacity, ZERO_DIVISION_PLACEHOLDER)
+        max_power = nominal_power*self.__get_curve_value(
+            soc_init, parameters['capacity_power_curve_x'][rows], parameters['capacity_power_curve_y'][rows]
+        )
+
+        # charge limits
+        available_nominal_power = nominal_power - consumption[rows, time_step]
+        energy_wrt_degrade = degraded_capacity - energy_init
+        charge_energy = np.minimum.reduce([max_power, available_nominal_power, energy_wrt_degrade, action_energy])
+        charge_efficiency_energy = np.minimum(action_energy, max_power)
+
+        # discharge limits
+        soc_difference = previous_soc - (1.0 - parameters['depth_of_discharge'][rows])
+        energy_limit_wrt_dod = -np.maximum(soc_difference*capacity*efficiency**0.5, 0.0)
+        discharge_energy = np.maximum.reduce([-max_power, energy_limit_wrt_dod, action_energy])
+        discharge_efficiency_energy = np.minimum(np.abs(action_energy), max_power)
+
+        charge = action_energy >= 0.0
+        energy = np.where(charge, charge_energy, discharge_energy)
+        efficiency = self.__get_curve_value(
+            np.abs(np.where(charge, charge_efficiency_energy, discharge_efficiency_energy))/np.maximum(nominal_power, ZERO_DIVISION_PLACEHOLDER),
+            parameters['power_efficiency_curve_x'][rows], parameters['power_efficiency_curve_y'][rows]
+        )
+        assert (efficiency > 0).all(), f'efficiency must be > 0. | buildings: {self.__get_names(rows[~(efficiency > 0)])}'
+        self.__charge(soc, energy_balance, rows, energy, capacity, loss_coefficient, efficiency**0.5, time_step)
+
+        # degradation
+        capacity_degrade = parameters['capacity_loss_coefficient'][rows]*capacity*np.abs(energy_balance[rows, time_step])\
+            /(2*np.maximum(degraded_capacity, ZERO_DIVISION_PLACEHOLDER))
+        efficiency_history[rows, time_step] = efficiency
+        capacity_history[rows, time_step] = np.maximum(degraded_capacity - capacity_degrade, 0.0)
+
+        consumption[rows, time_step] += energy_balance[rows, time_step]
+
+    def __update_net_electricity_consumption(self, rows: np.ndarray, time_step: int):
+        time_series = self.__time_series
+        net_electricity_consumption = time_series['cooling_device.electricity_consumption'][rows, time_step] \
+            + time_series['heating_device.electricity_consumption'][rows, time_step] \
+                + time_series['dhw_device.electricity_consumption'][rows, time_step] \
+                    + time_series['non_shiftable_load_device.electricity_consumption'][rows, time_step] \
+                        + time_series['electrical_storage.electricity_consumption'][rows, time_step] \
+                            + time_series['solar_generation'][rows, time_step]
+        time_series['net_electricity_consumption'][rows, time_step] = net_electricity_consumption
+        time_series['net_electricity_consumption_cost'][rows, time_step] = net_electricity_consumption\
+            *self.__parameters['electricity_pricing'][rows, time_step]
+        time_series['net_electricity_consumption_emission'][rows, time_step] = np.maximum(
+            0.0, net_electricity_consumption*self.__parameters['carbon_intensity'][rows, time_step]
+        )
+
+    @staticmethod
+    def __charge(
+        soc: np.ndarray, energy_balance: np.ndarray, rows: np.ndarray, energy: np.ndarray, capacity: np.ndarray,
+        loss_coefficient: np.ndarray, round_trip_efficiency: np.ndarray, time_step: int
+    ):
+        """Vectorized equivalent of :py:meth:`citylearn.energy_model.StorageDevice.charge`."""
+
+        energy_init = np.maximum(0.0, soc[rows, time_step - 1]*capacity*(1.0 - loss_coefficient))
+        energy_final = np.where(
+            energy >= 0.0,
+            np.minimum(energy_init + energy*round_trip_efficiency, capacity),
+            np.maximum(0.0, energy_init + energy/round_trip_efficiency)
+        )
+        soc[rows, time_step] = energy_final/np.maximum(capacity, ZERO_DIVISION_PLACEHOLDER)
+        energy_difference = energy_final - energy_init
+        energy_balance[rows, time_step] = np.where(
+            energy_difference >= 0.0, energy_difference/round_trip_efficiency, energy_difference*round_trip_efficiency
+        )
+
+    @staticmethod
+    def __get_curve_value(value: np.ndarray, curve_x: np.ndarray, curve_y: np.ndarray) -> np.ndarray:
+        """Piecewise linear curve lookup that matches the segment selection in :py:meth:`citylearn.energy_model.Battery.get_max_input_power`.
+
+        Curves with fewer points are padded with -inf in `curve_x` so that padded points are never selected.
+        """
+
+        ix = np.maximum(0, np.argmax(value[:, np.newaxis] <= curve_x, axis=1) - 1)
+        rows = np.arange(value.shape[0])
+        x0, x1 = curve_x[rows, ix], curve_x[rows, ix + 1]
+        y0, y1 = curve_y[rows, ix], curve_y[rows, ix + 1]
+
+        return y0 + (y1 - y0)*(value - x0)/(x1 - x0)
+
+    def __update_dynamics(self):
+        """Predict indoor dry-bulb temperature of all :py:class:`citylearn.building.LSTMDynamicsBuilding` buildings in one batch
+        and complete their :py:meth:`citylearn.building.DynamicsBuilding.apply_actions`."""
+
+        buildings = [b for b, d in zip(self.buildings, self.__dynamics) if d]
+        ixs = [i for i, b in enumerate(buildings) if b.simulate_dynamics]
+        predictions = self.__dynamics_executor.predict(ixs, [buildings[i].get_dynamics_input() for i in ixs])
+        predictions = dict(zip(ixs, predictions))
+
+        for i, b in enumerate(buildings):
+            if self.__occupant_interaction[i]:
+                b.update_dynamics(prediction=predictions.get(i), occupant_interaction=False)
+
+            else:
+                b.update_dynamics(prediction=predictions.get(i))
+
+        if self.__occupant_executor is not None:
+            self.__update_set_points([b for b, o in zip(buildings, self.__occupant_interaction) if o])
+
+        else:
+            pass
+
+    def __update_set_points(self, buildings: List[LogisticRegressionOccupantInteractionBuilding]):
+        """Predict occupant set point deltas of all :py:class:`citylearn.building.LogisticRegressionOccupantInteractionBuilding`
+        buildings in one batch and complete their :py:meth:`citylearn.building.OccupantInteractionBuilding.update_dynamics`."""
+
+        ixs = [i for i, b in enumerate(buildings) if b.simulate_dynamics]
+
+        if len(ixs) == 0:
+            return
+
+        else:
+            pass
+
+        inputs = [buildings[i].get_occupant_interaction_input() for i in ixs]
+        deltas = self.__occupant_executor.predict(ixs, [x[0] for x in inputs], [x[1] for x in inputs])
+
+        for i, d in zip(ixs, deltas):
+            buildings[i].update_set_points(set_point_delta=d)
+            buildings[i].clear_observations_cache()
+
+    @staticmethod
+    def __is_dynamics_batchable(building: Building) -> bool:
+        """Whether `building` is a :py:class:`citylearn.building.LSTMDynamicsBuilding` that does not override the
+        :py:meth:`citylearn.building.DynamicsBuilding.apply_actions` sequence split by the batched dynamics prediction."""
+
+        building_type = type(building)
+
+        return isinstance(building, LSTMDynamicsBuilding) \
+            and building_type.apply_actions is DynamicsBuilding.apply_actions \
+                and building_type.update_dynamics in [DynamicsBuilding.update_dynamics, OccupantInteractionBuilding.update_dynamics] \
+                    and building_type.update_indoor_dry_bulb_temperature is LSTMDynamicsBuilding.update_indoor_dry_bulb_temperature
+
+    @staticmethod
+    def __is_occupant_batchable(building: Building) -> bool:
+        """Whether the set points of `building` are updated with the occupant model that
+        :py:class:`citylearn.occupant.LogisticRegressionOccupantExecutor` batches."""
+
+        return isinstance(building, LogisticRegressionOccupantInteractionBuilding) \
+            and type(building).update_set_points is LogisticRegressionOccupantInteractionBuilding.update_set_points \
+                and type(building.occupant).predict is LogisticRegressionOccupant.predict
+
+    def __get_names(self, rows: np.ndarray) -> List[str]:
+        return [self.buildings[i].name for i in rows]
+
+    def __is_vectorizable(self, building: Building) -> bool:
+        """Whether `building` uses the base :py:class:`citylearn.building.Building` control and device models
+        that are mirrored by the vectorized dispatch."""
+
+        active_actions = building.active_actions
+
+        return type(building) == Building \
+            and type(building.cooling_device) == HeatPump \
+                and type(building.heating_device) in [HeatPump, ElectricHeater] \
+                    and type(building.dhw_device) in [HeatPump, ElectricHeater] \
+                        and type(building.non_shiftable_load_device) == ElectricDevice \
+                            and all(type(getattr(building, f'{e}_storage')) == StorageTank for e in self.END_USES) \
+                                and type(building.electrical_storage) == Battery \
+                                    and not ('cooling_or_heating_device_action' in active_actions
+                                        and ('cooling_device' in active_actions or 'heating_device' in active_actions)) \
+                                            and not ('cooling_device' in active_actions and 'heating_device' in active_actions)
+
+    def __set_parameters(self):
+        """Caches device parameters and exogenous time series of vectorizable buildings as arrays."""
+
+        building_count = len(self.buildings)
+        time_steps = 0 if building_count == 0 else self.buildings[0].episode_tracker.episode_time_steps
+        vectorizable = [b for b, v in zip(self.buildings, self.__vectorizable) if v]
+        rows = np.nonzero(self.__vectorizable)[0]
+
+        def get_vector(values: List[float], default: float = 0.0) -> np.ndarray:
+            vector = np.full(building_count, default, dtype='float64')
+            vector[rows] = [default if v is None else v for v in values]
+
+            return vector
+
+        def get_matrix(values: List[np.ndarray], dtype: str = 'float32') -> np.ndarray:
+            matrix = np.zeros((building_count, time_steps), dtype=dtype)
+
+            if len(values) > 0:
+                matrix[rows] = values
+
+            else:
+                pass
+
+            return matrix
+
+        def get_curves(curves: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+            size = max([2] + [c.shape[1] for c in curves])
+            curve_x = np.full((building_count, size), -np.inf, dtype='float64')
+            curve_y = np.zeros((building_count, size), dtype='float64')
+
+            for i, c in zip(rows, curves):
+                curve_x[i, :c.shape[1]] = c[0]
+                curve_y[i, :c.shape[1]] = c[1]
+
+            return curve_x, curve_y
+
+        parameters: Mapping[str, Any] = {
+            'active_actions': np.array([[k in b.active_actions for k in self.STORAGE_ACTIONS] for b in self.buildings], dtype=bool)\
+                .reshape(building_count, len(self.STORAGE_ACTIONS)),
+            'simulate_power_outage': np.array([b.simulate_power_outage for b in self.buildings], dtype=bool),
+            'non_shiftable_load': get_matrix([b.energy_simulation.non_shiftable_load for b in vectorizable]),
+            'electricity_pricing': get_matrix([b.pricing.electricity_pricing for b in vectorizable]),
+            'carbon_intensity': get_matrix([b.carbon_intensity.carbon_intensity for b in vectorizable]),
+        }
+
+        for end_use in self.END_USES:
+            devices = [getattr(b, f'{end_use}_device') for b in vectorizable]
+            storages = [getattr(b, f'{end_use}_storage') for b in vectorizable]
+            temperatures = [b.weather.outdoor_dry_bulb_temperature.astype('float64') for b in vectorizable]
+            parameters[end_use] = {
+                'demand': get_matrix([getattr(b.energy_simulation, f'{end_use}_demand') for b in vectorizable]),
+                'cop': get_matrix([
+                    d.get_cop(t, heating=end_use != 'cooling') if isinstance(d, HeatPump) else np.full(time_steps, d.efficiency, dtype='float64')
+                    for d, t in zip(devices, temperatures)
+                ], dtype='float64'),
+                'nominal_power': get_vector([d.nominal_power for d in devices]),
+                'capacity': get_vector([s.capacity for s in storages]),
+                'loss_coefficient': get_vector([s.loss_coefficient for s in storages]),
+                'round_trip_efficiency': get_vector([s.round_trip_efficiency for s in storages], default=1.0),
+                'max_input_power': get_vector([s.max_input_power for s in storages], default=np.nan),
+                'max_output_power': get_vector([s.max_output_power for s in storages], default=np.nan),
+            }
+
+        batteries = [b.electrical_storage for b in vectorizable]
+        capacity_power_curve_x, capacity_power_curve_y = get_curves([b.capacity_power_curve for b in batteries])
+        power_efficiency_curve_x, power_efficiency_curve_y = get_curves([b.power_efficiency_curve for b in batteries])
+        parameters['electrical_storage'] = {
+            'capacity': get_vector([b.capacity for b in batteries]),
+            'nominal_power': get_vector([b.nominal_power for b in batteries]),
+            'loss_coefficient': get_vector([b.loss_coefficient for b in batteries]),
+            'capacity_loss_coefficient': get_vector([b.capacity_loss_coefficient for b in batteries]),
+            'depth_of_discharge': get_vector([b.depth_of_discharge for b in batteries], default=1.0),
+            'capacity_power_curve_x': capacity_power_curve_x,
+            'capacity_power_curve_y': capacity_power_curve_y,
+            'power_efficiency_curve_x': power_efficiency_curve_x,
+            'power_efficiency_curve_y': power_efficiency_curve_y,
+        }
+
+        # parameters are static for the episode so they are made read-only to be shared rather than copied by snapshots
+        for v in [parameters[k] for k in ['active_actions', 'simulate_power_outage', 'non_shiftable_load', 'electricity_pricing', 'carbon_intensity']]\
+            + [v for k in self.END_USES + ['electrical_storage'] for v in parameters[k].values()]:
+            v.flags.writeable = False
+
+        self.__parameters = parameters
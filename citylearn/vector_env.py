@@ -0,0 +1,565 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+import traceback
+from typing import Any, List, Mapping, Tuple, Union
+from gymnasium import spaces
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+import numpy as np
+from citylearn.citylearn import CityLearnEnv
+
+class CityLearnVectorEnv(VectorEnv):
+    r"""Vectorized environment that steps independent :py:class:`citylearn.citylearn.CityLearnEnv` copies of a schema in one process.
+
+    Parameters
+    ----------
+    schema: Union[str, Path, Mapping[str, Any]]
+        Name of CityLearn data set, filepath to JSON representation or :code:`dict` object of a CityLearn schema.
+        Call :py:meth:`citylearn.data.DataSet.get_names` for list of available CityLearn data sets.
+    num_envs: int, optional
+        Number of environment copies. Defaults to the length of `env_kwargs` if provided otherwise, 1.
+    env_kwargs: List[Mapping[str, Any]], optional
+        Keyword arguments for each copy e.g. different `random_seed`, `episode_time_steps` or `buildings` subsets.
+        Values override those in `kwargs`.
+
+    Other Parameters
+    ----------------
+    **kwargs : dict
+        Keyword arguments used to initialize all :py:class:`citylearn.citylearn.CityLearnEnv` copies.
+
+    Notes
+    -----
+    The schema is parsed once and its data files and sizing data are read once then shared by all copies through
+    :py:class:`citylearn.citylearn.CityLearnEnv` `data_cache`. Observations are returned as a float32 array of shape
+    (`num_envs`, `n_agents`, `n_observations`), rewards as an array of shape (`num_envs`, `n_agents`) and terminations and truncations
+    as boolean arrays of shape (`num_envs`,). Actions are parsed in the shape of `action_space`. Agents with fewer observations
+    or actions than others are right-padded with `np.nan` observations and their padded actions are ignored. All copies must
+    have the same number of agents and observation and action dimensions. Copies that terminate are reset on the next :py:meth:`step` call
+    following gymnasium's :code:`AutoresetMode.NEXT_STEP` convention.
+    """
+
+    def __init__(self, schema: Union[str, Path, Mapping[str, Any]], num_envs: int = None, env_kwargs: List[Mapping[str, Any]] = None, **kwargs: Any):
+        num_envs = (1 if env_kwargs is None else len(env_kwargs)) if num_envs is None else num_envs
+        env_kwargs = [{} for _ in range(num_envs)] if env_kwargs is None else env_kwargs
+        assert len(env_kwargs) == num_envs, f'env_kwargs length ({len(env_kwargs)}) must equal num_envs ({num_envs}).'
+        schema = CityLearnEnv._parse_schema(schema)
+        self.__data_cache = {}
+        self.__envs = [CityLearnEnv(schema, data_cache=self.__data_cache, **{**kwargs, **k}) for k in env_kwargs]
+        self.num_envs = num_envs
+        self.metadata = {**self.metadata, 'autoreset_mode': AutoresetMode.NEXT_STEP}
+        self.__set_spaces()
+        self.__autoreset = np.zeros(self.num_envs, dtype=bool)
+        self.__observations = np.full((self.num_envs, *self.single_observation_space.shape), np.nan, dtype='float32')
+
+    @property
+    def envs(self) -> List[CityLearnEnv]:
+        """Environment copies."""
+
+        return self.__envs
+
+    @property
+    def data_cache(self) -> Mapping[Any, Any]:
+        """Parsed data files and sizing data shared by `envs`."""
+
+        return self.__data_cache
+
+    def reset(self, seed: Union[int, List[int]] = None, options: Mapping[str, Any] = None) -> Tuple[np.ndarray, Mapping[str, Any]]:
+        r"""Reset all environment copies.
+
+        Parameters
+        ----------
+        seed: Union[int, List[int]], optional
+            Seed for each copy. If an :code:`int` is provided, copy `i` is seeded with `seed` + `i`.
+        options: Mapping[str, Any], optional
+            Passed to each copy's :py:meth:`citylearn.citylearn.CityLearnEnv.reset`.
+
+        Returns
+        -------
+        observations: np.ndarray
+            Stacked observations of shape (`num_envs`, `n_agents`, `n_observations`).
+        info: dict
+            Stacked copies' info.
+        """
+
+        seed = [None]*self.num_envs if seed is None else seed
+        seed = [seed + i for i in range(self.num_envs)] if isinstance(seed, int) else seed
+        assert len(seed) == self.num_envs, f'seed length ({len(seed)}) must equal num_envs ({self.num_envs}).'
+        infos = {}
+
+        for i, (env, s) in enumerate(zip(self.envs, seed)):
+            observations, info = env.reset(seed=s, options=options)
+            self.__set_observations(i, observations)
+            infos = self._add_info(infos, info, i)
+
+        self.__autoreset[:] = False
+
+        return self.__observations.copy(), infos
+
+    def step(self, actions: Union[np.ndarray, List[List[List[float]]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Mapping[str, Any]]:
+        r"""Apply actions to all environment copies and advance them to the next time step.
+
+        Parameters
+        ----------
+        actions: Union[np.ndarray, List[List[List[float]]]]
+            Actions of shape (`num_envs`, `n_agents`, `n_actions`) where each copy's actions follow
+            :py:meth:`citylearn.citylearn.CityLearnEnv.step` ordering.
+
+        Returns
+        -------
+        observations: np.ndarray
+            Stacked observations of shape (`num_envs`, `n_agents`, `n_observations`).
+        rewards: np.ndarray
+            Stacked rewards of shape (`num_envs`, `n_agents`).
+        terminations: np.ndarray
+            Whether each copy's episode has ended.
+        truncations: np.ndarray
+            Whether each copy's episode was truncated.
+        info: dict
+            Stacked copies' info.
+        """
+
+        rewards = np.zeros((self.num_envs, self.single_observation_space.shape[0]), dtype='float32')
+        terminations = np.zeros(self.num_envs, dtype=bool)
+        truncations = np.zeros(self.num_envs, dtype=bool)
+        infos = {}
+
+        for i, (env, a) in enumerate(zip(self.envs, actions)):
+            if self.__autoreset[i]:
+                observations, info = env.reset()
+
+            else:
+                a = [list(a_[:n]) for a_, n in zip(a, self.__action_dimensions)]
+                observations, reward, terminations[i], truncations[i], info = env.step(a)
+                rewards[i] = reward
+
+            self.__set_observations(i, observations)
+            infos = self._add_info(infos, info, i)
+
+        self.__autoreset = np.logical_or(terminations, truncations)
+
+        return self.__observations.copy(), rewards, terminations, truncations, infos
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        """Calls method `name` or gets attribute `name` of each environment copy.
+
+        Parameters
+        ----------
+        name: str
+            Name of :py:class:`citylearn.citylearn.CityLearnEnv` method or attribute e.g. :code:`evaluate`.
+
+        Other Parameters
+        ----------------
+        *args: Any
+            Positional arguments passed to method.
+        **kwargs: dict
+            Keyword arguments passed to method.
+
+        Returns
+        -------
+        results: Tuple[Any, ...]
+            Each copy's return value.
+        """
+
+        results = []
+
+        for env in self.envs:
+            value = getattr(env, name)
+            results.append(value(*args, **kwargs) if callable(value) else value)
+
+        return tuple(results)
+
+    def close_extras(self, **kwargs: Any):
+        for env in self.envs:
+            env.close()
+
+    def __set_observations(self, index: int, observations: List[List[float]]):
+        for j, o in enumerate(observations):
+            self.__observations[index, j, :len(o)] = o
+
+    def __set_spaces(self):
+        observation_spaces = [env.observation_space for env in self.envs]
+        action_spaces = [env.action_space for env in self.envs]
+
+        for env_observation_spaces, env_action_spaces in zip(observation_spaces[1:], action_spaces[1:]):
+            assert [s.shape for s in env_observation_spaces] == [s.shape for s in observation_spaces[0]]\
+                and [s.shape for s in env_action_spaces] == [s.shape for s in action_spaces[0]],\
+                    'All environment copies must have the same number of agents and observation and action dimensions.'
+
+        self.__action_dimensions = [s.shape[0] for s in action_spaces[0]]
+        self.single_observation_space = self._get_stacked_space(observation_spaces[0], -np.inf, np.inf)
+        self.single_action_space = self._get_stacked_space(action_spaces[0], 0.0, 0.0)
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+    @staticmethod
+    def _get_stacked_space(agent_spaces: List[spaces.Box], low_padding: float, high_padding: float) -> spaces.Box:
+        """Returns space of shape (`n_agents`, `n_dimensions`) where agents with fewer dimensions are padded with `low_padding` and `high_padding` limits."""
+
+        size = max(s.shape[0] for s in agent_spaces)
+        low = np.full((len(agent_spaces), size), low_padding, dtype='float32')
+        high = np.full((len(agent_spaces), size), high_padding, dtype='float32')
+
+        for i, s in enumerate(agent_spaces):
+            low[i, :s.shape[0]] = s.low
+            high[i, :s.shape[0]] = s.high
+
+        return spaces.Box(low=low, high=high, dtype='float32')
+
+class CityLearnAsyncVectorEnv(VectorEnv):
+    r"""Vectorized environment that steps independent :py:class:`citylearn.citylearn.CityLearnEnv` copies of a schema in parallel worker processes.
+
+    Each worker process owns one copy. Observations, actions, rewards, terminations and truncations are exchanged through
+    :py:class:`multiprocessing.shared_memory.SharedMemory` buffers so only commands and `info` are sent through pipes.
+
+    Parameters
+    ----------
+    schema: Union[str, Path, Mapping[str, Any]]
+        Name of CityLearn data set, filepath to JSON representation or :code:`dict` object of a CityLearn schema.
+        Call :py:meth:`citylearn.data.DataSet.get_names` for list of available CityLearn data sets.
+    num_envs: int, optional
+        Number of environment copies. Defaults to the length of `env_kwargs` if provided otherwise, 1.
+    env_kwargs: List[Mapping[str, Any]], optional
+        Keyword arguments for each copy e.g. different `random_seed`, `episode_time_steps` or `buildings` subsets.
+        Values override those in `kwargs`.
+    context: str, optional
+        :py:mod:`multiprocessing` start method. Defaults to :code:`fork` where available.
+    copy: bool, default: True
+        Whether to return copies of the shared buffers from :py:meth:`reset` and :py:meth:`step`. If False, read-only 
+        views of the shared buffers are returned without copying and are overwritten by the next :py:meth:`reset` or :py:meth:`step` call.
+
+    Other Parameters
+    ----------------
+    **kwargs : dict
+        Keyword arguments used to initialize all :py:class:`citylearn.citylearn.CityLearnEnv` copies.
+
+    Notes
+    -----
+    The first copy is initialized in the parent process, which also reads the data files and sizing data into a shared `data_cache`. 
+    With the :code:`fork` start method, workers are forked afterwards so that the first worker takes over the parent's copy, and the other 
+    workers initialize their copies from the inherited `data_cache` without reading files and share its memory with the parent. 
+    Return shapes and autoreset behavior are the same as :py:class:`citylearn.vector_env.CityLearnVectorEnv`.
+    """
+
+    def __init__(
+        self, schema: Union[str, Path, Mapping[str, Any]], num_envs: int = None, env_kwargs: List[Mapping[str, Any]] = None, 
+        context: str = None, copy: bool = None, **kwargs: Any
+    ):
+        num_envs = (1 if env_kwargs is None else len(env_kwargs)) if num_envs is None else num_envs
+        env_kwargs = [{} for _ in range(num_envs)] if env_kwargs is None else env_kwargs
+        assert len(env_kwargs) == num_envs, f'env_kwargs length ({len(env_kwargs)}) must equal num_envs ({num_envs}).'
+        context = ('fork' if 'fork' in multiprocessing.get_all_start_methods() else None) if context is None else context
+        self.copy = True if copy is None else copy
+        self.num_envs = num_envs
+        self.metadata = {**self.metadata, 'autoreset_mode': AutoresetMode.NEXT_STEP}
+        self.__processes = []
+        self.__pipes = []
+        self.__shared_memories = {}
+        self.__waiting = False
+
+        # load data once in parent and use first copy to set spaces
+        schema = CityLearnEnv._parse_schema(schema)
+        data_cache = {}
+        env = CityLearnEnv(schema, data_cache=data_cache, **{**kwargs, **env_kwargs[0]})
+        self.single_observation_space = CityLearnVectorEnv._get_stacked_space(env.observation_space, -np.inf, np.inf)
+        self.single_action_space = CityLearnVectorEnv._get_stacked_space(env.action_space, 0.0, 0.0)
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        space_shapes = self.__get_space_shapes(env)
+
+        # shared buffers
+        buffer_specs = {
+            'observations': ((self.num_envs, *self.single_observation_space.shape), 'float32'),
+            'actions': ((self.num_envs, *self.single_action_space.shape), 'float32'),
+            'rewards': ((self.num_envs, self.single_observation_space.shape[0]), 'float32'),
+            'terminations': ((self.num_envs,), 'bool'),
+            'truncations': ((self.num_envs,), 'bool'),
+        }
+
+        for k, (shape, dtype) in buffer_specs.items():
+            size = max(int(np.prod(shape))*np.dtype(dtype).itemsize, 1)
+            self.__shared_memories[k] = SharedMemory(create=True, size=size)
+
+        self.__buffers = self.__get_buffers(self.__shared_memories, buffer_specs)
+        self.__buffers['observations'][:] = np.nan
+        self.__buffers['actions'][:] = 0.0
+
+        # start workers
+        ctx = multiprocessing.get_context(context)
+        fork = ctx.get_start_method() == 'fork'
+
+        for i, k in enumerate(env_kwargs):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=self._worker,
+                name=f'{type(self).__name__}Worker-{i}',
+                args=(
+                    i, env if fork and i == 0 else None, schema, data_cache, {**kwargs, **k}, 
+                    self.__shared_memories, buffer_specs, child_pipe, parent_pipe
+                ),
+                daemon=True,
+            )
+            self.__processes.append(process)
+            self.__pipes.append(parent_pipe)
+            process.start()
+            child_pipe.close()
+
+        del env, data_cache
+
+        for i, shapes in enumerate(self.__receive()):
+            assert shapes == space_shapes, f'Environment copy {i} must have the same number of agents and observation and action dimensions as copy 0.'
+
+    def reset(self, seed: Union[int, List[int]] = None, options: Mapping[str, Any] = None) -> Tuple[np.ndarray, Mapping[str, Any]]:
+        r"""Reset all environment copies.
+
+        Parameters
+        ----------
+        seed: Union[int, List[int]], optional
+            Seed for each copy. If an :code:`int` is provided, copy `i` is seeded with `seed` + `i`.
+        options: Mapping[str, Any], optional
+            Passed to each copy's :py:meth:`citylearn.citylearn.CityLearnEnv.reset`.
+
+        Returns
+        -------
+        observations: np.ndarray
+            Stacked observations of shape (`num_envs`, `n_agents`, `n_observations`).
+        info: dict
+            Stacked copies' info.
+        """
+
+        seed = [None]*self.num_envs if seed is None else seed
+        seed = [seed + i for i in range(self.num_envs)] if isinstance(seed, int) else seed
+        assert len(seed) == self.num_envs, f'seed length ({len(seed)}) must equal num_envs ({self.num_envs}).'
+        self.__send([('reset', {'seed': s, 'options': options}) for s in seed])
+        infos = {}
+
+        for i, info in enumerate(self.__receive()):
+            infos = self._add_info(infos, info, i)
+
+        return self.__get_buffer('observations'), infos
+
+    def step(self, actions: Union[np.ndarray, List[List[List[float]]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Mapping[str, Any]]:
+        r"""Apply actions to all environment copies and advance them to the next time step.
+
+        Equivalent to :py:meth:`step_async` followed by :py:meth:`step_wait`.
+
+        Parameters
+        ----------
+        actions: Union[np.ndarray, List[List[List[float]]]]
+            Actions of shape (`num_envs`, `n_agents`, `n_actions`) where each copy's actions follow
+            :py:meth:`citylearn.citylearn.CityLearnEnv.step` ordering.
+
+        Returns
+        -------
+        observations: np.ndarray
+            Stacked observations of shape (`num_envs`, `n_agents`, `n_observations`).
+        rewards: np.ndarray
+            Stacked rewards of shape (`num_envs`, `n_agents`).
+        terminations: np.ndarray
+            Whether each copy's episode has ended.
+        truncations: np.ndarray
+            Whether each copy's episode was truncated.
+        info: dict
+            Stacked copies' info.
+        """
+
+        self.step_async(actions)
+
+        return self.step_wait()
+
+    def step_async(self, actions: Union[np.ndarray, List[List[List[float]]]]):
+        """Write `actions` to the shared actions buffer and signal workers to step without waiting for them."""
+
+        assert not self.__waiting, 'Call step_wait before calling step_async again.'
+        buffer = self.__buffers['actions']
+
+        if isinstance(actions, np.ndarray) and actions.shape == buffer.shape:
+            buffer[:] = actions
+
+        else:
+            for i, a in enumerate(actions):
+                for j, a_ in enumerate(a):
+                    buffer[i, j, :len(a_)] = a_
+
+        self.__send([('step', None)]*self.num_envs)
+        self.__waiting = True
+
+    def step_wait(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Mapping[str, Any]]:
+        """Wait for workers to complete the step started by :py:meth:`step_async` and return its results."""
+
+        assert self.__waiting, 'Call step_async before calling step_wait.'
+        infos = {}
+
+        try:
+            for i, info in enumerate(self.__receive()):
+                infos = self._add_info(infos, info, i)
+        
+        finally:
+            self.__waiting = False
+
+        return (
+            self.__get_buffer('observations'), self.__get_buffer('rewards'), self.__get_buffer('terminations'), 
+            self.__get_buffer('truncations'), infos
+        )
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        """Calls method `name` or gets attribute `name` of each environment copy in its worker process.
+
+        Parameters
+        ----------
+        name: str
+            Name of :py:class:`citylearn.citylearn.CityLearnEnv` method or attribute e.g. :code:`evaluate`.
+
+        Other Parameters
+        ----------------
+        *args: Any
+            Positional arguments passed to method.
+        **kwargs: dict
+            Keyword arguments passed to method.
+
+        Returns
+        -------
+        results: Tuple[Any, ...]
+            Each copy's return value.
+        """
+
+        self.__send([('call', (name, args, kwargs))]*self.num_envs)
+
+        return tuple(self.__receive())
+
+    def close_extras(self, **kwargs: Any):
+        try:
+            if self.__waiting:
+                _ = self.__receive()
+
+            else:
+                pass
+        
+            self.__send([('close', None)]*len(self.__pipes))
+            _ = self.__receive()
+        
+        except Exception:
+            pass
+
+        finally:
+            for pipe in self.__pipes:
+                pipe.close()
+
+            for process in self.__processes:
+                process.join(timeout=5)
+
+                if process.is_alive():
+                    process.terminate()
+                
+                else:
+                    pass
+
+            for shared_memory in self.__shared_memories.values():
+                shared_memory.close()
+                shared_memory.unlink()
+
+            self.__shared_memories = {}
+
+    def __get_buffer(self, name: str) -> np.ndarray:
+        buffer = self.__buffers[name]
+
+        if self.copy:
+            buffer = buffer.copy()
+
+        else:
+            buffer = buffer.view()
+            buffer.flags.writeable = False
+
+        return buffer
+
+    def __send(self, commands: List[Tuple[str, Any]]):
+        for pipe, command in zip(self.__pipes, commands):
+            pipe.send(command)
+
+    def __receive(self) -> List[Any]:
+        results = [pipe.recv() for pipe in self.__pipes]
+        errors = [(i, r) for i, (r, success) in enumerate(results) if not success]
+
+        if len(errors) > 0:
+            raise Exception('\n'.join([f'Environment copy {i} worker raised:\n{e}' for i, e in errors]))
+
+        else:
+            return [r for r, _ in results]
+
+    @staticmethod
+    def __get_space_shapes(env: CityLearnEnv) -> Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]:
+        return [s.shape for s in env.observation_space], [s.shape for s in env.action_space]
+
+    @staticmethod
+    def __get_buffers(shared_memories: Mapping[str, SharedMemory], buffer_specs: Mapping[str, Tuple[Tuple[int, ...], str]]) -> Mapping[str, np.ndarray]:
+        return {k: np.ndarray(shape, dtype=dtype, buffer=shared_memories[k].buf) for k, (shape, dtype) in buffer_specs.items()}
+
+    @classmethod
+    def _worker(
+        cls, index: int, env: CityLearnEnv, schema: Mapping[str, Any], data_cache: Mapping[Any, Any], env_kwargs: Mapping[str, Any], 
+        shared_memories: Mapping[str, SharedMemory], buffer_specs: Mapping[str, Tuple[Tuple[int, ...], str]], pipe: Connection, parent_pipe: Connection
+    ):
+        """Worker process loop that owns one environment copy and exchanges step data through the shared buffers."""
+
+        parent_pipe.close()
+        buffers = cls.__get_buffers(shared_memories, buffer_specs)
+        autoreset = False
+
+        try:
+            env = CityLearnEnv(schema, data_cache=data_cache, **env_kwargs) if env is None else env
+            action_dimensions = [s.shape[0] for s in env.action_space]
+            pipe.send((cls.__get_space_shapes(env), True))
+
+            while True:
+                command, data = pipe.recv()
+
+                if command == 'reset':
+                    observations, info = env.reset(**data)
+                    autoreset = False
+
+                elif command == 'step':
+                    if autoreset:
+                        observations, info = env.reset()
+                        buffers['rewards'][index] = 0.0
+                        buffers['terminations'][index] = False
+                        buffers['truncations'][index] = False
+                        autoreset = False
+
+                    else:
+                        actions = [a[:n].tolist() for a, n in zip(buffers['actions'][index], action_dimensions)]
+                        observations, reward, terminated, truncated, info = env.step(actions)
+                        buffers['rewards'][index] = reward
+                        buffers['terminations'][index] = terminated
+                        buffers['truncations'][index] = truncated
+                        autoreset = terminated or truncated
+
+                elif command == 'call':
+                    name, args, kwargs = data
+                    value = getattr(env, name)
+                    pipe.send((value(*args, **kwargs) if callable(value) else value, True))
+                    continue
+
+                elif command == 'close':
+                    pipe.send((None, True))
+                    break
+
+                else:
+                    raise ValueError(f'Unknown command: {command}')
+
+                for j, o in enumerate(observations):
+                    buffers['observations'][index, j, :len(o)] = o
+
+                pipe.send((info, True))
+
+        except (KeyboardInterrupt, Exception):
+            pipe.send((traceback.format_exc(), False))
+
+        finally:
+            if env is not None:
+                env.close()
+            
+            else:
+                pass
+
+            pipe.close()
@@ -390,10 +390,61 @@ class DiscreteSpaceWrapper(Wrapper):
         super().__init__(env)
         self.env: CityLearnEnv
 
+class MixedRadixEncoder:
+    """Maps vectors of discrete values to integer indices and back without materializing all combinations.
+
+    The index of a vector is its value in a mixed-radix number system where the first value is the most significant digit
+    so that indices follow the order of `itertools.product` over `range(radix)` of each digit.
+
+    Parameters
+    ----------
+    radices: List[int]
+        Number of possible values of each digit.
+    """
+
+    def __init__(self, radices: List[int]):
+        self.radices = [int(r) for r in radices]
+
+    @property
+    def size(self) -> int:
+        """Number of combinations."""
+
+        size = 1
+
+        for r in self.radices:
+            size *= r
+
+        return size
+
+    def encode(self, values: List[int]) -> int:
+        """Returns index of `values`."""
+
+        index = 0
+
+        for v, r in zip(values, self.radices):
+            v = int(v)
+            assert 0 <= v < r, f'value {v} is out of range for radix {r}.'
+            index = index*r + v
+
+        return index
+    
+    def decode(self, index: int) -> List[int]:
+        """Returns values at `index`."""
+
+        index = int(index)
+        assert 0 <= index < self.size, f'index {index} is out of range for size {self.size}.'
+        values = [0]*len(self.radices)
+
+        for i in range(len(self.radices) - 1, -1, -1):
+            index, values[i] = divmod(index, self.radices[i])
+
+        return values
+
 class TabularQLearningObservationWrapper(ObservationWrapper):
     """Observation wrapper for :py:class:`citylearn.agents.q_learning.TabularQLearning` agent.
 
-    Wraps `env` in :py:class:`citylearn.wrappers.DiscreteObservationWrapper`.
+    Wraps `env` in :py:class:`citylearn.wrappers.DiscreteObservationWrapper`. Discrete observations are mapped to
+    a single state index with a :py:class:`citylearn.wrappers.MixedRadixEncoder` per building.
     
     Parameters
     ----------
@@ -409,7 +460,23 @@ class TabularQLearningObservationWrapper(ObservationWrapper):
         env = DiscreteObservationWrapper(env, bin_sizes=bin_sizes, default_bin_size=default_bin_size)
         super().__init__(env)
         self.env: CityLearnEnv
-        self.combinations = self.set_combinations()
+        self.encoders = self.set_encoders()
+        self.__combinations = None
+
+    @property
+    def combinations(self) -> List[List[Tuple[int, ...]]]:
+        """All combinations of discrete observations of each building in index order.
+
+        Built from :py:attr:`encoders` on first access as the wrapper maps indices with the encoders.
+        """
+
+        if self.__combinations is None:
+            self.__combinations = self.set_combinations()
+
+        else:
+            pass
+
+        return self.__combinations
 
     @property
     def observation_space(self) -> List[spaces.Discrete]:
@@ -417,32 +484,31 @@ class TabularQLearningObservationWrapper(ObservationWrapper):
 
         observation_space = []
 
-        for c in self.combinations:
-            observation_space.append(spaces.Discrete(len(c) - 1))
+        for e in self.encoders:
+            observation_space.append(spaces.Discrete(e.size - 1))
         
         return observation_space
     
     def observation(self, observations: List[List[int]]) -> List[List[int]]:
         """Returns discretized observations."""
 
-        return [[c.index(tuple(o))] for o, c in zip(observations, self.combinations)]
+        return [[e.encode(o)] for o, e in zip(observations, self.encoders)]
     
-    def set_combinations(self) -> List[List[int]]:
-        """Returns all combinations of discrete observations."""
+    def set_encoders(self) -> List[MixedRadixEncoder]:
+        """Returns state index encoder of discrete observations for each building."""
 
-        combs_list = []
+        return [MixedRadixEncoder([d.n + 1 for d in s]) for s in self.env.observation_space]
 
-        for s in self.env.observation_space:
-            options = [list(range(d.n + 1)) for d in s]
-            combs = list(itertools.product(*options))
-            combs_list.append(combs)
+    def set_combinations(self) -> List[List[Tuple[int, ...]]]:
+        """Returns all combinations of discrete observations."""
 
-        return combs_list
+        return [list(itertools.product(*[range(r) for r in e.radices])) for e in self.encoders]
     
 class TabularQLearningActionWrapper(ActionWrapper):
     """Action wrapper for :py:class:`citylearn.agents.q_learning.TabularQLearning` agent.
 
-    Wraps `env` in :py:class:`citylearn.wrappers.DiscreteActionWrapper`.
+    Wraps `env` in :py:class:`citylearn.wrappers.DiscreteActionWrapper`. Action indices are mapped back to discrete
+    actions with a :py:class:`citylearn.wrappers.MixedRadixEncoder` per building.
     
     Parameters
     ----------
@@ -458,7 +524,23 @@ class TabularQLearningActionWrapper(ActionWrapper):
         env = DiscreteActionWrapper(env, bin_sizes=bin_sizes, default_bin_size=default_bin_size)
         super().__init__(env)
         self.env: CityLearnEnv
-        self.combinations = self.set_combinations()
+        self.encoders = self.set_encoders()
+        self.__combinations = None
+
+    @property
+    def combinations(self) -> List[List[Tuple[int, ...]]]:
+        """All combinations of discrete actions of each building in index order.
+
+        Built from :py:attr:`encoders` on first access as the wrapper maps indices with the encoders.
+        """
+
+        if self.__combinations is None:
+            self.__combinations = self.set_combinations()
+
+        else:
+            pass
+
+        return self.__combinations
 
     @property
     def action_space(self) -> List[spaces.Discrete]:
@@ -466,27 +548,25 @@ class TabularQLearningActionWrapper(ActionWrapper):
 
         action_space = []
 
-        for c in self.combinations:
-            action_space.append(spaces.Discrete(len(c)))
+        for e in self.encoders:
+            action_space.append(spaces.Discrete(e.size))
         
         return action_space
     
     def action(self, actions: List[float]) -> List[List[int]]:
         """Returns discretized actions."""
 
-        return [list(c[a[0]]) for a, c in zip(actions, self.combinations)]
+        return [e.decode(a[0]) for a, e in zip(actions, self.encoders)]
     
-    def set_combinations(self) -> List[List[int]]:
-        """Returns all combinations of discrete actions."""
+    def set_encoders(self) -> List[MixedRadixEncoder]:
+        """Returns action index encoder of discrete actions for each building."""
 
-        combs_list = []
+        return [MixedRadixEncoder([d.n for d in s]) for s in self.env.action_space]
 
-        for s in self.env.action_space:
-            options = [list(range(d.n)) for d in s]
-            combs = list(itertools.product(*options))
-            combs_list.append(combs)
+    def set_combinations(self) -> List[List[Tuple[int, ...]]]:
+        """Returns all combinations of discrete actions."""
 
-        return combs_list
+        return [list(itertools.product(*[range(r) for r in e.radices])) for e in self.encoders]
     
 class TabularQLearningWrapper(Wrapper):
     """Wrapper for :py:class:`citylearn.agents.q_learning.TabularQLearning` agent.
@@ -0,0 +1,44 @@
+import sys
+sys.path.insert(0, '..')
+from citylearn.benchmark import Benchmark
+from citylearn.utilities import read_json
+
+RESULT_FILEPATH = 'benchmark.json'
+REFERENCE_FILEPATH = None
+TIME_STEPS = 720
+TOLERANCE = 0.1
+
+def main():
+    results = Benchmark(time_steps=TIME_STEPS).run(RESULT_FILEPATH)
+
+    # compare steps per second to results of a previous commit
+    if REFERENCE_FILEPATH is not None:
+        reference = {r['schema']: r for r in read_json(REFERENCE_FILEPATH)['results']}
+
+        for result in results['results']:
+            if result['schema'] not in reference:
+                continue
+            
+            else:
+                pass
+
+            for policy, value in result['policies'].items():
+                reference_value = reference[result['schema']]['policies'].get(policy, {}).get('steps_per_second')
+
+                if reference_value is None or value['steps_per_second'] is None:
+                    continue
+
+                elif value['steps_per_second'] < (1.0 - TOLERANCE)*reference_value:
+                    print(f'Regression on schema: "{result["schema"]}", policy: "{policy}", steps per second: {value["steps_per_second"]:.1f} vs {reference_value:.1f}')
+                
+                else:
+                    pass
+    
+    else:
+        pass
+
+    for result in results['results']:
+        print(result)
+
+if __name__ == '__main__':
+    main()
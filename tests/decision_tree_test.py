@@ -0,0 +1,62 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+from citylearn.occupant import DecisionTreeArrays
+
+TREE_COUNT = 8
+SAMPLE_COUNT = 5000
+FEATURE_COUNT = 6
+CLASSES = [-2, -1, 0, 1, 2]
+RANDOM_SEED = 0
+
+def get_samples(random_state: np.random.RandomState, models: list = None) -> np.ndarray:
+    """Returns random samples that include values at and around the split thresholds of `models`."""
+
+    x = random_state.uniform(-10.0, 40.0, (SAMPLE_COUNT, FEATURE_COUNT))
+
+    for m in [] if models is None else models:
+        split = m.tree_.feature >= 0
+        features = m.tree_.feature[split]
+        thresholds = m.tree_.threshold[split]
+        ixs = random_state.randint(0, SAMPLE_COUNT, features.shape[0]*3)
+        values = np.concatenate([thresholds, np.nextafter(thresholds, np.inf), np.nextafter(thresholds, -np.inf)])
+        x[ixs, np.tile(features, 3)] = values
+
+    return x
+
+def main():
+    # compiled trees must predict the same classes as the sklearn models they are compiled from
+    random_state = np.random.RandomState(RANDOM_SEED)
+    models = []
+
+    for i in range(TREE_COUNT):
+        x = get_samples(random_state)
+        y = np.array(CLASSES)[random_state.randint(0, len(CLASSES), SAMPLE_COUNT)]
+        models.append(DecisionTreeClassifier(max_depth=random_state.randint(1, 12), random_state=i).fit(x, y))
+
+    x = get_samples(random_state, models)
+    trees = [DecisionTreeArrays.from_model(m) for m in models]
+
+    for i, (m, t) in enumerate(zip(models, trees)):
+        assert np.array_equal(t.predict(x), m.predict(x)), f'Compiled tree: {i} predictions differ.'
+
+    # concatenated trees evaluate each sample with its own tree
+    tree, roots = DecisionTreeArrays.concatenate(trees)
+    ixs = random_state.randint(0, TREE_COUNT, SAMPLE_COUNT)
+    reference = np.array([models[j].predict(x[k:k + 1])[0] for k, j in enumerate(ixs)])
+    assert np.array_equal(tree.predict(x, roots=roots[ixs]), reference), 'Concatenated tree predictions differ.'
+
+    # models that are not single-output classifiers are not compiled
+    assert DecisionTreeArrays.from_model(object()) is None
+    multi_output_model = DecisionTreeClassifier(max_depth=2).fit(x[:100], np.stack([ixs[:100], ixs[:100] % 2], axis=1))
+    assert DecisionTreeArrays.from_model(multi_output_model) is None
+
+    print(f'Compiled trees match sklearn predictions on {SAMPLE_COUNT} samples for {TREE_COUNT} trees.')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
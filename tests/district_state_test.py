@@ -0,0 +1,83 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.building import DynamicsBuilding
+from citylearn.citylearn import CityLearnEnv
+from citylearn.data import DataSet
+
+SCHEMAS = [
+    'citylearn_challenge_2020_climate_zone_1',
+    'citylearn_challenge_2022_phase_all',
+    'citylearn_challenge_2023_phase_2_local_evaluation',
+]
+TIME_STEPS = 720
+RANDOM_SEED = 0
+DYNAMICS_TOLERANCE = 1e-5
+
+def get_per_building_type(building_type: type) -> type:
+    """Returns a subclass of `building_type` that :py:class:`citylearn.state.DistrictState` dispatches building by building."""
+
+    def apply_actions(self, *args, **kwargs):
+        return building_type.apply_actions(self, *args, **kwargs)
+
+    return type(f'PerBuilding{building_type.__name__}', (building_type,), {'apply_actions': apply_actions})
+
+def get_env(schema: str, per_building: bool) -> CityLearnEnv:
+    schema = DataSet.get_schema(schema)
+    simulation_end_time_step = min(schema['simulation_end_time_step'], schema['simulation_start_time_step'] + TIME_STEPS - 1)
+    env = CityLearnEnv(schema, random_seed=RANDOM_SEED, simulation_end_time_step=simulation_end_time_step)
+
+    if per_building:
+        for b in env.buildings:
+            b.__class__ = get_per_building_type(type(b))
+
+    else:
+        pass
+
+    env.reset()
+
+    return env
+
+def main():
+    # vectorized dispatch must match per-building dispatch bitwise while batched LSTM dynamics
+    # may differ from per-building prediction by float32 rounding
+    for schema in SCHEMAS:
+        env = get_env(schema, False)
+        reference_env = get_env(schema, True)
+        assert not reference_env.district_state.vectorizable.any(), 'Reference environment must dispatch building by building.'
+        random_state = np.random.default_rng(RANDOM_SEED)
+
+        if any(isinstance(b, DynamicsBuilding) for b in env.buildings):
+            is_equal = lambda x, y: np.allclose(x, y, rtol=DYNAMICS_TOLERANCE, atol=DYNAMICS_TOLERANCE, equal_nan=True)
+
+        else:
+            is_equal = lambda x, y: np.array_equal(x, y, equal_nan=True)
+
+        while not env.terminated:
+            actions = [random_state.uniform(s.low, s.high).tolist() for s in env.action_space]
+            observations, reward, *_ = env.step(actions)
+            reference_observations, reference_reward, *_ = reference_env.step(actions)
+            assert all(is_equal(o, r) for o, r in zip(observations, reference_observations)),\
+                f'Observations differ at time step: {env.time_step}'
+            assert is_equal(reward, reference_reward), f'Rewards differ at time step: {env.time_step}'
+
+        for k, v in env.district_state.time_series.items():
+            assert np.array_equal(v, reference_env.district_state.time_series[k], equal_nan=True), f'Time series differ: {k}'
+
+        for b, r in zip(env.buildings, reference_env.buildings):
+            assert np.array_equal(b.electrical_storage.capacity_history, r.electrical_storage.capacity_history)
+            assert np.array_equal(b.electrical_storage.efficiency_history, r.electrical_storage.efficiency_history)
+
+        cost_functions = env.evaluate()
+        reference_cost_functions = reference_env.evaluate()
+        assert cost_functions[['cost_function', 'name']].equals(reference_cost_functions[['cost_function', 'name']])
+        assert is_equal(cost_functions['value'].values, reference_cost_functions['value'].values), 'Cost functions differ.'
+        print(f'District state dispatch matches per-building dispatch on schema: "{schema}", '\
+            f'vectorized buildings: {int(env.district_state.vectorizable.sum())}/{len(env.buildings)}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
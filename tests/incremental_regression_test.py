@@ -0,0 +1,62 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from citylearn.rl import IncrementalLinearRegression, RegressionBuffer
+
+CAPACITY = 200
+SAMPLE_COUNT = 2000
+FEATURE_COUNT = 8
+CHECK_INTERVAL = 97
+# variable offset relative to a unit spread and tolerance on predictions
+OFFSETS = [
+    (0.0, 1e-9),
+    (100.0, 1e-8),
+    (10000.0, 1e-6),
+]
+RANDOM_SEED = 0
+
+def main():
+    # fit over a sliding regression buffer window must match sklearn fitted on the buffer
+    for offset, tolerance in OFFSETS:
+        random_state = np.random.RandomState(RANDOM_SEED)
+        weights = random_state.normal(size=FEATURE_COUNT)
+        buffer = RegressionBuffer(CAPACITY)
+        model = IncrementalLinearRegression()
+        checks = 0
+
+        for i in range(SAMPLE_COUNT):
+            variables = random_state.uniform(0.0, 1.0, FEATURE_COUNT) + offset
+            target = variables @ weights + random_state.normal(scale=0.1)
+
+            if len(buffer) == buffer.capacity:
+                model.forget(buffer.x[buffer.position:buffer.position + 1], buffer.y[buffer.position:buffer.position + 1])
+
+            else:
+                pass
+
+            model.partial_fit(variables.reshape(1, -1), [target])
+            buffer.push(variables, target)
+
+            if i > FEATURE_COUNT and i%CHECK_INTERVAL == 0:
+                reference = LinearRegression().fit(buffer.x, buffer.y)
+                x = random_state.uniform(0.0, 1.0, (50, FEATURE_COUNT)) + offset
+                assert np.allclose(model.predict(x), reference.predict(x), rtol=tolerance, atol=tolerance),\
+                    f'Predictions differ at sample: {i}, offset: {offset}'
+                checks += 1
+
+        print(f'Incremental regression matches sklearn over a {CAPACITY} sample window with offset: {offset}, checks: {checks}')
+
+    # forgetting every sample resets the fit
+    model = IncrementalLinearRegression()
+    x = np.random.RandomState(RANDOM_SEED).uniform(size=(10, FEATURE_COUNT))
+    y = x.sum(axis=1)
+    model.partial_fit(x, y).forget(x, y)
+    assert np.array_equal(model.predict(x), np.zeros(10))
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
@@ -0,0 +1,80 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.citylearn import CityLearnEnv, EvaluationCondition
+from citylearn.data import EnergySimulation
+
+SCHEMAS = [
+    'baeda_3dem',
+    'citylearn_challenge_2022_phase_all',
+    'citylearn_challenge_2023_phase_2_local_evaluation',
+]
+CONDITIONS = [
+    (EvaluationCondition.WITH_STORAGE_AND_PV, EvaluationCondition.WITHOUT_STORAGE_BUT_WITH_PV),
+    (EvaluationCondition.WITH_STORAGE_AND_PV, EvaluationCondition.WITHOUT_STORAGE_AND_PV),
+    (EvaluationCondition.WITH_STORAGE_AND_PARTIAL_LOAD_AND_PV, EvaluationCondition.WITHOUT_STORAGE_AND_PARTIAL_LOAD_BUT_WITH_PV),
+]
+TIME_STEPS = 720
+EVALUATION_INTERVAL = 168
+RANDOM_SEED = 0
+TOLERANCE = 1e-6
+
+def assert_cost_functions_equal(values: list, reference_values: list, description: str):
+    # undefined cost functions are None
+    values = {v['cost_function']: np.nan if v['value'] is None else v['value'] for v in values}
+    reference_values = {v['cost_function']: np.nan if v['value'] is None else v['value'] for v in reference_values}
+    assert values.keys() == reference_values.keys(), f'Cost functions differ: {description}'
+
+    for k, v in reference_values.items():
+        assert np.isclose(values[k], v, rtol=TOLERANCE, atol=TOLERANCE, equal_nan=True),\
+            f'Cost function: {k} differs: {values[k]} vs {v}, {description}'
+
+def main():
+    # streamed KPI tracker cost functions must match the cost functions calculated from the time series history
+    for schema in SCHEMAS:
+        schema_name = schema
+        schema = CityLearnEnv._parse_schema(schema)
+        simulation_end_time_step = min(schema['simulation_end_time_step'], schema['simulation_start_time_step'] + TIME_STEPS - 1)
+        env = CityLearnEnv(schema, random_seed=RANDOM_SEED, simulation_end_time_step=simulation_end_time_step)
+        env.reset()
+        random_state = np.random.default_rng(RANDOM_SEED)
+        comfort_band = EnergySimulation.DEFUALT_COMFORT_BAND
+        evaluations = 0
+
+        while not env.terminated:
+            env.step([random_state.uniform(s.low, s.high).tolist() for s in env.action_space])
+
+            if env.time_step % EVALUATION_INTERVAL != 0 and not env.terminated:
+                continue
+
+            else:
+                pass
+
+            for control_condition, baseline_condition in CONDITIONS:
+                if not env.kpi_tracker.is_available(env.time_step, control_condition.value, baseline_condition.value, comfort_band=comfort_band):
+                    continue
+
+                else:
+                    pass
+
+                description = f'schema: "{schema_name}", time step: {env.time_step}, conditions: {control_condition.name}, {baseline_condition.name}'
+                building_cost_functions = env.kpi_tracker.get_building_cost_functions(control_condition.value, baseline_condition.value, comfort_band)
+
+                for b, c in zip(env.buildings, building_cost_functions):
+                    reference = env._get_building_cost_functions(b, control_condition, baseline_condition, comfort_band)
+                    assert_cost_functions_equal(c, reference, f'{description}, building: {b.name}')
+
+                district_cost_functions = env.kpi_tracker.get_district_cost_functions(control_condition.value, baseline_condition.value, env.time_steps)
+                reference = env._get_district_cost_functions(control_condition, baseline_condition)
+                assert_cost_functions_equal(district_cost_functions, reference, description)
+                evaluations += 1
+
+        assert evaluations > 0, f'KPI tracker was not available on schema: "{schema_name}"'
+        print(f'KPI tracker matches time series cost functions on schema: "{schema_name}", evaluations: {evaluations}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
@@ -0,0 +1,46 @@
+import itertools
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.wrappers import MixedRadixEncoder
+
+RADICES = [
+    [1],
+    [7],
+    [2, 3],
+    [3, 1, 4],
+    [5, 2, 1, 3, 2],
+    [11, 11, 11],
+]
+RANDOM_SEED = 0
+
+def main():
+    # indices must follow itertools.product order, as the combinations lists that indexed existing Q-tables did
+    for radices in RADICES:
+        encoder = MixedRadixEncoder(radices)
+        combinations = list(itertools.product(*[range(r) for r in radices]))
+        assert encoder.size == len(combinations), f'Size differs for radices: {radices}'
+
+        for i, c in enumerate(combinations):
+            assert encoder.encode(c) == i, f'Encoded index of {c} differs for radices: {radices}'
+            assert encoder.decode(i) == list(c), f'Decoded values of {i} differ for radices: {radices}'
+
+        print(f'Mixed-radix encoder matches itertools.product order for radices: {radices}')
+
+    # large spaces round trip without materializing the combinations
+    random_state = np.random.RandomState(RANDOM_SEED)
+    radices = random_state.randint(1, 12, 30).tolist()
+    encoder = MixedRadixEncoder(radices)
+
+    for _ in range(1000):
+        values = [int(random_state.randint(0, r)) for r in radices]
+        assert encoder.decode(encoder.encode(values)) == values
+
+    print(f'Mixed-radix encoder round trips values for {len(radices)} digits with size: {encoder.size}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
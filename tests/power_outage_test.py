@@ -0,0 +1,101 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.power_outage import ReliabilityMetricsPowerOutage
+
+# (time steps, seconds per time step, model keyword arguments)
+CASES = [
+    (8760, 3600.0, {}),
+    (8760, 3600.0, {'saifi': 60.0, 'caidi': 600.0}),
+    (8760, 3600.0, {'saifi': 200.0, 'caidi': 3000.0, 'start_time_steps': [15, 16, 17, 18]}),
+    (720, 3600.0, {'saifi': 365.0, 'caidi': 2000.0}),
+    (96*30, 900.0, {'saifi': 100.0, 'caidi': 400.0}),
+]
+SEEDS = list(range(40))
+COUNT = 7
+
+def get_loop_signals(model: ReliabilityMetricsPowerOutage, time_steps: int, seconds_per_time_step: float) -> np.ndarray:
+    """Returns signals from the loop implementation that :py:meth:`citylearn.power_outage.ReliabilityMetricsPowerOutage.get_signals` replaced."""
+
+    nprs = np.random.RandomState(model.random_seed)
+    days_per_year = 365.0
+    seconds_per_day = 86400.0
+    seconds_per_minute = 60.0
+    time_steps_per_day = seconds_per_day/seconds_per_time_step
+    time_steps_per_minute = seconds_per_minute/seconds_per_time_step
+    day_count = time_steps/time_steps_per_day
+    daily_outage_probability = model.saifi/days_per_year
+    outage_days = nprs.binomial(n=1, p=daily_outage_probability, size=int(day_count))
+    outage_day_ixs = outage_days*np.arange(day_count)
+    outage_day_ixs = outage_day_ixs[outage_day_ixs != 0]
+    outage_day_count = outage_days[outage_days == 1].shape[0]
+    start_time_steps = list(range(int(time_steps_per_day))) if model.start_time_steps is None else model.start_time_steps
+    outage_start_time_steps = nprs.choice(start_time_steps, size=outage_day_count)
+    outage_durations = nprs.exponential(scale=model.caidi, size=outage_day_count) # [mins]
+    outage_duration_time_steps = outage_durations*time_steps_per_minute
+    signals = np.zeros(time_steps, dtype=int)
+
+    for i, j , k in zip(outage_day_ixs, outage_start_time_steps, outage_duration_time_steps):
+        start_ix = i*time_steps_per_day + j
+        end_ix = start_ix + k
+        start_ix = int(start_ix)
+        end_ix = int(end_ix)
+        signals[start_ix:end_ix] = 1
+
+    return signals
+
+def get_loop_count_signals(model: ReliabilityMetricsPowerOutage, time_steps: int, seconds_per_time_step: float, count: int) -> np.ndarray:
+    """Returns `count` signals from the loop implementation applied to each signal's block of the batched samples."""
+
+    nprs = np.random.RandomState(model.random_seed)
+    time_steps_per_day = 86400.0/seconds_per_time_step
+    day_count = int(time_steps/time_steps_per_day)
+    outage_days = nprs.binomial(n=1, p=model.saifi/365.0, size=(count, day_count))
+    start_time_steps = list(range(int(time_steps_per_day))) if model.start_time_steps is None else model.start_time_steps
+    outage_start_time_steps = nprs.choice(start_time_steps, size=int(outage_days.sum()))
+    outage_duration_time_steps = nprs.exponential(scale=model.caidi, size=int(outage_days.sum()))*60.0/seconds_per_time_step
+    signals = np.zeros((count, time_steps), dtype=int)
+    event_ix = 0
+
+    for signal, days in zip(signals, outage_days):
+        outage_day_ixs = np.nonzero(days)[0]
+        outage_day_ixs = outage_day_ixs[outage_day_ixs != 0]
+        block_start_time_steps = outage_start_time_steps[event_ix:event_ix + days.sum()]
+        block_duration_time_steps = outage_duration_time_steps[event_ix:event_ix + days.sum()]
+        event_ix += days.sum()
+
+        for i, j, k in zip(outage_day_ixs, block_start_time_steps, block_duration_time_steps):
+            start_ix = i*time_steps_per_day + j
+            signal[int(start_ix):int(start_ix + k)] = 1
+
+    return signals
+
+def main():
+    # vectorized signals must match the loop implementation for the same seed
+    for time_steps, seconds_per_time_step, kwargs in CASES:
+        outages = 0
+
+        for seed in SEEDS:
+            model = ReliabilityMetricsPowerOutage(random_seed=seed, **kwargs)
+            signals = model.get_signals(time_steps, seconds_per_time_step)
+            reference = get_loop_signals(model, time_steps, seconds_per_time_step)
+            assert signals.shape == (time_steps,) and signals.dtype == reference.dtype
+            assert np.array_equal(signals, reference), f'Signals differ for seed: {seed}, case: {kwargs}'
+            outages += int(signals.sum())
+
+            # count signals are returned as a 2-D array and each signal uses its own block of samples
+            count_signals = model.get_signals(time_steps, seconds_per_time_step, count=COUNT)
+            assert count_signals.shape == (COUNT, time_steps), f'Shape differs: {count_signals.shape}'
+            assert np.array_equal(count_signals, get_loop_count_signals(model, time_steps, seconds_per_time_step, COUNT)),\
+                f'Count signals differ for seed: {seed}, case: {kwargs}'
+            assert model.get_signals(time_steps, seconds_per_time_step, count=1).shape == (1, time_steps)
+
+        print(f'Power outage signals match loop implementation for {len(SEEDS)} seeds, time steps: {time_steps}, '\
+            f'case: {kwargs}, outage time steps: {outages}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
@@ -0,0 +1,124 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from sklearn.decomposition import PCA
+import torch
+from citylearn.rl import ReplayBuffer
+
+CAPACITY = 50
+TRANSITION_COUNT = 137
+STATE_DIMENSION = 12
+ACTION_DIMENSION = 3
+PCA_COMPONENTS = 5
+BATCH_SIZE = 64
+RANDOM_SEED = 0
+
+def get_transitions(random_state: np.random.RandomState, count: int, state_dimension: int) -> list:
+    return [(
+        random_state.normal(size=state_dimension).astype('float32'),
+        random_state.uniform(-1.0, 1.0, ACTION_DIMENSION).astype('float32'),
+        np.float32(random_state.normal()),
+        random_state.normal(size=state_dimension).astype('float32'),
+        float(random_state.randint(0, 2)),
+    ) for _ in range(count)]
+
+def assert_buffer_equal(buffer: ReplayBuffer, transitions: list, description: str):
+    assert len(buffer) == len(transitions), f'Length differs: {description}'
+
+    for i, (t, r) in enumerate(zip(buffer.buffer, transitions)):
+        assert all(np.array_equal(t_, r_) for t_, r_ in zip(t, r)), f'Transition: {i} differs: {description}'
+
+def main():
+    random_state = np.random.RandomState(RANDOM_SEED)
+    transitions = get_transitions(random_state, TRANSITION_COUNT, STATE_DIMENSION)
+
+    # ring must wrap around like the list buffer it replaced with transitions kept in storage order
+    buffer = ReplayBuffer(CAPACITY, random_seed=RANDOM_SEED)
+    reference = []
+    position = 0
+
+    for i, t in enumerate(transitions):
+        buffer.push(*t)
+
+        if len(reference) < CAPACITY:
+            reference.append(None)
+
+        else:
+            pass
+
+        reference[position] = t
+        position = (position + 1) % CAPACITY
+        assert buffer.position == position, f'Position differs after push: {i}'
+
+        if i in [0, CAPACITY - 1, CAPACITY, TRANSITION_COUNT - 1]:
+            assert_buffer_equal(buffer, reference, f'after push: {i}')
+
+        else:
+            pass
+
+    print(f'Replay buffer wraps around after {TRANSITION_COUNT} pushes with capacity: {CAPACITY}')
+
+    # sampled tensors are float32 on device with reward and done of shape (batch_size, 1) and every sampled row
+    # is a stored transition
+    states, actions, rewards, next_states, dones = buffer.sample_tensors(BATCH_SIZE)
+    expected_shapes = [
+        (BATCH_SIZE, STATE_DIMENSION), (BATCH_SIZE, ACTION_DIMENSION), (BATCH_SIZE, 1), (BATCH_SIZE, STATE_DIMENSION), (BATCH_SIZE, 1)
+    ]
+
+    for k, v, s in zip(['state', 'action', 'reward', 'next_state', 'done'], [states, actions, rewards, next_states, dones], expected_shapes):
+        assert isinstance(v, torch.Tensor) and v.dtype == torch.float32 and v.device.type == 'cpu', f'{k} tensor type differs.'
+        assert tuple(v.shape) == s and v.is_contiguous(), f'{k} shape differs: {tuple(v.shape)} vs {s}'
+
+    rows = {buffer.state[i].tobytes(): i for i in range(len(buffer))}
+
+    for s, a, r, n, d in zip(states.numpy(), actions.numpy(), rewards.numpy(), next_states.numpy(), dones.numpy()):
+        i = rows[s.tobytes()]
+        assert np.array_equal(a, buffer.action[i]) and r[0] == buffer.reward[i]\
+            and np.array_equal(n, buffer.next_state[i]) and d[0] == buffer.done[i], 'Sampled transition is not stored.'
+
+    # sampling is reproducible from the seed, is with replacement and batches may exceed the stored size
+    other_buffer = ReplayBuffer(CAPACITY, random_seed=RANDOM_SEED)
+
+    for t in transitions:
+        other_buffer.push(*t)
+
+    other_buffer.sample_tensors(BATCH_SIZE)
+    sample = buffer.sample(CAPACITY*2)
+    other_sample = other_buffer.sample(CAPACITY*2)
+    assert all(np.array_equal(s, o) for s, o in zip(sample, other_sample)), 'Seeded samples differ.'
+    assert all(v.shape[0] == CAPACITY*2 and v.dtype == np.float32 for v in sample)
+    print(f'Replay buffer samples {BATCH_SIZE} transitions as float32 tensors with shapes: {expected_shapes}')
+
+    # transform that compresses observations with PCA changes the state dimension and keeps actions and done flags
+    pca = PCA(n_components=PCA_COMPONENTS).fit(buffer.state)
+    action, done = buffer.action.copy(), buffer.done.copy()
+    expected_state = pca.transform(buffer.state).astype('float32')
+    expected_next_state = pca.transform(buffer.next_state).astype('float32')
+    expected_reward = buffer.reward*2.0
+    buffer.transform(state_function=pca.transform, reward_function=lambda x: x*2.0)
+    assert buffer.state.shape == (CAPACITY, PCA_COMPONENTS) and buffer.next_state.shape == (CAPACITY, PCA_COMPONENTS)
+    assert np.array_equal(buffer.state, expected_state) and np.array_equal(buffer.next_state, expected_next_state)
+    assert np.array_equal(buffer.reward, expected_reward)
+    assert np.array_equal(buffer.action, action) and np.array_equal(buffer.done, done)
+    assert buffer.position == TRANSITION_COUNT%CAPACITY
+
+    # transformed buffer keeps wrapping around with transitions of the new dimension
+    reference = buffer.buffer
+    position = buffer.position
+
+    for t in get_transitions(random_state, CAPACITY + 3, PCA_COMPONENTS):
+        buffer.push(*t)
+        reference[position] = t
+        position = (position + 1) % CAPACITY
+
+    assert_buffer_equal(buffer, reference, 'after transform')
+    states, *_ = buffer.sample_tensors(BATCH_SIZE)
+    assert tuple(states.shape) == (BATCH_SIZE, PCA_COMPONENTS)
+    print(f'Replay buffer transforms state dimension from {STATE_DIMENSION} to {PCA_COMPONENTS}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
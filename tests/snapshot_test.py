@@ -0,0 +1,104 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.citylearn import CityLearnEnv
+
+SCHEMAS = [
+    'citylearn_challenge_2022_phase_all',
+    'citylearn_challenge_2023_phase_2_local_evaluation',
+]
+TIME_STEPS = 384
+SNAPSHOT_TIME_STEP = 100
+ROLLOUT_TIME_STEPS = 150
+RANDOM_SEED = 0
+
+def rollout(env: CityLearnEnv, actions: list) -> tuple:
+    """Step `env` with `actions` and return the observations, rewards and cost functions."""
+
+    observations = []
+    rewards = []
+
+    for a in actions:
+        o, r, *_ = env.step(a)
+        observations.append(o)
+        rewards.append(r)
+
+    return observations, rewards, env.evaluate()
+
+def assert_rollouts_equal(rollout_1: tuple, rollout_2: tuple, description: str):
+    observations_1, rewards_1, cost_functions_1 = rollout_1
+    observations_2, rewards_2, cost_functions_2 = rollout_2
+
+    for i, (o1, o2, r1, r2) in enumerate(zip(observations_1, observations_2, rewards_1, rewards_2)):
+        assert all(np.array_equal(o1_, o2_, equal_nan=True) for o1_, o2_ in zip(o1, o2)), f'Observations differ at step: {i}, {description}'
+        assert np.array_equal(r1, r2, equal_nan=True), f'Rewards differ at step: {i}, {description}'
+
+    assert cost_functions_1.equals(cost_functions_2), f'Cost functions differ, {description}'
+
+def main():
+    # rollouts from a restored snapshot must match the rollout from the state the snapshot was captured at
+    for schema in SCHEMAS:
+        schema_name = schema
+        schema = CityLearnEnv._parse_schema(schema)
+        simulation_end_time_step = min(schema['simulation_end_time_step'], schema['simulation_start_time_step'] + TIME_STEPS - 1)
+        env = CityLearnEnv(schema, random_seed=RANDOM_SEED, simulation_end_time_step=simulation_end_time_step)
+        env.reset()
+        random_state = np.random.default_rng(RANDOM_SEED)
+        actions = [[random_state.uniform(s.low, s.high).tolist() for s in env.action_space] for _ in range(env.time_steps)]
+        rollout(env, actions[0:SNAPSHOT_TIME_STEP])
+
+        start_time = time.time()
+        snapshot = env.snapshot()
+        snapshot_runtime = time.time() - start_time
+        time_step = env.time_step
+        reference = rollout(env, actions[SNAPSHOT_TIME_STEP:SNAPSHOT_TIME_STEP + ROLLOUT_TIME_STEPS])
+
+        # restore more than once
+        for i in range(2):
+            start_time = time.time()
+            env.restore(snapshot)
+            restore_runtime = time.time() - start_time
+            assert env.time_step == time_step
+            assert_rollouts_equal(
+                reference, rollout(env, actions[SNAPSHOT_TIME_STEP:SNAPSHOT_TIME_STEP + ROLLOUT_TIME_STEPS]),
+                f'schema: "{schema_name}", restore: {i}'
+            )
+
+        # restore after reset
+        env.reset()
+        rollout(env, actions[0:SNAPSHOT_TIME_STEP//2])
+        env.restore(snapshot)
+        assert_rollouts_equal(
+            reference, rollout(env, actions[SNAPSHOT_TIME_STEP:SNAPSHOT_TIME_STEP + ROLLOUT_TIME_STEPS]),
+            f'schema: "{schema_name}", restore after reset'
+        )
+
+        # fork rollout must match while the original environment is stepped with other actions
+        env.restore(snapshot)
+        start_time = time.time()
+        fork = env.fork()
+        fork_runtime = time.time() - start_time
+        fork_observations = []
+        fork_rewards = []
+
+        for a in actions[SNAPSHOT_TIME_STEP:SNAPSHOT_TIME_STEP + ROLLOUT_TIME_STEPS]:
+            env.step([[0.0]*len(a_) for a_ in a])
+            o, r, *_ = fork.step(a)
+            fork_observations.append(o)
+            fork_rewards.append(r)
+
+        assert_rollouts_equal(reference, (fork_observations, fork_rewards, fork.evaluate()), f'schema: "{schema_name}", fork')
+        assert all(not np.shares_memory(b.energy_simulation.cooling_demand, f.energy_simulation.cooling_demand)\
+            and b.weather.outdoor_dry_bulb_temperature.base is f.weather.outdoor_dry_bulb_temperature.base\
+                for b, f in zip(env.buildings, fork.buildings)), 'Fork must copy control time series and share static data.'
+
+        print(f'Snapshot restore and fork match rollout on schema: "{schema_name}", '\
+            f'snapshot runtime: {snapshot_runtime*1000.0:.2f} ms, restore runtime: {restore_runtime*1000.0:.2f} ms, '\
+                f'fork runtime: {fork_runtime*1000.0:.2f} ms')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)
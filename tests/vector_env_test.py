@@ -0,0 +1,61 @@
+import time
+import sys
+sys.path.insert(0, '..')
+import numpy as np
+from citylearn.citylearn import CityLearnEnv
+from citylearn.vector_env import CityLearnAsyncVectorEnv, CityLearnVectorEnv
+
+SCHEMAS = [
+    'citylearn_challenge_2022_phase_all',
+    'citylearn_challenge_2023_phase_2_local_evaluation',
+]
+NUM_ENVS = 3
+EPISODE_TIME_STEPS = 48
+EPISODES = 2
+RANDOM_SEED = 0
+
+def main():
+    # sync and async vector environments must return the same observations and rewards for the same seeds and
+    # float32 actions, including the steps where terminated copies are reset following AutoresetMode.NEXT_STEP
+    for schema in SCHEMAS:
+        schema_name = schema
+        schema = CityLearnEnv._parse_schema(schema)
+        kwargs = {
+            'simulation_end_time_step': schema['simulation_start_time_step'] + EPISODE_TIME_STEPS - 1,
+            'env_kwargs': [{'random_seed': RANDOM_SEED + i} for i in range(NUM_ENVS)],
+        }
+        env = CityLearnVectorEnv(schema, **kwargs)
+        async_env = CityLearnAsyncVectorEnv(schema, **kwargs)
+
+        try:
+            observations, _ = env.reset(seed=RANDOM_SEED)
+            async_observations, _ = async_env.reset(seed=RANDOM_SEED)
+            assert np.array_equal(observations, async_observations, equal_nan=True), 'Reset observations differ.'
+            random_state = np.random.default_rng(RANDOM_SEED)
+            autoresets = 0
+
+            # an episode is EPISODE_TIME_STEPS - 1 steps long and the next step resets
+            for i in range(EPISODES*EPISODE_TIME_STEPS):
+                actions = random_state.uniform(env.action_space.low, env.action_space.high).astype('float32')
+                observations, rewards, terminations, truncations, _ = env.step(actions)
+                async_observations, async_rewards, async_terminations, async_truncations, _ = async_env.step(actions)
+                assert np.array_equal(observations, async_observations, equal_nan=True), f'Observations differ at step: {i}'
+                assert np.array_equal(rewards, async_rewards), f'Rewards differ at step: {i}'
+                assert np.array_equal(terminations, async_terminations), f'Terminations differ at step: {i}'
+                assert np.array_equal(truncations, async_truncations), f'Truncations differ at step: {i}'
+                autoresets += int(terminations.any())
+
+            assert autoresets >= EPISODES - 1, f'Episodes did not terminate on schema: "{schema_name}"'
+            assert env.call('time_step') == async_env.call('time_step'), 'Time steps differ.'
+
+        finally:
+            env.close()
+            async_env.close()
+
+        print(f'Sync and async vector environments match on schema: "{schema_name}", copies: {NUM_ENVS}, autoresets: {autoresets}')
+
+if __name__ == '__main__':
+    start_time = time.time()
+    main()
+    runtime = time.time() - start_time
+    print('runtime:', runtime)